@@ -1,18 +1,47 @@
 from flask import Flask
-from config import Config
-from extensions import db
+from config import Config, DEV_SECRET_KEY
+from extensions import db, migrate
+from utils.sql_counter import init_sql_counter
+from utils.metrics import init_metrics
+from utils.query_profiler import init_query_profiler
+from utils.dashboard_stats import init_dashboard_stats
+from utils.table_versions import init_table_versions
+from utils.revenue import init_revenue_rollups
+from utils.status_history import init_status_history
+from utils.jobs import init_jobs
+from utils.invoice_documents import init_invoice_documents
+from utils.login_security import init_login_security
+from utils.db_pool import init_pool_metrics
+from utils.json_provider import FastJSONProvider
 import logging
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)s | %(name)s | %(message)s"
 )
+logger = logging.getLogger(__name__)
 
 def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
+    if not app.config["SECRET_KEY"]:
+        logger.warning("SECRET_KEY is not set; using the insecure development key")
+        app.config["SECRET_KEY"] = DEV_SECRET_KEY
+    app.json = FastJSONProvider(app)
 
     db.init_app(app)
+    migrate.init_app(app, db)
+    init_pool_metrics(app)
+    init_sql_counter(app)
+    init_metrics(app)
+    init_query_profiler(app)
+    init_dashboard_stats(app)
+    init_table_versions(app)
+    init_revenue_rollups(app)
+    init_status_history(app)
+    init_jobs(app)
+    init_invoice_documents(app)
+    init_login_security(app)
 
     # 🔴 REGISTER BLUEPRINTS
     from routes.auth_routes import auth_bp
@@ -21,6 +50,11 @@ def create_app():
     from routes.vehicle_routes import vehicle_bp
     from routes.invoice_routes import invoice_bp
     from routes.mechanic_routes import mechanic_bp
+    from routes.search_routes import search_bp
+    from routes.lookup_routes import lookup_bp
+    from routes.report_routes import report_bp
+    from routes.job_routes import job_bp
+    from routes.metrics_routes import metrics_bp
     from routes.ui_routes import ui
 
     app.register_blueprint(auth_bp)
@@ -29,16 +63,16 @@ def create_app():
     app.register_blueprint(vehicle_bp)
     app.register_blueprint(invoice_bp)
     app.register_blueprint(mechanic_bp)
+    app.register_blueprint(search_bp)
+    app.register_blueprint(lookup_bp)
+    app.register_blueprint(report_bp)
+    app.register_blueprint(job_bp)
+    app.register_blueprint(metrics_bp)
     app.register_blueprint(ui)
 
 
     return app
 
-app = create_app()
-app.secret_key = "dev-secret-key"
-
 if __name__ == "__main__":
-    app.run(debug=True)
-
-
-
+    # development server only; production runs wsgi.py under gunicorn
+    create_app().run(debug=True)
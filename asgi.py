@@ -0,0 +1,112 @@
+"""Async deployment entry point.
+
+    uvicorn asgi:app --workers 4
+
+The read-heavy GET endpoints listed in utils/async_reads.py are served
+natively on an async SQLAlchemy engine, so a request waiting on the
+database holds no thread. Every other request (writes, the UI, auth,
+reports) goes to the unchanged Flask app through a WSGI adapter.
+
+Needs the optional async packages: asgiref, greenlet and asyncpg
+(Postgres) or aiosqlite (SQLite), plus an ASGI server such as uvicorn.
+"""
+import time
+from urllib.parse import parse_qsl
+
+from asgiref.wsgi import WsgiToAsgi
+from werkzeug.datastructures import MultiDict
+from werkzeug.http import is_resource_modified, quote_etag
+
+from app import create_app
+from config import DEV_SECRET_KEY
+from utils.async_db import async_session_factory, create_async_db_engine
+from utils.async_reads import get_versions_async, match_read_route, count_sql, start_sql_stats
+from utils.conditional import versions_etag
+from utils.metrics import request_metrics
+from utils.query_profiler import profile_engine
+
+flask_app = create_app()
+if flask_app.config["SECRET_KEY"] == DEV_SECRET_KEY:
+    raise RuntimeError("Set SECRET_KEY before serving the app with asgi.py")
+
+engine = create_async_db_engine(flask_app)
+Session = async_session_factory(engine)
+count_sql(engine)
+if flask_app.config["SLOW_QUERY_MS"]:
+    profile_engine(engine.sync_engine)
+
+wsgi_app = WsgiToAsgi(flask_app)
+
+
+# ---------------------------
+# ASYNC READS
+# ---------------------------
+async def _serve_read(scope, send, endpoint, table, handler, params):
+    started = time.perf_counter()
+    sql = start_sql_stats()
+
+    headers = {
+        name.decode("latin-1"): value.decode("latin-1")
+        for name, value in scope["headers"]
+    }
+    query_string = scope["query_string"].decode("latin-1")
+    args = MultiDict(parse_qsl(query_string, keep_blank_values=True))
+
+    async with Session() as session:
+        versions = await get_versions_async(session, table)
+        etag = versions_etag(f"{scope['path']}?{query_string}", (table,), versions)
+        # the same If-None-Match rule as conditional_get
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "HTTP_IF_NONE_MATCH": headers.get("if-none-match", ""),
+        }
+        if not is_resource_modified(environ, etag=etag):
+            status, body = 304, None
+        else:
+            status, body = await handler(session, args, **params)
+
+    response_headers = []
+    payload = b""
+    if body is not None:
+        payload = flask_app.json.dumps(body).encode() + b"\n"
+        response_headers.append((b"content-type", b"application/json"))
+    if status in (200, 304):
+        response_headers.append((b"etag", quote_etag(etag).encode()))
+        response_headers.append((b"cache-control", b"private, no-cache"))
+    response_headers.append((b"content-length", str(len(payload)).encode()))
+
+    await send({"type": "http.response.start", "status": status, "headers": response_headers})
+    await send({"type": "http.response.body", "body": payload})
+
+    request_metrics.record(
+        endpoint, "GET", status, time.perf_counter() - started, sql[0], sql[1]
+    )
+
+
+# ---------------------------
+# LIFESPAN
+# ---------------------------
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await engine.dispose()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+# ---------------------------
+# DISPATCH
+# ---------------------------
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        return await _lifespan(receive, send)
+
+    if scope["type"] == "http" and scope["method"] == "GET":
+        route = match_read_route(scope["path"])
+        if route is not None:
+            return await _serve_read(scope, send, *route)
+
+    await wsgi_app(scope, receive, send)
@@ -0,0 +1,169 @@
+"""Before/after benchmark for the hot-column indexes.
+
+Seeds a dataset, drops every secondary index declared on the models,
+times the app's hot queries, recreates the indexes and times them again.
+
+    python -m benchmarks.indexes --customers 20000 --output bench_output.txt
+
+Defaults to a throwaway SQLite file; pass --database-url to point it at
+an empty Postgres database instead.
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import make_url
+
+from benchmarks.seed import create_benchmark_app, seed_dataset
+
+
+def hot_queries():
+    from models.customer import Customer
+    from models.vehicle import Vehicle
+    from models.mechanic import Mechanic
+    from models.service_request import ServiceRequest
+    from models.invoice import Invoice
+    from utils.dashboard_stats import stats_statement
+
+    return {
+        # ui.dashboard
+        "dashboard_counts": stats_statement(),
+        # create_invoice duplicate check
+        "duplicate_invoice_check": select(Invoice.id).where(Invoice.service_id == 4242).limit(1),
+        # ui.customers_delete pre-check
+        "customer_delete_precheck": select(Vehicle.id).where(Vehicle.customer_id == 777).limit(1),
+        # mechanic workload
+        "services_by_mechanic": select(ServiceRequest.id).where(
+            ServiceRequest.assigned_mechanic_id == 7,
+            ServiceRequest.status != "Completed"
+        ),
+        # services_create mechanic picker
+        "available_mechanics": select(Mechanic.id, Mechanic.name).where(
+            Mechanic.is_available == True  # noqa: E712
+        ),
+        "unpaid_invoice_count": select(func.count()).select_from(Invoice).where(
+            Invoice.payment_status == "Pending"
+        ),
+        # GET /services first page
+        "services_first_page": select(ServiceRequest.id).order_by(
+            ServiceRequest.created_at, ServiceRequest.id
+        ).limit(51),
+        "customer_first_page": select(Customer.id).order_by(
+            Customer.created_at, Customer.id
+        ).limit(51),
+    }
+
+
+def _time(db, stmt, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        db.session.execute(stmt).all()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def _plan(db, stmt):
+    dialect = db.engine.dialect
+    sql = str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    prefix = "EXPLAIN QUERY PLAN " if dialect.name == "sqlite" else "EXPLAIN "
+    rows = db.session.execute(text(prefix + sql)).all()
+    return [str(row[-1]) for row in rows]
+
+
+def _secondary_indexes(db):
+    return [index for table in db.metadata.sorted_tables for index in table.indexes]
+
+
+def run(database_url, repeat, **dataset):
+    from extensions import db
+
+    app = create_benchmark_app(database_url)
+    with app.app_context():
+        db.create_all()
+        counts = seed_dataset(db, **dataset)
+        indexes = _secondary_indexes(db)
+        queries = hot_queries()
+
+        # end the session's transaction so DDL neither blocks on it nor
+        # leaves it reading a stale schema snapshot
+        db.session.remove()
+        with db.engine.begin() as conn:
+            for index in indexes:
+                index.drop(conn)
+            conn.execute(text("ANALYZE"))
+
+        before = {
+            name: {"ms": _time(db, stmt, repeat), "plan": _plan(db, stmt)}
+            for name, stmt in queries.items()
+        }
+
+        db.session.remove()
+        with db.engine.begin() as conn:
+            for index in indexes:
+                index.create(conn)
+            conn.execute(text("ANALYZE"))
+
+        after = {
+            name: {"ms": _time(db, stmt, repeat), "plan": _plan(db, stmt)}
+            for name, stmt in queries.items()
+        }
+
+        db.session.remove()
+        db.drop_all()
+
+    return {
+        "database": make_url(database_url).get_backend_name(),
+        "dataset": counts,
+        "repeat": repeat,
+        "queries": {
+            name: {
+                "before_ms": before[name]["ms"],
+                "after_ms": after[name]["ms"],
+                "speedup": round(before[name]["ms"] / max(after[name]["ms"], 1e-6), 1),
+                "plan_before": before[name]["plan"],
+                "plan_after": after[name]["plan"],
+            }
+            for name in queries
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url")
+    parser.add_argument("--customers", type=int, default=20000)
+    parser.add_argument("--mechanics", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=25)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    database_url, scratch = args.database_url, None
+    if not database_url:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False).name
+        database_url = f"sqlite:///{scratch}"
+
+    try:
+        report = run(
+            database_url,
+            args.repeat,
+            customers=args.customers,
+            mechanics=args.mechanics
+        )
+    finally:
+        if scratch:
+            os.remove(scratch)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
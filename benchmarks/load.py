@@ -0,0 +1,336 @@
+"""Load and latency benchmark for every blueprint.
+
+Seeds a dataset through create_app, then drives each scenario with
+two drivers:
+
+- ``test_client``: Flask's in-process client, sequential, which isolates
+  view + SQL cost from the network stack.
+- ``http``: a threaded werkzeug server driven by concurrent keep-alive
+  HTTP connections, which exercises the WSGI path under contention.
+
+    python -m benchmarks.load --customers 500 --requests 200 --concurrency 8 \\
+        --output bench_output.txt
+
+Results are written as JSON: p50/p95/p99 latency, requests per second and
+SQL queries per request for every endpoint and driver.
+"""
+import argparse
+import http.client
+import itertools
+import json
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from werkzeug.serving import make_server
+
+from benchmarks.seed import create_benchmark_app, seed_dataset
+
+BENCH_EMAIL = "bench@example.com"
+BENCH_USERNAME = "bench"
+BENCH_PASSWORD = "bench"
+
+
+# ---------------------------
+# SQL QUERY COUNTER
+# ---------------------------
+class QueryCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        with self._lock:
+            self.count += 1
+
+
+# ---------------------------
+# SCENARIOS
+# ---------------------------
+def build_scenarios(counts, seed=7):
+    """Return ``(name, method, path_factory, body_factory)`` tuples.
+
+    Factories are called per request so single-resource endpoints hit a
+    spread of rows instead of one cached page.
+    """
+    rng = random.Random(seed)
+    phones = itertools.count(1)
+
+    def pick(table):
+        return lambda: rng.randint(1, counts[table])
+
+    def fixed(path):
+        return lambda: path
+
+    def new_customer():
+        return {"name": "Load Test", "phone": f"7{next(phones):09d}"}
+
+    def new_service():
+        return {
+            "vehicle_id": pick("vehicles")(),
+            "service_type": "Load Test",
+            "service_date": date.today().isoformat(),
+            "problem_description": "benchmark"
+        }
+
+    return [
+        # auth_bp
+        ("POST", fixed("/api/auth/login"),
+         lambda: {"email": BENCH_EMAIL, "password": BENCH_PASSWORD}),
+        # customer_bp
+        ("GET", fixed("/api/customers?limit=50"), None),
+        ("POST", fixed("/api/customers"), new_customer),
+        # vehicle_bp
+        ("GET", fixed("/vehicles/?limit=50"), None),
+        ("GET", lambda: f"/vehicles/{pick('vehicles')()}", None),
+        # service_bp
+        ("GET", fixed("/services/?limit=50"), None),
+        ("GET", lambda: f"/services/{pick('services')()}", None),
+        ("POST", fixed("/services/"), new_service),
+        # invoice_bp
+        ("GET", fixed("/api/invoices/?limit=50"), None),
+        ("GET", lambda: f"/api/invoices/{pick('invoices')()}", None),
+        # mechanic_bp
+        ("GET", fixed("/api/mechanics/?limit=50"), None),
+        ("GET", lambda: f"/api/mechanics/{pick('mechanics')()}", None),
+        # search_bp
+        ("GET", lambda: f"/api/search/customers?q=Customer%20{pick('customers')()}", None),
+        ("GET", fixed("/api/search/vehicles?q=GJ0000"), None),
+        # report_bp
+        ("GET", fixed("/api/reports/revenue?group_by=payment_status"), None),
+        ("GET", fixed("/api/reports/revenue?granularity=daily&group_by=service_type"), None),
+        ("GET", fixed("/api/reports/turnaround?from=2023-01-01&to=2026-01-01"), None),
+        # ui
+        ("GET", fixed("/"), None),
+        ("GET", fixed("/customers"), None),
+        ("GET", fixed("/vehicles"), None),
+        ("GET", fixed("/services"), None),
+        ("GET", fixed("/invoices"), None),
+        ("GET", fixed("/mechanics"), None),
+    ]
+
+
+def _endpoint_name(app, method, path):
+    adapter = app.url_map.bind("localhost")
+    endpoint, _ = adapter.match(path.split("?")[0], method=method)
+    return endpoint
+
+
+def _summarize(endpoint, driver, latencies, errors, elapsed, queries):
+    ordered = sorted(latencies)
+    if len(ordered) >= 2:
+        cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = ordered[0] if ordered else 0.0
+
+    requests = len(latencies)
+    return {
+        "endpoint": endpoint,
+        "blueprint": endpoint.split(".")[0],
+        "driver": driver,
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+        "queries_per_request": round(queries / requests, 2) if requests else 0.0,
+    }
+
+
+# ---------------------------
+# DRIVERS
+# ---------------------------
+def _is_error(status):
+    # every scenario expects a 2xx; a redirect (e.g. to /login) is a failure
+    return not 200 <= status < 300
+
+
+def _test_client_login(app):
+    client = app.test_client()
+    response = client.post(
+        "/login", data={"username": BENCH_USERNAME, "password": BENCH_PASSWORD}
+    )
+    with client.session_transaction() as session:
+        if "user_id" not in session:
+            raise RuntimeError(f"Benchmark UI login failed (HTTP {response.status_code})")
+    return client
+
+
+def run_test_client(client, scenario, requests, counter):
+    method, path_factory, body_factory = scenario
+
+    latencies, errors = [], 0
+    queries_before = counter.count
+    started = time.perf_counter()
+    for _ in range(requests):
+        body = body_factory() if body_factory else None
+        t0 = time.perf_counter()
+        response = client.open(path_factory(), method=method, json=body)
+        latencies.append(time.perf_counter() - t0)
+        if _is_error(response.status_code):
+            errors += 1
+    elapsed = time.perf_counter() - started
+
+    return latencies, errors, elapsed, counter.count - queries_before
+
+
+def _http_login(port):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    conn.request(
+        "POST", "/api/auth/login",
+        body=json.dumps({"email": BENCH_EMAIL, "password": BENCH_PASSWORD}),
+        headers={"Content-Type": "application/json"}
+    )
+    response = conn.getresponse()
+    response.read()
+    conn.close()
+    cookie = response.getheader("Set-Cookie", "").split(";")[0]
+    if response.status != 200 or not cookie:
+        raise RuntimeError(f"Benchmark API login failed (HTTP {response.status})")
+    return cookie
+
+
+def run_http(port, scenario, requests, concurrency, counter, cookie):
+    method, path_factory, body_factory = scenario
+    per_worker = [requests // concurrency] * concurrency
+    for i in range(requests % concurrency):
+        per_worker[i] += 1
+
+    def worker(count):
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        latencies, errors = [], 0
+        for _ in range(count):
+            headers = {"Cookie": cookie}
+            body = None
+            if body_factory:
+                body = json.dumps(body_factory())
+                headers["Content-Type"] = "application/json"
+            t0 = time.perf_counter()
+            conn.request(method, path_factory(), body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - t0)
+            if _is_error(response.status):
+                errors += 1
+        conn.close()
+        return latencies, errors
+
+    queries_before = counter.count
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(worker, [n for n in per_worker if n]))
+    elapsed = time.perf_counter() - started
+
+    latencies = [value for lat, _ in outcomes for value in lat]
+    errors = sum(err for _, err in outcomes)
+    return latencies, errors, elapsed, counter.count - queries_before
+
+
+# ---------------------------
+# RUNNER
+# ---------------------------
+def run(database_url, requests, concurrency, drivers, only=None, **dataset):
+    from extensions import db
+
+    app = create_benchmark_app(database_url)
+    counter = QueryCounter()
+    results = []
+
+    with app.app_context():
+        db.create_all()
+        counts = seed_dataset(db, **dataset)
+        db.session.remove()
+
+    scenarios = [
+        (_endpoint_name(app, method, path_factory()), (method, path_factory, body_factory))
+        for method, path_factory, body_factory in build_scenarios(counts)
+    ]
+    if only:
+        scenarios = [s for s in scenarios if s[0].split(".")[0] in only]
+
+    event.listen(Engine, "before_cursor_execute", counter)
+    try:
+        if "test_client" in drivers:
+            client = _test_client_login(app)
+            for endpoint, scenario in scenarios:
+                outcome = run_test_client(client, scenario, requests, counter)
+                results.append(_summarize(endpoint, "test_client", *outcome))
+
+        if "http" in drivers:
+            server = make_server("127.0.0.1", 0, app, threaded=True)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                cookie = _http_login(server.port)
+                for endpoint, scenario in scenarios:
+                    outcome = run_http(
+                        server.port, scenario, requests, concurrency, counter, cookie
+                    )
+                    results.append(_summarize(endpoint, "http", *outcome))
+            finally:
+                server.shutdown()
+    finally:
+        event.remove(Engine, "before_cursor_execute", counter)
+
+    with app.app_context():
+        db.session.remove()
+        db.drop_all()
+
+    return {
+        "database": make_url(database_url).get_backend_name(),
+        "dataset": counts,
+        "requests_per_endpoint": requests,
+        "concurrency": concurrency,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url")
+    parser.add_argument("--customers", type=int, default=500)
+    parser.add_argument("--mechanics", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--drivers", default="test_client,http")
+    parser.add_argument("--only", help="comma separated blueprint names, e.g. service_bp,ui")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    database_url, scratch = args.database_url, None
+    if not database_url:
+        scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False).name
+        database_url = f"sqlite:///{scratch}"
+
+    try:
+        report = run(
+            database_url,
+            args.requests,
+            args.concurrency,
+            args.drivers.split(","),
+            only=args.only.split(",") if args.only else None,
+            customers=args.customers,
+            mechanics=args.mechanics
+        )
+    finally:
+        if scratch:
+            os.remove(scratch)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Synthetic garage dataset for benchmarks.
+
+Rows are written with executemany INSERTs in batches, so seeding a few
+hundred thousand rows takes seconds rather than minutes.
+"""
+import os
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+SERVICE_TYPES = ["Oil Change", "Brake Repair", "Engine Tune-up", "Tyre Rotation", "AC Service"]
+VEHICLE_TYPES = ["Car", "Bike", "Truck"]
+BRANDS = {"Honda": ["City", "Amaze"], "Maruti": ["Swift", "Baleno"], "Tata": ["Nexon", "Punch"]}
+SPECIALIZATIONS = ["Engine", "Electrical", "Body", "General"]
+
+BATCH_SIZE = 5000
+
+
+def create_benchmark_app(database_url):
+    """Build the real app against ``database_url`` (SQLite or Postgres)."""
+    os.environ["DATABASE_URL"] = database_url
+    from app import create_app
+
+    from utils.login_security import init_login_security
+
+    app = create_app()
+    app.config["SECRET_KEY"] = "benchmark"
+    # every benchmark request comes from one IP and one account
+    app.config.update(LOGIN_IP_BURST=10**6, LOGIN_ACCOUNT_BURST=10**6)
+    init_login_security(app)
+    return app
+
+
+def _status_history(services, seed):
+    # own generator so the history does not shift the rest of the dataset
+    rng = random.Random(seed + 1)
+    steps = ["Pending", "In Progress", "Completed"]
+    rows = []
+    for service_id, service in enumerate(services, start=1):
+        changed_at = service["created_at"]
+        previous = None
+        for status in steps[:steps.index(service["status"]) + 1]:
+            rows.append({
+                "service_id": service_id,
+                "from_status": previous,
+                "to_status": status,
+                "changed_at": changed_at
+            })
+            previous = status
+            changed_at += timedelta(hours=rng.expovariate(1 / 12))
+    return rows
+
+
+def _insert(db, model, rows):
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.session.execute(insert(model), rows[start:start + BATCH_SIZE])
+
+
+def seed_dataset(
+    db,
+    customers=2000,
+    vehicles_per_customer=2,
+    services_per_vehicle=3,
+    mechanics=50,
+    invoice_ratio=0.6,
+    seed=42
+):
+    """Insert a deterministic dataset and return the row counts.
+
+    Must run inside an app context with an empty schema: foreign keys
+    assume ids are handed out from 1 in insertion order.
+    """
+    from models.customer import Customer
+    from models.vehicle import Vehicle
+    from models.mechanic import Mechanic
+    from models.service_request import ServiceRequest
+    from models.invoice import Invoice
+    from models.service_status_history import ServiceStatusHistory
+    from models.user import User
+
+    rng = random.Random(seed)
+    start = datetime(2023, 1, 1)
+    span = (datetime(2026, 1, 1) - start).total_seconds()
+
+    def stamp():
+        return start + timedelta(seconds=rng.random() * span)
+
+    admin = User(username="bench", email="bench@example.com", role="admin")
+    admin.set_password("bench")
+    db.session.add(admin)
+
+    _insert(db, Customer, [
+        {
+            "name": f"Customer {i}",
+            "phone": f"9{i:09d}",
+            "email": f"customer{i}@example.com",
+            "created_at": stamp()
+        }
+        for i in range(1, customers + 1)
+    ])
+
+    _insert(db, Mechanic, [
+        {
+            "name": f"Mechanic {i}",
+            "phone": f"8{i:09d}",
+            "specialization": rng.choice(SPECIALIZATIONS),
+            "is_available": rng.random() < 0.3,
+            "created_at": stamp()
+        }
+        for i in range(1, mechanics + 1)
+    ])
+
+    vehicles = []
+    for customer_id in range(1, customers + 1):
+        for _ in range(vehicles_per_customer):
+            brand = rng.choice(list(BRANDS))
+            vehicles.append({
+                "customer_id": customer_id,
+                "vehicle_number": f"GJ{len(vehicles) + 1:08d}",
+                "vehicle_type": rng.choice(VEHICLE_TYPES),
+                "brand": brand,
+                "model": rng.choice(BRANDS[brand]),
+                "created_at": stamp()
+            })
+    _insert(db, Vehicle, vehicles)
+
+    services, invoices = [], []
+    for vehicle_id, vehicle in enumerate(vehicles, start=1):
+        for _ in range(services_per_vehicle):
+            service_id = len(services) + 1
+            created_at = stamp()
+            status = rng.choices(
+                ["Pending", "In Progress", "Completed"], weights=[1, 1, 4]
+            )[0]
+            services.append({
+                "vehicle_id": vehicle_id,
+                "service_type": rng.choice(SERVICE_TYPES),
+                "service_date": created_at.date(),
+                "problem_description": "Routine check",
+                "status": status,
+                "assigned_mechanic_id": rng.randint(1, mechanics),
+                "created_at": created_at
+            })
+            if status == "Completed" and rng.random() < invoice_ratio:
+                invoices.append({
+                    "service_id": service_id,
+                    "customer_id": vehicle["customer_id"],
+                    "vehicle_id": vehicle_id,
+                    "total_amount": round(rng.uniform(500, 25000), 2),
+                    "payment_status": rng.choice(["Pending", "Paid"]),
+                    "service_type": services[-1]["service_type"],
+                    "mechanic_id": services[-1]["assigned_mechanic_id"],
+                    "created_at": created_at + timedelta(days=rng.randint(0, 3))
+                })
+    _insert(db, ServiceRequest, services)
+    _insert(db, Invoice, invoices)
+    _insert(db, ServiceStatusHistory, _status_history(services, seed))
+
+    db.session.commit()
+
+    # executemany INSERTs skip the ORM events that maintain the rollups
+    from utils.revenue import rebuild_revenue_rollups
+    rebuild_revenue_rollups()
+
+    return {
+        "customers": customers,
+        "vehicles": len(vehicles),
+        "mechanics": mechanics,
+        "services": len(services),
+        "invoices": len(invoices)
+    }
@@ -1,9 +1,112 @@
 import os
 from dotenv import load_dotenv
+from sqlalchemy.pool import NullPool
+from utils.db_pool import InstrumentedQueuePool
 
 load_dotenv()
 
+# sessions signed with this key can be forged; wsgi.py refuses to serve it
+DEV_SECRET_KEY = "dev-secret-key"
+
+
+def env_bool(name, default=False):
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes")
+
+
+def engine_options(database_url):
+    """SQLALCHEMY_ENGINE_OPTIONS built from DB_* environment variables."""
+    if not database_url or database_url.startswith("sqlite"):
+        # Flask-SQLAlchemy picks suitable SQLite pools itself
+        return {}
+
+    options = {
+        # test connections on checkout so a Postgres restart does not
+        # surface as errors on the first request of every worker
+        "pool_pre_ping": env_bool("DB_POOL_PRE_PING", True),
+    }
+
+    if env_bool("DB_PGBOUNCER"):
+        # pgbouncer already pools server connections: keep none locally and
+        # send no startup options (set statement_timeout on the role instead)
+        options["poolclass"] = NullPool
+        return options
+
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=int(os.getenv("DB_POOL_SIZE", 5)),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", 10)),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", 30)),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", 1800)),
+    )
+
+    statement_timeout = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 0))
+    if statement_timeout:
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={statement_timeout}"
+        }
+    return options
+
+
 class Config:
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SECRET_KEY = os.getenv("SECRET_KEY")
\ No newline at end of file
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(SQLALCHEMY_DATABASE_URI)
+    SECRET_KEY = os.getenv("SECRET_KEY")
+
+    # async driver URL for asgi.py; derived from DATABASE_URL when empty
+    # (postgresql -> postgresql+asyncpg, sqlite -> sqlite+aiosqlite)
+    ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+
+    # pool summary log period (seconds) and slow-checkout warning threshold
+    DB_POOL_LOG_INTERVAL = float(os.getenv("DB_POOL_LOG_INTERVAL", 60))
+    DB_POOL_SLOW_WAIT_MS = float(os.getenv("DB_POOL_SLOW_WAIT_MS", 100))
+
+    # trust the role stored in the signed session cookie instead of
+    # reloading the user; role changes apply at the user's next login
+    SESSION_ROLE_CLAIM = env_bool("SESSION_ROLE_CLAIM")
+
+    # seconds the dashboard counters are served from memory
+    DASHBOARD_CACHE_TTL = int(os.getenv("DASHBOARD_CACHE_TTL", 30))
+
+    # opt-in slow-query profiler: statements slower than SLOW_QUERY_MS
+    # (0 = off) are logged, with a plan captured once per statement shape;
+    # SLOW_QUERY_LOG names a rotating log file (empty = app log only)
+    SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 0))
+    SLOW_QUERY_EXPLAIN = env_bool("SLOW_QUERY_EXPLAIN", True)
+    SLOW_QUERY_LOG = os.getenv("SLOW_QUERY_LOG", "")
+    SLOW_QUERY_LOG_BYTES = int(os.getenv("SLOW_QUERY_LOG_BYTES", 5 * 1024 * 1024))
+    SLOW_QUERY_LOG_BACKUPS = int(os.getenv("SLOW_QUERY_LOG_BACKUPS", 3))
+
+    # bearer token required to scrape /metrics (open when empty)
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+    # memory budget (bytes) for rendered invoice documents per process
+    INVOICE_DOCUMENT_CACHE_BYTES = int(os.getenv("INVOICE_DOCUMENT_CACHE_BYTES", 8 * 1024 * 1024))
+
+    # password checks run on a dedicated pool: threads, requests allowed to
+    # wait for it (the rest get 503) and seconds a request waits at most
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 16))
+    PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", 5))
+
+    # login token buckets (burst size, refill per minute) per client IP
+    # and per account; over the limit a login gets 429
+    LOGIN_IP_BURST = int(os.getenv("LOGIN_IP_BURST", 20))
+    LOGIN_IP_PER_MINUTE = float(os.getenv("LOGIN_IP_PER_MINUTE", 10))
+    LOGIN_ACCOUNT_BURST = int(os.getenv("LOGIN_ACCOUNT_BURST", 5))
+    LOGIN_ACCOUNT_PER_MINUTE = float(os.getenv("LOGIN_ACCOUNT_PER_MINUTE", 3))
+
+    # background jobs: "thread" or "process" pool, pool size, seconds
+    # between queue polls, attempts before a job is marked failed, first
+    # retry delay (doubles per attempt) and seconds after which a running
+    # job is presumed lost with its worker
+    JOB_EXECUTOR = os.getenv("JOB_EXECUTOR", "thread")
+    JOB_WORKERS = int(os.getenv("JOB_WORKERS", 2))
+    JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", 2))
+    JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", 3))
+    JOB_RETRY_BACKOFF = float(os.getenv("JOB_RETRY_BACKOFF", 10))
+    JOB_STALE_AFTER = int(os.getenv("JOB_STALE_AFTER", 900))
+
+    # start the runner in every process that serves requests; turn off to
+    # run jobs only in a dedicated `flask jobs work` process
+    JOB_RUNNER_AUTOSTART = env_bool("JOB_RUNNER_AUTOSTART", True)
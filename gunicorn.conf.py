@@ -0,0 +1,67 @@
+# gunicorn -c gunicorn.conf.py wsgi:app
+#
+# Every setting can be overridden from the environment (see .env.example).
+
+import multiprocessing
+import os
+import time
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_boot_started = time.perf_counter()
+
+
+def _env_bool(name, default):
+    return os.getenv(name, str(default)).lower() in ("1", "true", "yes")
+
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+
+# one process per core by default, each serving several requests on
+# threads while others wait on the database
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+threads = int(os.getenv("GUNICORN_THREADS", 4))
+worker_class = "gthread" if threads > 1 else "sync"
+
+# import and build the app once in the master, then fork
+preload_app = _env_bool("GUNICORN_PRELOAD", True)
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+# recycle workers now and then so slow leaks cannot accumulate
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 2000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 200))
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+
+
+def when_ready(server):
+    server.log.info(
+        "Master ready in %.0f ms: %d worker(s) x %d thread(s), preload=%s",
+        (time.perf_counter() - _boot_started) * 1000, workers, threads, preload_app
+    )
+
+
+def post_fork(server, worker):
+    from wsgi import app
+    from extensions import db
+    from utils.jobs import get_runner
+
+    # pooled connections opened in the master must not be shared with the
+    # children; close=False drops them without closing the parent's sockets
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+    if app.config["JOB_RUNNER_AUTOSTART"]:
+        get_runner(app).start()
+
+    worker.log.info(
+        "Worker %s ready %.0f ms after master boot",
+        worker.pid, (time.perf_counter() - _boot_started) * 1000
+    )
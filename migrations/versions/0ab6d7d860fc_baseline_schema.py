@@ -0,0 +1,110 @@
+"""baseline schema
+
+Tables as they existed before migrations were introduced. Databases
+created earlier with db.create_all() should be stamped at this revision
+(`flask db stamp 0ab6d7d860fc`) and then upgraded.
+
+Revision ID: 0ab6d7d860fc
+Revises:
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0ab6d7d860fc'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('username', sa.String(length=100), nullable=False),
+        sa.Column('email', sa.String(length=150), nullable=False),
+        sa.Column('password_hash', sa.Text(), nullable=False),
+        sa.Column('role', sa.String(length=20), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('email')
+    )
+    op.create_table(
+        'customers',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('phone', sa.String(length=20), nullable=False),
+        sa.Column('email', sa.String(length=150), nullable=True),
+        sa.Column('address', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('phone')
+    )
+    op.create_table(
+        'mechanics',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('phone', sa.String(length=15), nullable=False),
+        sa.Column('specialization', sa.String(length=100), nullable=True),
+        sa.Column('is_available', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('phone')
+    )
+    op.create_table(
+        'vehicles',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('customer_id', sa.Integer(), nullable=False),
+        sa.Column('vehicle_number', sa.String(length=20), nullable=False),
+        sa.Column('vehicle_type', sa.String(length=50), nullable=False),
+        sa.Column('brand', sa.String(length=50), nullable=False),
+        sa.Column('model', sa.String(length=50), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('vehicle_number')
+    )
+    op.create_table(
+        'service_requests',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('vehicle_id', sa.Integer(), nullable=False),
+        sa.Column('service_type', sa.String(length=100), nullable=False),
+        sa.Column('service_date', sa.Date(), nullable=False),
+        sa.Column('problem_description', sa.Text(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('assigned_mechanic_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.CheckConstraint(
+            "status IN ('Pending', 'In Progress', 'Completed')",
+            name='check_service_status'
+        ),
+        sa.ForeignKeyConstraint(['assigned_mechanic_id'], ['mechanics.id']),
+        sa.ForeignKeyConstraint(['vehicle_id'], ['vehicles.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table(
+        'invoices',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('service_id', sa.Integer(), nullable=False),
+        sa.Column('customer_id', sa.Integer(), nullable=False),
+        sa.Column('vehicle_id', sa.Integer(), nullable=False),
+        sa.Column('total_amount', sa.Float(), nullable=False),
+        sa.Column('payment_status', sa.String(length=20), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.id']),
+        sa.ForeignKeyConstraint(['service_id'], ['service_requests.id']),
+        sa.ForeignKeyConstraint(['vehicle_id'], ['vehicles.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('invoices')
+    op.drop_table('service_requests')
+    op.drop_table('vehicles')
+    op.drop_table('mechanics')
+    op.drop_table('customers')
+    op.drop_table('users')
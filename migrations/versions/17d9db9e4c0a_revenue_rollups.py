@@ -0,0 +1,43 @@
+"""revenue rollups
+
+Adds revenue_daily / revenue_monthly, maintained from invoice writes.
+Existing invoices are not summed here: run `flask rollups rebuild`
+after upgrading.
+
+Revision ID: 17d9db9e4c0a
+Revises: 7ea666ac726d
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '17d9db9e4c0a'
+down_revision = '7ea666ac726d'
+branch_labels = None
+depends_on = None
+
+
+def _rollup_table(name):
+    op.create_table(
+        name,
+        sa.Column('period', sa.Date(), nullable=False),
+        sa.Column('payment_status', sa.String(length=20), nullable=False),
+        sa.Column('service_type', sa.String(length=100), nullable=False),
+        sa.Column('mechanic_id', sa.Integer(), nullable=False),
+        sa.Column('invoice_count', sa.Integer(), nullable=False),
+        sa.Column('total_amount', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('period', 'payment_status', 'service_type', 'mechanic_id')
+    )
+
+
+def upgrade():
+    _rollup_table('revenue_daily')
+    _rollup_table('revenue_monthly')
+
+
+def downgrade():
+    op.drop_table('revenue_monthly')
+    op.drop_table('revenue_daily')
@@ -0,0 +1,74 @@
+"""index hot filter columns
+
+Adds indexes for the columns the app filters and joins on, plus
+(created_at, id) indexes backing keyset pagination.
+
+invoices.service_id becomes a UNIQUE index: remove duplicate invoices
+for the same service before upgrading or the migration will fail.
+
+Revision ID: 1805c058f490
+Revises: 0ab6d7d860fc
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1805c058f490'
+down_revision = '0ab6d7d860fc'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_service_requests_status', 'service_requests', ['status'])
+    op.create_index('ix_service_requests_vehicle_id', 'service_requests', ['vehicle_id'])
+    op.create_index(
+        'ix_service_requests_assigned_mechanic_id',
+        'service_requests',
+        ['assigned_mechanic_id']
+    )
+    op.create_index(
+        'ix_service_requests_created_at_id',
+        'service_requests',
+        ['created_at', 'id']
+    )
+
+    op.create_index('ix_invoices_service_id', 'invoices', ['service_id'], unique=True)
+    op.create_index('ix_invoices_payment_status', 'invoices', ['payment_status'])
+    op.create_index('ix_invoices_created_at_id', 'invoices', ['created_at', 'id'])
+
+    op.create_index('ix_vehicles_customer_id', 'vehicles', ['customer_id'])
+    op.create_index('ix_vehicles_created_at_id', 'vehicles', ['created_at', 'id'])
+
+    op.create_index(
+        'ix_mechanics_available',
+        'mechanics',
+        ['id'],
+        postgresql_where=sa.text('is_available = true'),
+        sqlite_where=sa.text('is_available = 1')
+    )
+    op.create_index('ix_mechanics_created_at_id', 'mechanics', ['created_at', 'id'])
+
+    op.create_index('ix_customers_created_at_id', 'customers', ['created_at', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_customers_created_at_id', table_name='customers')
+
+    op.drop_index('ix_mechanics_created_at_id', table_name='mechanics')
+    op.drop_index('ix_mechanics_available', table_name='mechanics')
+
+    op.drop_index('ix_vehicles_created_at_id', table_name='vehicles')
+    op.drop_index('ix_vehicles_customer_id', table_name='vehicles')
+
+    op.drop_index('ix_invoices_created_at_id', table_name='invoices')
+    op.drop_index('ix_invoices_payment_status', table_name='invoices')
+    op.drop_index('ix_invoices_service_id', table_name='invoices')
+
+    op.drop_index('ix_service_requests_created_at_id', table_name='service_requests')
+    op.drop_index('ix_service_requests_assigned_mechanic_id', table_name='service_requests')
+    op.drop_index('ix_service_requests_vehicle_id', table_name='service_requests')
+    op.drop_index('ix_service_requests_status', table_name='service_requests')
@@ -0,0 +1,42 @@
+"""table versions
+
+Adds the table_versions write counters behind the API ETag and
+Last-Modified headers, seeded with one row per data table.
+
+Revision ID: 23d046aedb53
+Revises: 1805c058f490
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '23d046aedb53'
+down_revision = '1805c058f490'
+branch_labels = None
+depends_on = None
+
+TABLES = ['users', 'customers', 'mechanics', 'vehicles', 'service_requests', 'invoices']
+
+
+def upgrade():
+    table_versions = op.create_table(
+        'table_versions',
+        sa.Column('table_name', sa.String(length=64), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('table_name')
+    )
+    now = datetime.utcnow()
+    op.bulk_insert(
+        table_versions,
+        [{'table_name': name, 'version': 1, 'updated_at': now} for name in TABLES]
+    )
+
+
+def downgrade():
+    op.drop_table('table_versions')
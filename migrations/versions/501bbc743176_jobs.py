@@ -0,0 +1,49 @@
+"""background jobs
+
+Adds the jobs table used by the in-process job runner.
+
+Revision ID: 501bbc743176
+Revises: d82bf15b938f
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '501bbc743176'
+down_revision = 'd82bf15b938f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('max_attempts', sa.Integer(), nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('run_after', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'failed')",
+            name='check_job_status'
+        ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_jobs_status_run_after', 'jobs', ['status', 'run_after'])
+    op.create_index('ix_jobs_created_at_id', 'jobs', ['created_at', 'id'])
+
+
+def downgrade():
+    op.drop_index('ix_jobs_created_at_id', table_name='jobs')
+    op.drop_index('ix_jobs_status_run_after', table_name='jobs')
+    op.drop_table('jobs')
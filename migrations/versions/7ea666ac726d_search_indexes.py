@@ -0,0 +1,86 @@
+"""search indexes
+
+Indexes behind /api/search and the UI search boxes:
+
+- Postgres: pg_trgm GIN indexes on the searched customer and vehicle
+  columns (needs permission to CREATE EXTENSION pg_trgm).
+- SQLite: FTS5 tables customers_fts / vehicles_fts over the same
+  columns, kept in sync by triggers. Batch migrations that recreate
+  customers or vehicles drop these triggers and must recreate them.
+
+Other databases get nothing and search falls back to LIKE scans.
+
+Revision ID: 7ea666ac726d
+Revises: 23d046aedb53
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7ea666ac726d'
+down_revision = '23d046aedb53'
+branch_labels = None
+depends_on = None
+
+# table -> searched columns
+SEARCHED = {
+    'customers': ['name', 'phone', 'email'],
+    'vehicles': ['vehicle_number', 'brand', 'model'],
+}
+
+
+def _fts_statements(table, columns):
+    fts = f'{table}_fts'
+    cols = ', '.join(columns)
+    new = ', '.join(f'new.{c}' for c in columns)
+    old = ', '.join(f'old.{c}' for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5("
+        f"{cols}, content='{table}', content_rowid='id', prefix='3')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for table, columns in SEARCHED.items():
+            for col in columns:
+                op.create_index(
+                    f'ix_{table}_{col}_trgm',
+                    table,
+                    [col],
+                    postgresql_using='gin',
+                    postgresql_ops={col: 'gin_trgm_ops'}
+                )
+
+    elif dialect == 'sqlite':
+        for table, columns in SEARCHED.items():
+            for statement in _fts_statements(table, columns):
+                op.execute(statement)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == 'postgresql':
+        for table, columns in SEARCHED.items():
+            for col in columns:
+                op.drop_index(f'ix_{table}_{col}_trgm', table_name=table)
+
+    elif dialect == 'sqlite':
+        for table in SEARCHED:
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f'DROP TRIGGER IF EXISTS {table}_fts_{suffix}')
+            op.execute(f'DROP TABLE IF EXISTS {table}_fts')
@@ -0,0 +1,27 @@
+"""index users.username
+
+The UI login looks users up by username; email already has the unique
+index used by the API login.
+
+Revision ID: 934d7b7602cf
+Revises: 501bbc743176
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '934d7b7602cf'
+down_revision = '501bbc743176'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_users_username'), 'users', ['username'])
+
+
+def downgrade():
+    op.drop_index(op.f('ix_users_username'), table_name='users')
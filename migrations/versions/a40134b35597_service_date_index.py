@@ -0,0 +1,29 @@
+"""index service_requests (service_date, id)
+
+Backs the service_date range filters and the ?sort=service_date keyset
+order of GET /services.
+
+Revision ID: a40134b35597
+Revises: 934d7b7602cf
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a40134b35597'
+down_revision = '934d7b7602cf'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_service_requests_service_date_id', 'service_requests', ['service_date', 'id']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_service_requests_service_date_id', table_name='service_requests')
@@ -0,0 +1,59 @@
+"""table changes
+
+Replaces the table_versions counters, one row per table updated by every
+writer, with the insert-only table_changes log so concurrent writers do
+not serialize on a shared row.
+
+Revision ID: bae8dc042809
+Revises: a40134b35597
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'bae8dc042809'
+down_revision = 'a40134b35597'
+branch_labels = None
+depends_on = None
+
+TABLES = ['users', 'customers', 'mechanics', 'vehicles', 'service_requests', 'invoices']
+
+
+def upgrade():
+    op.create_table(
+        'table_changes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('table_name', sa.String(length=64), nullable=False),
+        sa.Column('weight', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_table_changes_table_name_weight', 'table_changes', ['table_name', 'weight']
+    )
+    # carry the current versions over so cached ETags stay valid
+    op.execute(
+        "INSERT INTO table_changes (table_name, weight) "
+        "SELECT table_name, version FROM table_versions"
+    )
+    op.drop_table('table_versions')
+
+
+def downgrade():
+    table_versions = op.create_table(
+        'table_versions',
+        sa.Column('table_name', sa.String(length=64), nullable=False),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('table_name')
+    )
+    op.bulk_insert(
+        table_versions,
+        [{'table_name': name, 'version': 1, 'updated_at': datetime.utcnow()} for name in TABLES]
+    )
+    op.drop_index('ix_table_changes_table_name_weight', table_name='table_changes')
+    op.drop_table('table_changes')
@@ -0,0 +1,55 @@
+"""invoice rollup dimensions
+
+Stores the service type and mechanic an invoice's revenue is rolled up
+under on the invoice itself, backfilled from its service.
+
+Revision ID: c6e1f0a2d93b
+Revises: bae8dc042809
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6e1f0a2d93b'
+down_revision = 'bae8dc042809'
+branch_labels = None
+depends_on = None
+
+# mechanic_id of invoices whose service has no mechanic (models/revenue.py)
+UNASSIGNED_MECHANIC = 0
+
+
+def upgrade():
+    op.add_column('invoices', sa.Column('service_type', sa.String(length=100), nullable=True))
+    op.add_column('invoices', sa.Column('mechanic_id', sa.Integer(), nullable=True))
+
+    invoices = sa.table(
+        'invoices',
+        sa.column('service_id', sa.Integer),
+        sa.column('service_type', sa.String),
+        sa.column('mechanic_id', sa.Integer),
+    )
+    services = sa.table(
+        'service_requests',
+        sa.column('id', sa.Integer),
+        sa.column('service_type', sa.String),
+        sa.column('assigned_mechanic_id', sa.Integer),
+    )
+    service = services.c.id == invoices.c.service_id
+    op.execute(
+        invoices.update().values(
+            service_type=sa.select(services.c.service_type)
+            .where(service).scalar_subquery(),
+            mechanic_id=sa.select(
+                sa.func.coalesce(services.c.assigned_mechanic_id, UNASSIGNED_MECHANIC)
+            ).where(service).scalar_subquery(),
+        )
+    )
+
+
+def downgrade():
+    op.drop_column('invoices', 'mechanic_id')
+    op.drop_column('invoices', 'service_type')
@@ -0,0 +1,51 @@
+"""service status history
+
+Adds the append-only service_status_history log. Existing services get
+one row with their current status, stamped at their created_at; their
+earlier transitions were never recorded.
+
+Revision ID: d82bf15b938f
+Revises: 17d9db9e4c0a
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd82bf15b938f'
+down_revision = '17d9db9e4c0a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'service_status_history',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('service_id', sa.Integer(), nullable=False),
+        sa.Column('from_status', sa.String(length=20), nullable=True),
+        sa.Column('to_status', sa.String(length=20), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['service_id'], ['service_requests.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_service_status_history_service_id_changed_at',
+        'service_status_history',
+        ['service_id', 'changed_at']
+    )
+
+    op.execute(
+        "INSERT INTO service_status_history (service_id, from_status, to_status, changed_at) "
+        "SELECT id, NULL, status, COALESCE(created_at, CURRENT_TIMESTAMP) FROM service_requests"
+    )
+
+
+def downgrade():
+    op.drop_index(
+        'ix_service_status_history_service_id_changed_at',
+        table_name='service_status_history'
+    )
+    op.drop_table('service_status_history')
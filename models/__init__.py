@@ -1,4 +1,10 @@
 from models.customer import Customer
 from models.vehicle import Vehicle
 from models.mechanic import Mechanic
-from models.service_request import ServiceRequest
\ No newline at end of file
+from models.service_request import ServiceRequest
+from models.invoice import Invoice
+from models.user import User
+from models.table_change import TableChange
+from models.revenue import RevenueDaily, RevenueMonthly
+from models.service_status_history import ServiceStatusHistory
+from models.job import Job
\ No newline at end of file
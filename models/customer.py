@@ -11,6 +11,11 @@ class Customer(db.Model):
     address = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # keyset pagination order
+        db.Index("ix_customers_created_at_id", "created_at", "id"),
+    )
+
     # REPRESENTATION (for debugging/logs)
     def __repr__(self):
         return f"<Customer id={self.id} name={self.name}>"
@@ -9,7 +9,9 @@ class Invoice(db.Model):
     service_id = db.Column(
         db.Integer,
         db.ForeignKey("service_requests.id"),
-        nullable=False
+        nullable=False,
+        unique=True,    # one invoice per service
+        index=True
     )
 
     customer_id = db.Column(
@@ -26,13 +28,23 @@ class Invoice(db.Model):
 
     total_amount = db.Column(db.Float, nullable=False)
 
-    payment_status = db.Column(db.String(20), default="Pending")
+    payment_status = db.Column(db.String(20), default="Pending", index=True)
+
+    # revenue rollup dimensions, copied from the service when the invoice
+    # is written so later reassignments do not move past revenue
+    service_type = db.Column(db.String(100))
+    mechanic_id = db.Column(db.Integer)
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     service = db.relationship("ServiceRequest")
     customer = db.relationship("Customer")
     vehicle = db.relationship("Vehicle")
+
+    __table_args__ = (
+        # keyset pagination order
+        db.Index("ix_invoices_created_at_id", "created_at", "id"),
+    )
     
     # REPRESENTATION (for debugging/logs)
     def __repr__(self):
@@ -0,0 +1,54 @@
+from extensions import db
+from datetime import datetime
+
+
+class Job(db.Model):
+    """A unit of background work, run by utils/jobs.py.
+
+    ``payload`` and ``result`` hold JSON text. A job is picked up once
+    ``status`` is queued and ``run_after`` has passed.
+    """
+    __tablename__ = "jobs"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    name = db.Column(db.String(100), nullable=False)
+
+    payload = db.Column(db.Text, nullable=False, default="{}")
+
+    status = db.Column(
+        db.String(20),
+        nullable=False,
+        default="queued"   # queued | running | succeeded | failed
+    )
+
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+
+    max_attempts = db.Column(db.Integer, nullable=False, default=3)
+
+    last_error = db.Column(db.Text)
+
+    result = db.Column(db.Text)
+
+    run_after = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    started_at = db.Column(db.DateTime)
+
+    finished_at = db.Column(db.DateTime)
+
+    __table_args__ = (
+        db.CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'failed')",
+            name="check_job_status"
+        ),
+        # runner poll: due queued jobs, oldest first
+        db.Index("ix_jobs_status_run_after", "status", "run_after"),
+        # keyset pagination order
+        db.Index("ix_jobs_created_at_id", "created_at", "id"),
+    )
+
+    # REPRESENTATION (for debugging/logs)
+    def __repr__(self):
+        return f"<Job id={self.id} name={self.name} status={self.status}>"
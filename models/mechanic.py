@@ -15,6 +15,18 @@ class Mechanic(db.Model):
     is_available = db.Column(db.Boolean, default=True)
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        # partial index: only available mechanics are looked up by flag
+        db.Index(
+            "ix_mechanics_available",
+            "id",
+            postgresql_where=(is_available == True),  # noqa: E712
+            sqlite_where=(is_available == True),  # noqa: E712
+        ),
+        # keyset pagination order
+        db.Index("ix_mechanics_created_at_id", "created_at", "id"),
+    )
     
     # REPRESENTATION (for debugging/logs)
     def __repr__(self):
@@ -0,0 +1,36 @@
+from extensions import db
+
+# mechanic_id used for invoices whose service has no mechanic
+UNASSIGNED_MECHANIC = 0
+
+
+class RevenueRollup:
+    """Invoice count and amount per period / status / service type / mechanic.
+
+    Maintained from invoice writes (utils/revenue.py); ``period`` is the
+    invoice day for the daily table and the first day of the month for
+    the monthly one.
+    """
+    period = db.Column(db.Date, primary_key=True)
+    payment_status = db.Column(db.String(20), primary_key=True)
+    service_type = db.Column(db.String(100), primary_key=True)
+    mechanic_id = db.Column(db.Integer, primary_key=True)
+
+    invoice_count = db.Column(db.Integer, nullable=False, default=0)
+    total_amount = db.Column(db.Float, nullable=False, default=0)
+
+
+class RevenueDaily(RevenueRollup, db.Model):
+    __tablename__ = "revenue_daily"
+
+    # REPRESENTATION (for debugging/logs)
+    def __repr__(self):
+        return f"<RevenueDaily {self.period} {self.payment_status} amount={self.total_amount}>"
+
+
+class RevenueMonthly(RevenueRollup, db.Model):
+    __tablename__ = "revenue_monthly"
+
+    # REPRESENTATION (for debugging/logs)
+    def __repr__(self):
+        return f"<RevenueMonthly {self.period} {self.payment_status} amount={self.total_amount}>"
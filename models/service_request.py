@@ -9,7 +9,8 @@ class ServiceRequest(db.Model):
     vehicle_id = db.Column(
         db.Integer,
         db.ForeignKey("vehicles.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     service_type = db.Column(db.String(100), nullable=False)
@@ -28,13 +29,15 @@ class ServiceRequest(db.Model):
         
         db.String(20),
         nullable=False,
-        default="Pending"   # Pending | In Progress | Completed
+        default="Pending",   # Pending | In Progress | Completed
+        index=True
     )
 
     assigned_mechanic_id = db.Column(
         db.Integer,
         db.ForeignKey("mechanics.id"),
-        nullable=True
+        nullable=True,
+        index=True
     )
 
     created_at = db.Column(
@@ -50,6 +53,10 @@ class ServiceRequest(db.Model):
             "status IN ('Pending', 'In Progress', 'Completed')",
             name="check_service_status"
         ),
+        # keyset pagination order
+        db.Index("ix_service_requests_created_at_id", "created_at", "id"),
+        # service_date filters / sort
+        db.Index("ix_service_requests_service_date_id", "service_date", "id"),
     )
     
     # REPRESENTATION (for debugging/logs)
@@ -0,0 +1,37 @@
+from extensions import db
+from datetime import datetime
+
+
+class ServiceStatusHistory(db.Model):
+    """Append-only log of service status transitions.
+
+    Written by utils/status_history.py whenever a service is created or
+    its status changes; ``from_status`` is NULL for the creation row.
+    """
+    __tablename__ = "service_status_history"
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    service_id = db.Column(
+        db.Integer,
+        db.ForeignKey("service_requests.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    from_status = db.Column(db.String(20))
+
+    to_status = db.Column(db.String(20), nullable=False)
+
+    changed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        # per-service timeline, read in order by the turnaround analytics
+        db.Index("ix_service_status_history_service_id_changed_at", "service_id", "changed_at"),
+    )
+
+    # REPRESENTATION (for debugging/logs)
+    def __repr__(self):
+        return (
+            f"<ServiceStatusHistory service_id={self.service_id} "
+            f"{self.from_status}->{self.to_status}>"
+        )
@@ -0,0 +1,25 @@
+from extensions import db
+
+
+class TableChange(db.Model):
+    """One row per committed transaction and table it wrote.
+
+    Writers only ever INSERT here, so concurrent transactions never wait
+    on each other. A table's version is ``sum(weight)``: compaction folds
+    old rows into one row carrying their count, leaving the sum as is.
+    Drives the ETag of the read endpoints.
+    """
+    __tablename__ = "table_changes"
+
+    id = db.Column(db.Integer, primary_key=True)
+    table_name = db.Column(db.String(64), nullable=False)
+    weight = db.Column(db.BigInteger, nullable=False, default=1)
+
+    __table_args__ = (
+        # index-only sum per table
+        db.Index("ix_table_changes_table_name_weight", "table_name", "weight"),
+    )
+
+    # REPRESENTATION (for debugging/logs)
+    def __repr__(self):
+        return f"<TableChange {self.table_name}+{self.weight}>"
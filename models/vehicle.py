@@ -11,7 +11,8 @@ class Vehicle(db.Model):
     customer_id = db.Column(
         db.Integer,
         db.ForeignKey("customers.id", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     vehicle_number = db.Column(
@@ -42,6 +43,11 @@ class Vehicle(db.Model):
 
     customer = db.relationship("Customer", backref="vehicles")
 
+    __table_args__ = (
+        # keyset pagination order
+        db.Index("ix_vehicles_created_at_id", "created_at", "id"),
+    )
+
     # # relationship
     # services = db.relationship(
     #     "ServiceRequest",
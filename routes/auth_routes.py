@@ -2,8 +2,10 @@ from flask import Blueprint, request,session
 from models.user import User
 from extensions import db
 from utils.response import success_response
-from utils.error_handlers import unauthorized, bad_request
+from utils.error_handlers import unauthorized, bad_request, too_many_requests, service_unavailable
 from utils.validators import get_json_data
+from utils.auth import login_user
+from utils.login_security import HasherBusy, check_login, login_throttle
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
@@ -34,10 +36,26 @@ def login():
     if not data:
         return bad_request("JSON body required")
 
-    user = User.query.filter_by(email=data["email"]).first()
+    email = data.get("email")
+    password = data.get("password") or ""
+    if not isinstance(email, str) or not isinstance(password, str):
+        return bad_request("email and password must be strings")
 
-    if user and user.check_password(data["password"]):
-        session["user_id"] = user.id
+    # 🔒 throttle before any hashing work
+    wait = login_throttle().hit(request.remote_addr, email)
+    if wait:
+        return too_many_requests("Too many login attempts, try again later", retry_after=wait)
+
+    user = User.query.filter_by(email=email).first()
+
+    try:
+        valid = check_login(user, password)
+    except HasherBusy:
+        return service_unavailable("Login is busy, try again shortly", retry_after=1)
+
+    if valid:
+        login_throttle().record_success(request.remote_addr, email)
+        login_user(user)
         return success_response(message= "Login successful")
 
     return unauthorized("Invalid credentials")
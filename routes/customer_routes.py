@@ -1,11 +1,18 @@
 from flask import Blueprint, request, flash
-from sqlite3 import IntegrityError
+from sqlalchemy.exc import IntegrityError
 from models.customer import Customer
 from extensions import db
 from utils.auth import login_required, admin_required
 from utils.error_handlers import bad_request,conflict,bad_request
 from utils.response import success_response
 from utils.validators import get_json_data, require_fields
+from utils.pagination import paginate
+from utils.bulk import (
+    get_bulk_items, existing_values, insert_rows, row_error, bulk_response,
+    invalid_field, as_text
+)
+from utils.serializers import customer_serializer
+from utils.conditional import conditional_get
 
 
 customer_bp = Blueprint("customer", __name__, url_prefix="/api/customers")
@@ -14,19 +21,21 @@ customer_bp = Blueprint("customer", __name__, url_prefix="/api/customers")
 # 🔒 ANY LOGGED-IN USER CAN VIEW CUSTOMERS
 @customer_bp.route("", methods=["GET"])
 @login_required
+@conditional_get("customers")
 def get_customers():
-    customers = Customer.query.all()
-    data = [
-    {
-        "id": c.id,
-        "name": c.name,
-        "phone": c.phone
-    } for c in customers
-    ]
-    
+    try:
+        customers, next_cursor = paginate(
+            Customer.query,
+            [Customer.created_at, Customer.id],
+            request.args
+        )
+    except ValueError as e:
+        return bad_request(str(e))
+
     return success_response(
-        message="Customers fetched successfully", 
-        data=data
+        message="Customers fetched successfully",
+        data=customer_serializer.dump_many(customers),
+        next_cursor=next_cursor
     )
 
 # 🔒 STAFF & ADMIN CAN ADD CUSTOMER
@@ -65,15 +74,59 @@ def add_customer():
 
     return success_response(
     message="Customer created successfully",
-    data={
-        "id": customer.id,
-        "name": customer.name,
-        "phone": customer.phone
-    },
+    data=customer_serializer.dump(customer),
     status_code=201
 )
 
 
+# 🔒 STAFF & ADMIN CAN BULK ADD CUSTOMERS
+@customer_bp.route("/bulk", methods=["POST"])
+@login_required
+def add_customers_bulk():
+    try:
+        items = get_bulk_items(get_json_data(request))
+    except ValueError as e:
+        return bad_request(str(e))
+
+    items = [as_text(item, ["name", "phone", "email", "address"]) for item in items]
+
+    # 🔒 ONE DUPLICATE-PHONE LOOKUP FOR THE WHOLE BATCH
+    taken_phones = existing_values(
+        Customer.phone, [item.get("phone") for item in items]
+    )
+
+    results = [None] * len(items)
+    rows, indexes = [], []
+    for index, item in enumerate(items):
+        bad_field = invalid_field(item, ["name", "phone", "email", "address"])
+        if not require_fields(item, ["name", "phone"]):
+            results[index] = row_error(index, "Missing required fields: name, phone")
+        elif bad_field:
+            results[index] = row_error(index, f"{bad_field} must be a string or number")
+        elif item["phone"] in taken_phones:
+            results[index] = row_error(
+                index, "Customer with this phone number already exists"
+            )
+        else:
+            taken_phones.add(item["phone"])
+            indexes.append(index)
+            rows.append({
+                "name": item["name"],
+                "phone": item["phone"],
+                "email": item.get("email"),
+                "address": item.get("address")
+            })
+
+    try:
+        ids = insert_rows(Customer, rows)
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return conflict("Batch conflicts with existing customers, nothing was saved")
+
+    return bulk_response("Customers processed", results, indexes, ids)
+
+
 # 🔒 STAFF & ADMIN CAN UPDATE
 @customer_bp.route("/<int:id>", methods=["PUT"])
 @login_required
@@ -1,14 +1,26 @@
 # routes/invoice_routes.py
 
-from flask import Blueprint, request
+from flask import Blueprint, current_app, request
+from sqlalchemy import select, update
 from extensions import db
 from models.invoice import Invoice
-from utils.error_handlers import bad_request,conflict,bad_request
+from utils.error_handlers import bad_request,conflict,bad_request,not_found
 from utils.response import success_response
 from utils.validators import get_json_data
+from utils.pagination import paginate
+from utils.filters import INVOICE_FILTERS
+from utils.export import EXPORT_FORMATS, export_response
+from utils.auth import login_required
+from utils.serializers import invoice_serializer
+from utils.conditional import conditional_get
+from utils.invoice_documents import DOCUMENT_FORMATS, invoice_document
+from utils.bulk import get_bulk_ids, id_result, id_error, bulk_update_response
+from utils.revenue import apply_revenue_deltas, payment_status_deltas
 
 invoice_bp = Blueprint("invoice", __name__, url_prefix="/api/invoices")
 
+PAYMENT_STATUS = ["Pending", "Paid"]
+
 
 # ✅ Create Invoice
 @invoice_bp.route("/create", methods=["POST"])
@@ -67,40 +79,72 @@ def create_invoice():
 
 # ✅ Get All Invoices
 @invoice_bp.route("/", methods=["GET"])
+@conditional_get("invoices")
 def get_all_invoices():
-    invoices = Invoice.query.all()
+    try:
+        query, keys, descending = INVOICE_FILTERS.apply(Invoice.query, request.args)
+        invoices, next_cursor = paginate(query, keys, request.args, descending)
+    except ValueError as e:
+        return bad_request(str(e))
+
+    return success_response(
+        data=invoice_serializer.dump_many(invoices),
+        next_cursor=next_cursor
+    )
+
 
-    result = []
-    for inv in invoices:
-        result.append({
-            "id": inv.id,
-            "service_id": inv.service_id,
-            "customer_id": inv.customer_id,
-            "vehicle_id": inv.vehicle_id,
-            "total_amount": inv.total_amount,
-            "payment_status": inv.payment_status,
-            "created_at": inv.created_at
-        })
+# ✅ Export Invoices (NDJSON / CSV stream)
+@invoice_bp.route("/export", methods=["GET"])
+@login_required
+def export_invoices():
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in EXPORT_FORMATS:
+        return bad_request("format must be ndjson or csv")
 
-    return success_response(result)
+    stmt = select(
+        Invoice.id,
+        Invoice.service_id,
+        Invoice.customer_id,
+        Invoice.vehicle_id,
+        Invoice.total_amount,
+        Invoice.payment_status,
+        Invoice.created_at
+    ).order_by(Invoice.id)
+
+    return export_response(stmt, "invoices", fmt)
 
 
 # ✅ Get Single Invoice
 @invoice_bp.route("/<int:id>", methods=["GET"])
+@conditional_get("invoices")
 def get_invoice(id):
     invoice = Invoice.query.get_or_404(id)
 
     return success_response(
-        data= {
-        "id": invoice.id,
-        "service_id": invoice.service_id,
-        "customer_id": invoice.customer_id,
-        "vehicle_id": invoice.vehicle_id,
-        "total_amount": invoice.total_amount,
-        "payment_status": invoice.payment_status,
-        "created_at": invoice.created_at
-        },
-        status_code=200)
+        data=invoice_serializer.dump(invoice),
+        status_code=200
+    )
+
+
+# ✅ Invoice Document (HTML / print)
+@invoice_bp.route("/<int:id>/document", methods=["GET"])
+@login_required
+def get_invoice_document(id):
+    fmt = request.args.get("format", "html")
+    if fmt not in DOCUMENT_FORMATS:
+        return bad_request("format must be html or print")
+
+    document = invoice_document(id, fmt)
+    if document is None:
+        return not_found("Invoice not found")
+
+    body, digest = document
+    response = current_app.response_class(body, mimetype="text/html")
+    # the content hash doubles as a strong ETag
+    response.set_etag(f"{fmt}-{digest}")
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 
 #  Update Payment Status
@@ -118,6 +162,56 @@ def update_invoice(id):
     return success_response(message = "Invoice updated successfully",status_code=200)
 
 
+# ✅ Bulk Update Payment Status
+@invoice_bp.route("/", methods=["PATCH"])
+@login_required
+def update_invoices_bulk():
+    try:
+        ids, payment_status = get_bulk_ids(
+            get_json_data(request), "payment_status", PAYMENT_STATUS
+        )
+    except ValueError as e:
+        return bad_request(str(e))
+
+    # 🔒 lock the rows, in id order, until the UPDATE commits
+    rows = db.session.execute(
+        select(
+            Invoice.id,
+            Invoice.payment_status,
+            Invoice.created_at,
+            Invoice.total_amount,
+            Invoice.service_type,
+            Invoice.mechanic_id
+        )
+        .where(Invoice.id.in_(ids))
+        .order_by(Invoice.id)
+        .with_for_update()
+    ).all()
+    current = {row.id: row for row in rows}
+    changed = [row for row in rows if row.payment_status != payment_status]
+
+    results = []
+    for id in ids:
+        if id not in current:
+            results.append(id_error(id, "Invoice not found"))
+        else:
+            results.append(id_result(id, current[id].payment_status != payment_status))
+
+    if changed:
+        db.session.execute(
+            update(Invoice)
+            .where(Invoice.id.in_([row.id for row in changed]))
+            .values(payment_status=payment_status)
+        )
+        # a bulk UPDATE skips the rollup mapper events
+        apply_revenue_deltas(
+            db.session.connection(), payment_status_deltas(changed, payment_status)
+        )
+    db.session.commit()
+
+    return bulk_update_response("Invoices processed", results)
+
+
 #  Delete Invoice
 @invoice_bp.route("/delete/<int:id>", methods=["DELETE"])
 def delete_invoice(id):
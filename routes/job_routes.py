@@ -0,0 +1,114 @@
+# routes/job_routes.py
+
+import json
+
+from flask import Blueprint, request
+from extensions import db
+from models.job import Job
+from utils.auth import login_required, admin_required
+from utils.error_handlers import bad_request, not_found
+from utils.response import success_response
+from utils.validators import get_json_data
+from utils.pagination import paginate
+from utils.serializers import job_serializer
+from utils.conditional import conditional_get
+from utils.jobs import JOB_STATUSES, enqueue, retry_job
+
+job_bp = Blueprint("job", __name__, url_prefix="/api/jobs")
+
+
+def _dump(job):
+    data = job_serializer.dump(job)
+    data["payload"] = json.loads(job.payload)
+    data["result"] = json.loads(job.result) if job.result else None
+    return data
+
+
+# 🔒 ONLY ADMIN CAN QUEUE JOBS
+@job_bp.route("/", methods=["POST"])
+@login_required
+@admin_required
+def create_job():
+    data = get_json_data(request)
+    if not data or not data.get("name"):
+        return bad_request("name is required")
+
+    payload = data.get("payload") or {}
+    if not isinstance(payload, dict):
+        return bad_request("payload must be a JSON object")
+
+    try:
+        job = enqueue(data["name"], payload)
+    except ValueError as e:
+        return bad_request(str(e))
+    db.session.commit()
+
+    return success_response(
+        message="Job queued",
+        data=_dump(job),
+        status_code=202
+    )
+
+
+# 🔒 ONLY ADMIN CAN LIST JOBS
+@job_bp.route("/", methods=["GET"])
+@login_required
+@admin_required
+@conditional_get("jobs")
+def get_all_jobs():
+    query = Job.query
+    status = request.args.get("status")
+    if status:
+        if status not in JOB_STATUSES:
+            return bad_request("status must be one of " + ", ".join(JOB_STATUSES))
+        query = query.filter(Job.status == status)
+
+    try:
+        jobs, next_cursor = paginate(
+            query,
+            [Job.created_at, Job.id],
+            request.args,
+            descending=True
+        )
+    except ValueError as e:
+        return bad_request(str(e))
+
+    return success_response(
+        data=[_dump(job) for job in jobs],
+        next_cursor=next_cursor
+    )
+
+
+# 🔒 ONLY ADMIN CAN POLL A JOB (payload and last_error hold internals)
+@job_bp.route("/<int:id>", methods=["GET"])
+@login_required
+@admin_required
+@conditional_get("jobs")
+def get_job(id):
+    job = db.session.get(Job, id)
+    if job is None:
+        return not_found("Job not found")
+
+    return success_response(data=_dump(job))
+
+
+# 🔒 ONLY ADMIN CAN RETRY A FAILED JOB
+@job_bp.route("/<int:id>/retry", methods=["POST"])
+@login_required
+@admin_required
+def retry_failed_job(id):
+    job = db.session.get(Job, id)
+    if job is None:
+        return not_found("Job not found")
+
+    try:
+        retry_job(job)
+    except ValueError as e:
+        return bad_request(str(e))
+    db.session.commit()
+
+    return success_response(
+        message="Job queued for retry",
+        data=_dump(job),
+        status_code=202
+    )
@@ -0,0 +1,87 @@
+# routes/lookup_routes.py
+
+from flask import Blueprint, request
+from sqlalchemy import or_
+from sqlalchemy.orm import load_only
+from models.customer import Customer
+from models.vehicle import Vehicle
+from models.mechanic import Mechanic
+from utils.auth import login_required
+from utils.error_handlers import bad_request
+from utils.response import success_response
+from utils.pagination import paginate
+from utils.search import like_pattern, match_criterion
+from utils.serializers import (
+    customer_serializer, vehicle_lookup_serializer, mechanic_lookup_serializer
+)
+
+lookup_bp = Blueprint("lookup", __name__, url_prefix="/api/lookup")
+
+# picker pages are small; ?limit= still accepts up to MAX_LIMIT
+LOOKUP_LIMIT = 20
+
+
+def _lookup(model, serializer, match, *criteria):
+    """One id-ordered keyset page of ``model`` matching ``?q=``.
+
+    ``match(term)`` builds the WHERE clause for the search term.
+    """
+    query = model.query.options(
+        load_only(*(getattr(model, f) for f in serializer.fields))
+    ).filter(*criteria)
+
+    term = request.args.get("q", "").strip()
+    if term:
+        query = query.filter(match(term))
+
+    args = {"limit": LOOKUP_LIMIT, **request.args.to_dict()}
+    try:
+        rows, next_cursor = paginate(query, [model.id], args)
+    except ValueError as e:
+        return bad_request(str(e))
+
+    return success_response(
+        data=serializer.dump_many(rows),
+        next_cursor=next_cursor
+    )
+
+
+# 🔎 Customer picker (name / phone)
+@lookup_bp.route("/customers", methods=["GET"])
+@login_required
+def lookup_customers():
+    # customers_fts / pg_trgm indexes, as /api/search uses
+    return _lookup(
+        Customer,
+        customer_serializer,
+        lambda term: match_criterion(Customer, term, [Customer.name, Customer.phone])
+    )
+
+
+# 🔎 Vehicle picker (vehicle number)
+@lookup_bp.route("/vehicles", methods=["GET"])
+@login_required
+def lookup_vehicles():
+    return _lookup(
+        Vehicle,
+        vehicle_lookup_serializer,
+        lambda term: match_criterion(Vehicle, term, [Vehicle.vehicle_number])
+    )
+
+
+# 🔎 Mechanic picker (name / specialization), ?available=1 for free ones
+@lookup_bp.route("/mechanics", methods=["GET"])
+@login_required
+def lookup_mechanics():
+    criteria = []
+    if request.args.get("available") in ("1", "true"):
+        criteria.append(Mechanic.is_available == True)  # noqa: E712
+
+    # no search index for mechanics: substring LIKE
+    columns = [Mechanic.name, Mechanic.specialization]
+    return _lookup(
+        Mechanic,
+        mechanic_lookup_serializer,
+        lambda term: or_(*(c.ilike(like_pattern(term), escape="\\") for c in columns)),
+        *criteria
+    )
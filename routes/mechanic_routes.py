@@ -6,6 +6,10 @@ from models.mechanic import Mechanic
 from utils.error_handlers import bad_request
 from utils.response import success_response
 from utils.validators import get_json_data
+from utils.pagination import paginate
+from utils.filters import MECHANIC_FILTERS
+from utils.serializers import mechanic_serializer, mechanic_created_serializer
+from utils.conditional import conditional_get
 
 mechanic_bp = Blueprint("mechanic", __name__, url_prefix="/api/mechanics")
 
@@ -30,11 +34,7 @@ def create_mechanic():
 
         return success_response(
             message="Mechanic created successfully",
-            data={
-                "id": mechanic.id,
-                "name": mechanic.name,
-                "specialization": mechanic.specialization
-            },
+            data=mechanic_created_serializer.dump(mechanic),
             status_code=201
         )
 
@@ -45,38 +45,31 @@ def create_mechanic():
 
 # ✅ Get All Mechanics
 @mechanic_bp.route("/", methods=["GET"])
+@conditional_get("mechanics")
 def get_all_mechanics():
-    mechanics = Mechanic.query.all()
-
-    result = []
-    for m in mechanics:
-        result.append({
-            "id": m.id,
-            "name": m.name,
-            "phone": m.phone,
-            "specialization": m.specialization,
-            "is_available": m.is_available,
-            "created_at": m.created_at
-        })
+    try:
+        query, keys, descending = MECHANIC_FILTERS.apply(Mechanic.query, request.args)
+        mechanics, next_cursor = paginate(query, keys, request.args, descending)
+    except ValueError as e:
+        return bad_request(str(e))
 
-    return success_response(result,status_code=200)
+    return success_response(
+        data=mechanic_serializer.dump_many(mechanics),
+        status_code=200,
+        next_cursor=next_cursor
+    )
 
 
 # ✅ Get Single Mechanic
 @mechanic_bp.route("/<int:id>", methods=["GET"])
+@conditional_get("mechanics")
 def get_mechanic(id):
     mechanic = Mechanic.query.get_or_404(id)
 
     return success_response(
-        data={
-        "id": mechanic.id,
-        "name": mechanic.name,
-        "phone": mechanic.phone,
-        "specialization": mechanic.specialization,
-        "is_available": mechanic.is_available,
-        "created_at": mechanic.created_at
-    },
-    status_code=200)
+        data=mechanic_serializer.dump(mechanic),
+        status_code=200
+    )
 
 
 # ✅ Update Mechanic
@@ -0,0 +1,26 @@
+# routes/metrics_routes.py
+
+import hmac
+
+from flask import Blueprint, current_app, request
+from utils.error_handlers import unauthorized
+from utils.metrics import request_metrics
+
+metrics_bp = Blueprint("metrics", __name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# 📈 PROMETHEUS SCRAPE
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    # 🔒 with METRICS_TOKEN set, scrapers must send it as a bearer token
+    token = current_app.config["METRICS_TOKEN"]
+    if token:
+        sent = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(sent.encode(), f"Bearer {token}".encode()):
+            return unauthorized("Metrics token required")
+
+    return current_app.response_class(
+        request_metrics.render(), content_type=PROMETHEUS_CONTENT_TYPE
+    )
@@ -0,0 +1,63 @@
+# routes/report_routes.py
+
+from flask import Blueprint, current_app, request
+from utils.auth import login_required, admin_required
+from utils.error_handlers import bad_request
+from utils.response import success_response
+from utils.revenue import get_report_args, revenue_report
+from utils.turnaround import get_turnaround_args, turnaround_report
+from utils.query_profiler import slow_query_log
+
+report_bp = Blueprint("report", __name__, url_prefix="/api/reports")
+
+
+# 🔒 ONLY ADMIN CAN VIEW REVENUE
+@report_bp.route("/revenue", methods=["GET"])
+@login_required
+@admin_required
+def get_revenue_report():
+    try:
+        granularity, start, end, group_by = get_report_args(request.args)
+    except ValueError as e:
+        return bad_request(str(e))
+
+    return success_response(
+        data=revenue_report(granularity, start, end, group_by),
+        granularity=granularity
+    )
+
+
+# 🔒 ONLY ADMIN CAN VIEW BAY THROUGHPUT
+@report_bp.route("/turnaround", methods=["GET"])
+@login_required
+@admin_required
+def get_turnaround_report():
+    try:
+        start, end, group_by = get_turnaround_args(request.args)
+    except ValueError as e:
+        return bad_request(str(e))
+
+    return success_response(
+        data=turnaround_report(start, end, group_by),
+        window={"from": start.isoformat(), "to": end.isoformat()}
+    )
+
+
+# 🔒 ONLY ADMIN CAN VIEW THE SLOW-QUERY LOG
+@report_bp.route("/slow-queries", methods=["GET"])
+@login_required
+@admin_required
+def get_slow_queries():
+    return success_response(
+        data=slow_query_log.summary(),
+        threshold_ms=current_app.config["SLOW_QUERY_MS"]
+    )
+
+
+# 🔒 ONLY ADMIN CAN CLEAR THE SLOW-QUERY LOG
+@report_bp.route("/slow-queries", methods=["DELETE"])
+@login_required
+@admin_required
+def clear_slow_queries():
+    slow_query_log.clear()
+    return success_response(message="Slow-query log cleared")
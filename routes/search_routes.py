@@ -0,0 +1,47 @@
+# routes/search_routes.py
+
+from flask import Blueprint, request
+from utils.auth import login_required
+from utils.error_handlers import bad_request
+from utils.response import success_response
+from utils.search import get_search_args, search_customers, search_vehicles
+from utils.serializers import customer_serializer, vehicle_serializer
+
+search_bp = Blueprint("search", __name__, url_prefix="/api/search")
+
+
+def _ranked(serializer, matches):
+    results = []
+    for row, score in matches:
+        item = serializer.dump(row)
+        item["score"] = round(score, 4)
+        results.append(item)
+    return results
+
+
+# 🔍 Search Customers (name / phone / email)
+@search_bp.route("/customers", methods=["GET"])
+@login_required
+def search_customers_api():
+    try:
+        term, limit = get_search_args(request.args)
+    except ValueError as e:
+        return bad_request(str(e))
+
+    return success_response(
+        data=_ranked(customer_serializer, search_customers(term, limit))
+    )
+
+
+# 🔍 Search Vehicles (number / brand / model)
+@search_bp.route("/vehicles", methods=["GET"])
+@login_required
+def search_vehicles_api():
+    try:
+        term, limit = get_search_args(request.args)
+    except ValueError as e:
+        return bad_request(str(e))
+
+    return success_response(
+        data=_ranked(vehicle_serializer, search_vehicles(term, limit))
+    )
@@ -4,10 +4,26 @@ from extensions import db
 from models.service_request import ServiceRequest
 from models.vehicle import Vehicle
 from models.mechanic import Mechanic
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 from utils.validators import get_json_data, require_fields,validate_enum
-from utils.error_handlers import bad_request,not_found,server_error
-from utils.response import success_response
+from utils.error_handlers import bad_request,not_found,server_error,conflict
+from utils.response import success_response, error_response
+from utils.pagination import paginate
+from utils.filters import SERVICE_FILTERS
+from utils.export import EXPORT_FORMATS, export_response
+from utils.auth import login_required
+from utils.assignment import (
+    assign_service, claim_mechanics, transition_services, AssignmentError
+)
+from utils.bulk import (
+    get_bulk_items, existing_values, insert_rows, row_error, bulk_response, to_int,
+    get_bulk_ids, id_result, id_error, bulk_update_response, invalid_field,
+    as_text
+)
+from utils.serializers import service_serializer, service_created_serializer
+from utils.status_history import record_status_changes
+from utils.conditional import conditional_get
 
 
 service_bp = Blueprint("service_bp", __name__, url_prefix="/services")
@@ -39,13 +55,6 @@ def create_service():
     if not vehicle:
         return not_found("Vehicle not found")
 
-    # Validate assigned mechanic (optional)
-    assigned_mechanic_id = data.get("assigned_mechanic_id")
-    if assigned_mechanic_id:
-        mechanic = Mechanic.query.get(assigned_mechanic_id)
-        if not mechanic:
-            return not_found("Assigned mechanic not found")
-
     # Convert service_date
     try:
         service_date = datetime.strptime(
@@ -59,73 +68,177 @@ def create_service():
         service_type=data["service_type"],
         service_date=service_date,
         problem_description=data["problem_description"],
-        assigned_mechanic_id=assigned_mechanic_id,
         status="Pending"
     )
 
+    # Claim assigned mechanic (optional, "auto" picks any free one)
+    try:
+        assign_service(service, data.get("assigned_mechanic_id"), "Pending")
+    except AssignmentError as e:
+        db.session.rollback()
+        return error_response(e.message, e.status_code)
+
     db.session.add(service)
     db.session.commit()
 
     return success_response(
         message="Service request created",
-        data = {
-            "id": service.id,
-            "status": service.status,
-            "assigned_mechanic_id": assigned_mechanic_id
-        },
+        data=service_created_serializer.dump(service),
         status_code=201
     )
 
 
+# ---------------------------
+# BULK CREATE SERVICE REQUESTS
+# POST /services/bulk
+# ---------------------------
+@service_bp.route("/bulk", methods=["POST"])
+def create_services_bulk():
+    try:
+        items = get_bulk_items(get_json_data(request))
+    except ValueError as e:
+        return bad_request(str(e))
+
+    required_fields = [
+        "vehicle_id",
+        "service_type",
+        "service_date",
+        "problem_description"
+    ]
+    items = [as_text(item, ["service_type", "problem_description"]) for item in items]
+
+    # set-based existence checks for the whole batch
+    vehicle_ids = existing_values(
+        Vehicle.id, [to_int(item.get("vehicle_id")) for item in items]
+    )
+    mechanic_ids = existing_values(
+        Mechanic.id, [to_int(item.get("assigned_mechanic_id")) for item in items]
+    )
+
+    results = [None] * len(items)
+    rows, indexes = [], []
+    for index, item in enumerate(items):
+        if not require_fields(item, required_fields):
+            results[index] = row_error(index, "Missing required service fields")
+            continue
+        bad_field = invalid_field(item, required_fields + ["assigned_mechanic_id"])
+        if bad_field:
+            results[index] = row_error(index, f"{bad_field} must be a string or number")
+            continue
+        if to_int(item["vehicle_id"]) not in vehicle_ids:
+            results[index] = row_error(index, "Vehicle not found")
+            continue
+
+        assigned_mechanic_id = item.get("assigned_mechanic_id")
+        if assigned_mechanic_id and to_int(assigned_mechanic_id) not in mechanic_ids:
+            results[index] = row_error(index, "Assigned mechanic not found")
+            continue
+
+        try:
+            service_date = datetime.strptime(
+                item["service_date"], "%Y-%m-%d"
+            ).date()
+        except (TypeError, ValueError):
+            results[index] = row_error(index, "service_date must be YYYY-MM-DD")
+            continue
+
+        indexes.append(index)
+        rows.append({
+            "vehicle_id": to_int(item["vehicle_id"]),
+            "service_type": item["service_type"],
+            "service_date": service_date,
+            "problem_description": item["problem_description"],
+            "assigned_mechanic_id": to_int(assigned_mechanic_id),
+            "status": "Pending"
+        })
+
+    # claim every requested mechanic in one statement; a mechanic can
+    # only take one of the new jobs
+    claimed = claim_mechanics({row["assigned_mechanic_id"] for row in rows})
+    kept_rows, kept_indexes = [], []
+    for index, row in zip(indexes, rows):
+        mechanic_id = row["assigned_mechanic_id"]
+        if mechanic_id:
+            if mechanic_id not in claimed:
+                results[index] = row_error(index, "Selected mechanic is not available")
+                continue
+            claimed.discard(mechanic_id)
+        kept_rows.append(row)
+        kept_indexes.append(index)
+
+    try:
+        ids = insert_rows(ServiceRequest, kept_rows)
+        record_status_changes(
+            db.session.connection(), [(i, None, "Pending") for i in ids]
+        )
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return conflict("Batch conflicts with concurrent changes, nothing was saved")
+
+    return bulk_response("Service requests processed", results, kept_indexes, ids)
+
+
 # ---------------------------
 # GET ALL SERVICE REQUESTS
 # GET /services
 # ---------------------------
 @service_bp.route("/", methods=["GET"])
+@conditional_get("service_requests")
 def get_all_services():
-    services = ServiceRequest.query.all()
-
-    services_data = []
-    for service in services:
-        services_data.append({
-            "id": service.id,
-            "vehicle_id": service.vehicle_id,
-            "service_type": service.service_type,
-            "service_date": service.service_date.isoformat(),
-            "problem_description": service.problem_description,
-            "status": service.status,
-            "assigned_mechanic_id": service.assigned_mechanic_id,
-            "created_at": service.created_at.isoformat()
-        })
+    try:
+        query, keys, descending = SERVICE_FILTERS.apply(ServiceRequest.query, request.args)
+        services, next_cursor = paginate(query, keys, request.args, descending)
+    except ValueError as e:
+        return bad_request(str(e))
 
     return success_response(
-        data=services_data,
-        status_code=200
+        data=service_serializer.dump_many(services),
+        status_code=200,
+        next_cursor=next_cursor
     )
 
 
+# ---------------------------
+# EXPORT SERVICE REQUESTS
+# GET /services/export?format=ndjson|csv
+# ---------------------------
+@service_bp.route("/export", methods=["GET"])
+@login_required
+def export_services():
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in EXPORT_FORMATS:
+        return bad_request("format must be ndjson or csv")
+
+    stmt = select(
+        ServiceRequest.id,
+        ServiceRequest.vehicle_id,
+        ServiceRequest.service_type,
+        ServiceRequest.service_date,
+        ServiceRequest.problem_description,
+        ServiceRequest.status,
+        ServiceRequest.assigned_mechanic_id,
+        ServiceRequest.created_at
+    ).order_by(ServiceRequest.id)
+
+    return export_response(stmt, "services", fmt)
+
+
 # ---------------------------
 # GET SINGLE SERVICE REQUEST
 # GET /services/<id>
 # ---------------------------
 @service_bp.route("/<int:service_id>", methods=["GET"])
+@conditional_get("service_requests")
 def get_service(service_id):
     service = ServiceRequest.query.get(service_id)
     if not service:
         return not_found("Service request not found")
 
     return success_response(
-        data={
-        "id": service.id,
-        "vehicle_id": service.vehicle_id,
-        "service_type": service.service_type,
-        "service_date": service.service_date.isoformat(),
-        "problem_description": service.problem_description,
-        "status": service.status,
-        "assigned_mechanic_id": service.assigned_mechanic_id,
-        "created_at": service.created_at.isoformat()
-    },
-    status_code=200)
+        data=service_serializer.dump(service),
+        status_code=200
+    )
 
 
 # ---------------------------
@@ -153,14 +266,80 @@ def update_service(service_id):
     if "problem_description" in data:
         service.problem_description = data["problem_description"]
 
-    if "assigned_mechanic_id" in data:
-        service.assigned_mechanic_id = data["assigned_mechanic_id"]
+    # status and mechanic go through the assignment engine together
+    if "status" in data or "assigned_mechanic_id" in data:
+        try:
+            assign_service(
+                service,
+                data.get("assigned_mechanic_id", service.assigned_mechanic_id),
+                data.get("status", service.status)
+            )
+        except AssignmentError as e:
+            db.session.rollback()
+            return error_response(e.message, e.status_code)
 
     db.session.commit()
 
     return success_response(message="Service status updated successfully")
 
 
+# ---------------------------
+# BULK UPDATE SERVICE STATUS
+# PATCH /services
+# ---------------------------
+@service_bp.route("/", methods=["PATCH"])
+@login_required
+def update_services_bulk():
+    try:
+        ids, status = get_bulk_ids(get_json_data(request), "status", ALLOWED_STATUS)
+    except ValueError as e:
+        return bad_request(str(e))
+
+    # lock the rows, in id order, until the UPDATE commits
+    rows = db.session.execute(
+        select(
+            ServiceRequest.id,
+            ServiceRequest.status,
+            ServiceRequest.assigned_mechanic_id
+        )
+        .where(ServiceRequest.id.in_(ids))
+        .order_by(ServiceRequest.id)
+        .with_for_update()
+    ).all()
+    current = {row.id: row for row in rows}
+
+    errors = transition_services(
+        [row for row in rows if row.status != status], status
+    )
+    changed = [
+        row for row in rows if row.status != status and row.id not in errors
+    ]
+
+    results = []
+    for id in ids:
+        if id not in current:
+            results.append(id_error(id, "Service request not found"))
+        elif id in errors:
+            results.append(id_error(id, errors[id].message))
+        else:
+            results.append(id_result(id, current[id].status != status))
+
+    if changed:
+        db.session.execute(
+            update(ServiceRequest)
+            .where(ServiceRequest.id.in_([row.id for row in changed]))
+            .values(status=status)
+        )
+        # a bulk UPDATE skips the status history mapper events
+        record_status_changes(
+            db.session.connection(),
+            [(row.id, row.status, status) for row in changed]
+        )
+    db.session.commit()
+
+    return bulk_update_response("Service requests processed", results)
+
+
 # ---------------------------
 # DELETE SERVICE REQUEST
 # DELETE /services/<id>
@@ -9,6 +9,12 @@ from models.mechanic import Mechanic
 from models.invoice import Invoice
 from functools import wraps
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from utils.dashboard_stats import get_dashboard_stats
+from utils.auth import get_current_user, get_current_role, login_user
+from utils.login_security import HasherBusy, check_login, login_throttle
+from utils.assignment import assign_service, AssignmentError
+from utils.search import get_search_args, search_customers, search_vehicles
 
 ui = Blueprint("ui", __name__)
 
@@ -18,7 +24,6 @@ def login_required(view):
     @wraps(view)
     def wrapped(*args, **kwargs):
         if "user_id" not in session:
-            flash("Please login first", "danger")
             return redirect(url_for("ui.login"))
         return view(*args, **kwargs)
     return wrapped
@@ -28,9 +33,8 @@ def role_required(*roles):
     def decorator(view):
         @wraps(view)
         def wrapped(*args, **kwargs):
-            user = User.query.get(session.get("user_id"))
-
-            if not user or user.role not in roles:
+            # reuses the identity resolved in load_logged_in_user
+            if get_current_role() not in roles:
                 flash("Access denied", "danger")
                 return redirect(url_for("ui.dashboard"))
 
@@ -38,56 +42,20 @@ def role_required(*roles):
         return wrapped
     return decorator
 
-@ui.before_app_request
-def load_logged_in_user():
-    user_id = session.get("user_id")
-    g.user = User.query.get(user_id) if user_id else None
-
-# ---------- login required helper ----------
-
-def login_required(view):
-    @wraps(view)
-    def wrapped(*args, **kwargs):
-        if "user_id" not in session:
-            return redirect(url_for("ui.login"))
-        return view(*args, **kwargs)
-    return wrapped
-
-@ui.before_app_request
+# UI pages only: API requests resolve the user lazily, if at all
+@ui.before_request
 def load_logged_in_user():
-    user_id = session.get("user_id")
-    g.user = User.query.get(user_id) if user_id else None
+    g.user = get_current_user()
 
 
 # ---------- Dashboard ----------
 @ui.route("/")
 @login_required
 def dashboard():
-    total_customers = Customer.query.count()
-    total_vehicles = Vehicle.query.count()
-    total_mechanics = Mechanic.query.count()
-
-    available_mechanics = Mechanic.query.filter_by(is_available=True).count()
-
-    pending_services = ServiceRequest.query.filter_by(status="Pending").count()
-    completed_services = ServiceRequest.query.filter_by(status="Completed").count()
+    # all nine counters, cached and invalidated on writes
+    stats = get_dashboard_stats()
 
-    total_invoices = Invoice.query.count()
-    paid_invoices = Invoice.query.filter_by(payment_status="Paid").count()
-    pending_invoices = Invoice.query.filter_by(payment_status="Pending").count()
-
-    return render_template(
-        "dashboard.html",
-        total_customers=total_customers,
-        total_vehicles=total_vehicles,
-        total_mechanics=total_mechanics,
-        available_mechanics=available_mechanics,
-        pending_services=pending_services,
-        completed_services=completed_services,
-        total_invoices=total_invoices,
-        paid_invoices=paid_invoices,
-        pending_invoices=pending_invoices
-    )
+    return render_template("dashboard.html", **stats)
 
 # ---------- Register ----------
 @ui.route("/register", methods=["GET", "POST"])
@@ -111,10 +79,24 @@ def register():
 @ui.route("/login", methods=["GET", "POST"])
 def login():
     if request.method == "POST":
-        user = User.query.filter_by(username=request.form["username"]).first()
+        username = request.form["username"]
 
-        if user and user.check_password(request.form["password"]):
-            session["user_id"] = user.id
+        wait = login_throttle().hit(request.remote_addr, username)
+        if wait:
+            flash("Too many login attempts, try again later", "danger")
+            return render_template("auth/login.html"), 429
+
+        user = User.query.filter_by(username=username).first()
+
+        try:
+            valid = check_login(user, request.form["password"])
+        except HasherBusy:
+            flash("Login is busy, try again shortly", "danger")
+            return render_template("auth/login.html"), 503
+
+        if valid:
+            login_throttle().record_success(request.remote_addr, username)
+            login_user(user)
             flash("Login successful", "success")
             return redirect(url_for("ui.dashboard"))
 
@@ -135,8 +117,17 @@ def logout():
 @login_required
 @role_required("admin")
 def customers_list():
+    q = request.args.get("q", "").strip()
+    if q:
+        try:
+            term, limit = get_search_args({"q": q, "limit": 100})
+            customers = [c for c, _ in search_customers(term, limit)]
+            return render_template("customers/list.html", customers=customers, q=q)
+        except ValueError as e:
+            flash(str(e), "danger")
+
     customers = Customer.query.all()
-    return render_template("customers/list.html", customers=customers)
+    return render_template("customers/list.html", customers=customers, q=q)
 
 @ui.route("/customers/create", methods=["GET", "POST"])
 @login_required
@@ -213,15 +204,25 @@ def customers_delete(id):
 @ui.route("/vehicles")
 @login_required
 def vehicles_list():
-    vehicles = Vehicle.query.all()
-    return render_template("vehicles/list.html", vehicles=vehicles)
+    # template shows v.customer.name
+    q = request.args.get("q", "").strip()
+    if q:
+        try:
+            term, limit = get_search_args({"q": q, "limit": 100})
+            matches = search_vehicles(term, limit, options=[joinedload(Vehicle.customer)])
+            vehicles = [v for v, _ in matches]
+            return render_template("vehicles/list.html", vehicles=vehicles, q=q)
+        except ValueError as e:
+            flash(str(e), "danger")
+
+    vehicles = Vehicle.query.options(joinedload(Vehicle.customer)).all()
+    return render_template("vehicles/list.html", vehicles=vehicles, q=q)
 
 @ui.route("/vehicles/create", methods=["GET", "POST"])
 @login_required
 @role_required("admin", "staff")
 def vehicles_create():
-    customers = Customer.query.all()
-
+    # the customer picker loads its options from /api/lookup/customers
     if request.method == "POST":
         vehicle_number = request.form["vehicle_number"]
 
@@ -259,17 +260,13 @@ def vehicles_create():
             )
             return redirect(url_for("ui.vehicles_create"))
 
-    return render_template(
-        "vehicles/create.html",
-        customers=customers
-    )
+    return render_template("vehicles/create.html")
 
 @ui.route("/vehicles/<int:id>/update", methods=["GET", "POST"])
 @login_required
 @role_required("admin", "staff")
 def vehicles_update(id):
     vehicle = Vehicle.query.get_or_404(id)
-    customers = Customer.query.all()
 
     if request.method == "POST":
         # Prevent duplicate vehicle number (same as API logic)
@@ -293,8 +290,7 @@ def vehicles_update(id):
 
     return render_template(
         "vehicles/update.html",
-        vehicle=vehicle,
-        customers=customers
+        vehicle=vehicle
     )
 
 @ui.route("/vehicles/<int:id>/delete", methods=["POST"])
@@ -315,105 +311,61 @@ def vehicles_delete(id):
 @login_required
 @role_required("admin", "staff")
 def services_list():
-    services = ServiceRequest.query.all()
+    # template shows s.vehicle.vehicle_number and s.mechanic.name
+    services = ServiceRequest.query.options(
+        joinedload(ServiceRequest.vehicle),
+        joinedload(ServiceRequest.mechanic)
+    ).all()
     return render_template("services/list.html", services=services)
 
 @ui.route("/services/create", methods=["GET", "POST"])
 @login_required
 @role_required("admin", "staff")
 def services_create():
-    vehicles = Vehicle.query.all()
-    mechanics = Mechanic.query.filter_by(is_available=True).all()
-
+    # vehicle and mechanic pickers load their options from /api/lookup
     if request.method == "POST":
-        mechanic_id = request.form.get("mechanic_id")
-
-        # 🔒 BACKEND VALIDATION (IMPORTANT)
-        mechanic = None
-        if mechanic_id:
-            mechanic = Mechanic.query.get(mechanic_id)
-
-            if not mechanic or not mechanic.is_available:
-                flash("Selected mechanic is not available", "danger")
-                return redirect(url_for("ui.services_create"))
-
         service = ServiceRequest(
             vehicle_id=request.form["vehicle_id"],
             service_type=request.form["service_type"],
             service_date=request.form["service_date"],
             problem_description=request.form["problem_description"],
-            assigned_mechanic_id=mechanic_id
+            status="Pending"
         )
 
-        db.session.add(service)
-
-        # 🔄 AUTO UPDATE MECHANIC AVAILABILITY
-        if mechanic:
-            mechanic.is_available = False
+        # 🔒 ATOMIC MECHANIC CLAIM (safe under concurrent bookings)
+        try:
+            assign_service(service, request.form.get("mechanic_id"), "Pending")
+        except AssignmentError as e:
+            db.session.rollback()
+            flash(e.message, "danger")
+            return redirect(url_for("ui.services_create"))
 
+        db.session.add(service)
         db.session.commit()
 
         flash("Service request created successfully", "success")
         return redirect(url_for("ui.services_list"))
 
-    return render_template(
-        "services/create.html",
-        vehicles=vehicles,
-        mechanics=mechanics
-    )
+    return render_template("services/create.html")
 
 @ui.route("/services/<int:service_id>/update", methods=["GET", "POST"])
 @login_required
 @role_required("admin", "staff")
 def services_update(service_id):
     service = ServiceRequest.query.get_or_404(service_id)
-    vehicles = Vehicle.query.all()
-    mechanics = Mechanic.query.all()
 
     if request.method == "POST":
-        old_mechanic_id = service.assigned_mechanic_id
-
-        new_mechanic_id = request.form.get("mechanic_id")
-        new_status = request.form.get("status")
-
-        # 🔒 VALIDATE MECHANIC
-        new_mechanic = None
-        if new_mechanic_id:
-            new_mechanic = Mechanic.query.get(new_mechanic_id)
-
-            if not new_mechanic:
-                flash("Invalid mechanic selected", "danger")
-                return redirect(url_for("ui.services_update", service_id=service_id))
-
-            # Prevent assigning unavailable mechanic (unless same mechanic)
-            if (
-                old_mechanic_id != int(new_mechanic_id)
-                and not new_mechanic.is_available
-            ):
-                flash("Selected mechanic is not available", "danger")
-                return redirect(url_for("ui.services_update", service_id=service_id))
-
-        # 🔄 RESTORE OLD MECHANIC
-        if old_mechanic_id:
-            old_mechanic = Mechanic.query.get(old_mechanic_id)
-
-            if old_mechanic:
-                # If service completed OR mechanic changed
-                if new_status == "Completed" or (
-                    new_mechanic_id and int(new_mechanic_id) != old_mechanic_id
-                ):
-                    old_mechanic.is_available = True
-
-        # 🔄 UPDATE NEW MECHANIC AVAILABILITY
-        if new_mechanic:
-            if new_status == "Completed":
-                new_mechanic.is_available = True
-            else:
-                new_mechanic.is_available = False
-
-        # 🔄 UPDATE SERVICE FIELDS
-        service.status = new_status
-        service.assigned_mechanic_id = new_mechanic_id
+        # 🔄 CLAIM NEW / RELEASE OLD MECHANIC AND UPDATE SERVICE FIELDS
+        try:
+            assign_service(
+                service,
+                request.form.get("mechanic_id"),
+                request.form.get("status")
+            )
+        except AssignmentError as e:
+            db.session.rollback()
+            flash(e.message, "danger")
+            return redirect(url_for("ui.services_update", service_id=service_id))
 
         db.session.commit()
 
@@ -422,9 +374,7 @@ def services_update(service_id):
 
     return render_template(
         "services/update.html",
-        service=service,
-        vehicles=vehicles,
-        mechanics=mechanics
+        service=service
     )
 
 
@@ -538,14 +488,21 @@ def mechanics_delete(id):
 @login_required
 @role_required("admin")
 def invoices_list():
-    invoices = Invoice.query.all()
+    # template shows i.customer.name and i.vehicle.vehicle_number
+    invoices = Invoice.query.options(
+        joinedload(Invoice.customer),
+        joinedload(Invoice.vehicle)
+    ).all()
     return render_template("invoices/list.html", invoices=invoices)
 
 @ui.route("/invoices/create", methods=["GET", "POST"])
 @login_required
 @role_required("admin")
 def invoices_create():
-    services = ServiceRequest.query.filter_by(status="Completed").all()
+    # template shows s.vehicle.vehicle_number / customer_id
+    services = ServiceRequest.query.options(
+        joinedload(ServiceRequest.vehicle)
+    ).filter_by(status="Completed").all()
 
     if request.method == "POST":
         invoice = Invoice(
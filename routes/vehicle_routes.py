@@ -1,10 +1,19 @@
 from flask import Blueprint, request
+from sqlalchemy.exc import IntegrityError
 from extensions import db
 from models.vehicle import Vehicle
 from models.customer import Customer
 from utils.validators import get_json_data, require_fields
 from utils.error_handlers import bad_request,not_found,conflict
 from utils.response import success_response
+from utils.pagination import paginate
+from utils.filters import VEHICLE_FILTERS
+from utils.bulk import (
+    get_bulk_items, existing_values, insert_rows, row_error, bulk_response, to_int,
+    invalid_field, as_text
+)
+from utils.serializers import vehicle_serializer, vehicle_created_serializer
+from utils.conditional import conditional_get
 
 
 vehicle_bp = Blueprint("vehicle_bp", __name__, url_prefix="/vehicles")
@@ -47,38 +56,86 @@ def create_vehicle():
 
     return success_response(
     message="Vehicle added successfully",
-    data={
-        "id": vehicle.id,
-        "vehicle_number": vehicle.vehicle_number,
-        "customer_id": vehicle.customer_id
-    },
+    data=vehicle_created_serializer.dump(vehicle),
     status_code=201
 ) 
 
 
+# ---------------------------
+# BULK CREATE VEHICLES
+# POST /vehicles/bulk
+# ---------------------------
+@vehicle_bp.route("/bulk", methods=["POST"])
+def create_vehicles_bulk():
+    try:
+        items = get_bulk_items(get_json_data(request))
+    except ValueError as e:
+        return bad_request(str(e))
+
+    required_fields = ["customer_id", "vehicle_number", "vehicle_type", "brand", "model"]
+    items = [
+        as_text(item, ["vehicle_number", "vehicle_type", "brand", "model"])
+        for item in items
+    ]
+
+    # set-based existence checks for the whole batch
+    customer_ids = existing_values(
+        Customer.id, [to_int(item.get("customer_id")) for item in items]
+    )
+    taken_numbers = existing_values(
+        Vehicle.vehicle_number, [item.get("vehicle_number") for item in items]
+    )
+
+    results = [None] * len(items)
+    rows, indexes = [], []
+    for index, item in enumerate(items):
+        bad_field = invalid_field(item, required_fields)
+        if not require_fields(item, required_fields):
+            results[index] = row_error(index, "Missing required vehicle fields")
+        elif bad_field:
+            results[index] = row_error(index, f"{bad_field} must be a string or number")
+        elif to_int(item["customer_id"]) not in customer_ids:
+            results[index] = row_error(index, "Customer not found")
+        elif item["vehicle_number"] in taken_numbers:
+            results[index] = row_error(index, "Vehicle number already exists")
+        else:
+            taken_numbers.add(item["vehicle_number"])
+            indexes.append(index)
+            rows.append({
+                "customer_id": to_int(item["customer_id"]),
+                "vehicle_number": item["vehicle_number"],
+                "vehicle_type": item["vehicle_type"],
+                "brand": item["brand"],
+                "model": item["model"]
+            })
+
+    try:
+        ids = insert_rows(Vehicle, rows)
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return conflict("Batch conflicts with existing vehicles, nothing was saved")
+
+    return bulk_response("Vehicles processed", results, indexes, ids)
+
+
 # ---------------------------
 # GET ALL VEHICLES
 # GET /vehicles
 # ---------------------------
 @vehicle_bp.route("/", methods=["GET"])
+@conditional_get("vehicles")
 def get_all_vehicles():
-    vehicles = Vehicle.query.all()
-
-    vehicles_data = []
-    for vehicle in vehicles:
-        vehicles_data.append({
-            "id": vehicle.id,
-            "customer_id": vehicle.customer_id,
-            "vehicle_number": vehicle.vehicle_number,
-            "vehicle_type": vehicle.vehicle_type,
-            "brand": vehicle.brand,
-            "model": vehicle.model,
-            "created_at": vehicle.created_at.isoformat()
-        })
+    try:
+        query, keys, descending = VEHICLE_FILTERS.apply(Vehicle.query, request.args)
+        vehicles, next_cursor = paginate(query, keys, request.args, descending)
+    except ValueError as e:
+        return bad_request(str(e))
 
     return success_response(
-        data=vehicles_data,
-        status_code=200
+        data=vehicle_serializer.dump_many(vehicles),
+        status_code=200,
+        next_cursor=next_cursor
     )
 
 
@@ -88,22 +145,16 @@ def get_all_vehicles():
 # GET /vehicles/<id>
 # ---------------------------
 @vehicle_bp.route("/<int:vehicle_id>", methods=["GET"])
+@conditional_get("vehicles")
 def get_vehicle(vehicle_id):
     vehicle = Vehicle.query.get(vehicle_id)
     if not vehicle:
         return not_found("Vehicle not found")
 
     return success_response(
-        data={
-        "id": vehicle.id,
-        "customer_id": vehicle.customer_id,
-        "vehicle_number": vehicle.vehicle_number,
-        "vehicle_type": vehicle.vehicle_type,
-        "brand": vehicle.brand,
-        "model": vehicle.model,
-        "created_at": vehicle.created_at.isoformat()
-    },
-    status_code=200)
+        data=vehicle_serializer.dump(vehicle),
+        status_code=200
+    )
 
 
 # ---------------------------
@@ -0,0 +1,103 @@
+// Lazily populated <select> pickers backed by the /api/lookup endpoints.
+//
+//   <input type="search" data-lookup-filter="customer_id" placeholder="Type to search">
+//   <select name="customer_id" data-lookup="/api/lookup/customers"
+//           data-label="name" data-detail="phone">
+//       <option value="" data-static>Select Customer</option>
+//       <option value="12" selected>Current customer</option>
+//   </select>
+//
+// Options marked data-static and the selected option are rendered by the
+// server; everything else is fetched a page at a time on first focus or
+// while typing in the filter box.
+(function () {
+    const MORE = "__more__";
+    const DEBOUNCE_MS = 250;
+
+    function optionText(select, item) {
+        let text = item[select.dataset.label];
+        const detail = select.dataset.detail && item[select.dataset.detail];
+        if (detail) text += " – " + detail;
+        if (item.is_available === false) text += " (Unavailable)";
+        return text;
+    }
+
+    function render(select, body, append, query) {
+        const more = select.querySelector(`option[value="${MORE}"]`);
+        if (more) more.remove();
+
+        if (!append) {
+            Array.from(select.options).forEach((opt) => {
+                if (!opt.hasAttribute("data-static") && !opt.selected) opt.remove();
+            });
+        }
+
+        const present = new Set(Array.from(select.options, (opt) => opt.value));
+        body.data.forEach((item) => {
+            if (!present.has(String(item.id))) {
+                select.add(new Option(optionText(select, item), item.id));
+            }
+        });
+
+        if (body.next_cursor) {
+            const opt = new Option("More…", MORE);
+            opt.dataset.after = body.next_cursor;
+            opt.dataset.query = query;
+            select.add(opt);
+        }
+    }
+
+    function load(select, query, after) {
+        const url = new URL(select.dataset.lookup, window.location.origin);
+        if (query) url.searchParams.set("q", query);
+        if (after) url.searchParams.set("after", after);
+
+        // only the newest request may render, replies can arrive out of order
+        const token = (select._lookupToken || 0) + 1;
+        select._lookupToken = token;
+
+        return fetch(url, { credentials: "same-origin" })
+            .then((response) => response.json())
+            .then((body) => {
+                if (token === select._lookupToken && body.success) {
+                    render(select, body, Boolean(after), query);
+                }
+            });
+    }
+
+    function init(select) {
+        const filter = document.querySelector(`[data-lookup-filter="${select.name}"]`);
+        let loaded = false;
+        let timer = null;
+        select._lookupValue = select.value;
+
+        select.addEventListener("focus", () => {
+            if (!loaded) {
+                loaded = true;
+                load(select, filter ? filter.value.trim() : "");
+            }
+        });
+
+        select.addEventListener("change", () => {
+            const chosen = select.options[select.selectedIndex];
+            if (chosen && chosen.value === MORE) {
+                select.value = select._lookupValue;
+                load(select, chosen.dataset.query, chosen.dataset.after);
+            } else {
+                select._lookupValue = select.value;
+            }
+        });
+
+        if (filter) {
+            filter.addEventListener("input", () => {
+                clearTimeout(timer);
+                timer = setTimeout(() => {
+                    loaded = true;
+                    load(select, filter.value.trim());
+                }, DEBOUNCE_MS);
+            });
+        }
+    }
+
+    document.querySelectorAll("select[data-lookup]").forEach(init);
+})();
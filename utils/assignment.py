@@ -0,0 +1,197 @@
+from sqlalchemy import select, update
+
+from extensions import db
+from models.mechanic import Mechanic
+
+
+class AssignmentError(Exception):
+    status_code = 409
+
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+
+class MechanicNotFound(AssignmentError):
+    status_code = 404
+
+
+class MechanicUnavailable(AssignmentError):
+    pass
+
+
+# form / JSON value asking for any free mechanic
+AUTO_ASSIGN = "auto"
+
+
+# A mechanic is held by a service while it is assigned and not Completed.
+def _held(mechanic_id, status):
+    return mechanic_id if mechanic_id and status != "Completed" else None
+
+
+def _uses_row_locks():
+    return db.session.get_bind().dialect.name == "postgresql"
+
+
+# ---------------------------
+# CLAIM / RELEASE
+# ---------------------------
+def claim_mechanics(mechanic_ids):
+    """Atomically mark available mechanics busy; return the ids claimed.
+
+    Postgres locks the candidate rows with ``FOR UPDATE SKIP LOCKED`` so a
+    desk never waits behind another desk claiming the same mechanic, it
+    just loses the race. Other databases use a compare-and-set UPDATE
+    that only matches rows still flagged available.
+    """
+    mechanic_ids = {i for i in mechanic_ids if i}
+    if not mechanic_ids:
+        return set()
+
+    available = Mechanic.is_available == True  # noqa: E712
+
+    if _uses_row_locks():
+        locked = set(db.session.scalars(
+            select(Mechanic.id)
+            .where(Mechanic.id.in_(mechanic_ids), available)
+            .with_for_update(skip_locked=True)
+        ))
+        if locked:
+            db.session.execute(
+                update(Mechanic)
+                .where(Mechanic.id.in_(locked))
+                .values(is_available=False)
+            )
+        return locked
+
+    stmt = (
+        update(Mechanic)
+        .where(Mechanic.id.in_(mechanic_ids), available)
+        .values(is_available=False)
+    )
+    if db.session.get_bind().dialect.update_returning:
+        return set(db.session.scalars(stmt.returning(Mechanic.id)))
+
+    claimed = set()
+    for mechanic_id in mechanic_ids:
+        result = db.session.execute(stmt.where(Mechanic.id == mechanic_id))
+        if result.rowcount == 1:
+            claimed.add(mechanic_id)
+    return claimed
+
+
+def claim_mechanic(mechanic_id):
+    if claim_mechanics({mechanic_id}):
+        return
+    if db.session.get(Mechanic, mechanic_id) is None:
+        raise MechanicNotFound("Assigned mechanic not found")
+    raise MechanicUnavailable("Selected mechanic is not available")
+
+
+def claim_next_available(specialization=None, attempts=5):
+    """Claim any free mechanic (optionally by specialization) and return its id."""
+    candidates = select(Mechanic.id).where(Mechanic.is_available == True)  # noqa: E712
+    if specialization:
+        candidates = candidates.where(Mechanic.specialization == specialization)
+    candidates = candidates.order_by(Mechanic.id)
+
+    if _uses_row_locks():
+        mechanic_id = db.session.scalar(
+            candidates.limit(1).with_for_update(skip_locked=True)
+        )
+        if mechanic_id is not None:
+            db.session.execute(
+                update(Mechanic)
+                .where(Mechanic.id == mechanic_id)
+                .values(is_available=False)
+            )
+            return mechanic_id
+    else:
+        # compare-and-set over a few candidates; losing a race moves on
+        for mechanic_id in db.session.scalars(candidates.limit(attempts)):
+            if claim_mechanics({mechanic_id}):
+                return mechanic_id
+
+    raise MechanicUnavailable("No mechanic is available")
+
+
+def release_mechanics(mechanic_ids):
+    mechanic_ids = {i for i in mechanic_ids if i}
+    if mechanic_ids:
+        db.session.execute(
+            update(Mechanic)
+            .where(Mechanic.id.in_(mechanic_ids))
+            .values(is_available=True)
+        )
+
+
+# ---------------------------
+# SERVICE TRANSITIONS
+# ---------------------------
+def assign_service(service, mechanic_id, status):
+    """Move ``service`` to ``mechanic_id`` / ``status``, keeping the
+    mechanic availability flags consistent.
+
+    Claims before releasing, so on AssignmentError the caller only has to
+    roll back. Does not commit.
+    """
+    before = _held(service.assigned_mechanic_id, service.status)
+
+    if mechanic_id == AUTO_ASSIGN:
+        if status == "Completed":
+            raise AssignmentError("A completed service cannot be auto-assigned")
+        mechanic_id = claim_next_available()
+        release_mechanics({before})
+        service.assigned_mechanic_id = mechanic_id
+        service.status = status
+        return
+
+    try:
+        mechanic_id = int(mechanic_id) if mechanic_id else None
+    except (TypeError, ValueError):
+        raise MechanicNotFound("Assigned mechanic not found")
+
+    after = _held(mechanic_id, status)
+
+    if mechanic_id and mechanic_id != service.assigned_mechanic_id and not after:
+        # completed straight away: the mechanic only has to exist
+        if db.session.get(Mechanic, mechanic_id) is None:
+            raise MechanicNotFound("Assigned mechanic not found")
+
+    if before != after:
+        if after:
+            claim_mechanic(after)
+        release_mechanics({before})
+
+    service.assigned_mechanic_id = mechanic_id
+    service.status = status
+
+
+def transition_services(rows, status):
+    """Claim / release mechanics for moving ``rows`` (id, status,
+    assigned_mechanic_id) to ``status`` in one bulk UPDATE.
+
+    Returns ``{service_id: AssignmentError}`` for the services that cannot
+    move because their mechanic is busy; those must be left out of the
+    UPDATE. A mechanic is claimed for at most one service of the batch.
+    Claims before releasing, like assign_service. Does not commit.
+    """
+    wanted, released = [], set()
+    for row in rows:
+        before = _held(row.assigned_mechanic_id, row.status)
+        after = _held(row.assigned_mechanic_id, status)
+        if after and not before:
+            wanted.append((row.id, after))
+        elif before and not after:
+            released.add(before)
+
+    errors = {}
+    claimed = claim_mechanics({mechanic_id for _, mechanic_id in wanted})
+    for service_id, mechanic_id in wanted:
+        if mechanic_id in claimed:
+            claimed.discard(mechanic_id)
+        else:
+            errors[service_id] = MechanicUnavailable("Selected mechanic is not available")
+
+    release_mechanics(released)
+    return errors
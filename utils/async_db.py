@@ -0,0 +1,55 @@
+import os
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+# pool settings shared with the sync engine (see config.engine_options)
+POOL_OPTIONS = ("pool_pre_ping", "pool_size", "max_overflow", "pool_timeout", "pool_recycle")
+
+
+def async_database_url(database_url):
+    """The same database behind an async driver (asyncpg / aiosqlite).
+
+    Raises ValueError for a backend without a supported async driver.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+def create_async_db_engine(app):
+    """Async engine for the read endpoints served by asgi.py.
+
+    Uses ASYNC_DATABASE_URL when set, else DATABASE_URL with its driver
+    swapped, and mirrors the sync engine's pool settings.
+    """
+    url = make_url(
+        app.config["ASYNC_DATABASE_URL"]
+        or async_database_url(app.config["SQLALCHEMY_DATABASE_URI"])
+    )
+    sync_options = app.config["SQLALCHEMY_ENGINE_OPTIONS"]
+
+    options = {k: sync_options[k] for k in POOL_OPTIONS if k in sync_options}
+    if url.get_backend_name() == "postgresql":
+        connect_args = {}
+        if sync_options.get("poolclass") is NullPool:
+            # pgbouncer: no local pool and no server-side prepared statements
+            options["poolclass"] = NullPool
+            connect_args.update(statement_cache_size=0, prepared_statement_cache_size=0)
+        statement_timeout = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 0))
+        if statement_timeout:
+            connect_args["server_settings"] = {"statement_timeout": str(statement_timeout)}
+        if connect_args:
+            options["connect_args"] = connect_args
+
+    return create_async_engine(url, **options)
+
+
+def async_session_factory(engine):
+    # rows are serialised after the session closes: keep them loaded
+    return async_sessionmaker(engine, expire_on_commit=False)
@@ -0,0 +1,135 @@
+import re
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event, select
+
+from models.service_request import ServiceRequest
+from models.vehicle import Vehicle
+from models.invoice import Invoice
+from utils.filters import INVOICE_FILTERS, SERVICE_FILTERS, VEHICLE_FILTERS
+from utils.pagination import apply_keyset, finish_page, get_page_args
+from utils.response import error_body, success_body
+from utils.serializers import invoice_serializer, service_serializer, vehicle_serializer
+from utils.table_versions import collect_versions, versions_statement
+
+READ_ROUTES = []
+
+# [statements, seconds] of the request being served, for utils/metrics.py
+_sql_stats = ContextVar("async_sql_stats", default=None)
+
+
+# ---------------------------
+# ROUTE TABLE
+# ---------------------------
+def read_route(pattern, endpoint, table):
+    """Serve GET ``pattern`` from ``handler`` on the async engine.
+
+    ``endpoint`` is the Flask endpoint the path belongs to (for metrics),
+    ``table`` the table the ETag is derived from, as with
+    ``conditional_get``.
+    """
+    def register(handler):
+        READ_ROUTES.append((re.compile(pattern + r"\Z"), endpoint, table, handler))
+        return handler
+    return register
+
+
+def match_read_route(path):
+    for pattern, endpoint, table, handler in READ_ROUTES:
+        match = pattern.match(path)
+        if match:
+            return endpoint, table, handler, match.groupdict()
+    return None
+
+
+async def get_versions_async(session, *tables):
+    rows = await session.execute(versions_statement(tables))
+    return collect_versions(tables, rows)
+
+
+# ---------------------------
+# HANDLERS
+# ---------------------------
+async def _page(session, model, serializer, args, list_filter):
+    # same filters, sort order and cursors as the Flask list endpoints
+    try:
+        stmt, keys, descending = list_filter.apply(select(model), args)
+        limit, after = get_page_args(args)
+        stmt = apply_keyset(stmt, keys, limit, after, descending)
+    except ValueError as e:
+        return 400, error_body(str(e))
+
+    rows = (await session.scalars(stmt)).all()
+    rows, next_cursor = finish_page(rows, keys, limit)
+    return 200, success_body(data=serializer.dump_many(rows), next_cursor=next_cursor)
+
+
+async def _one(session, model, serializer, id, missing):
+    row = await session.get(model, int(id))
+    if row is None:
+        return 404, error_body(missing)
+    return 200, success_body(data=serializer.dump(row))
+
+
+@read_route(r"/services/", "service_bp.get_all_services", "service_requests")
+async def get_all_services(session, args):
+    return await _page(session, ServiceRequest, service_serializer, args, SERVICE_FILTERS)
+
+
+@read_route(r"/services/(?P<id>\d+)", "service_bp.get_service", "service_requests")
+async def get_service(session, args, id):
+    return await _one(session, ServiceRequest, service_serializer, id, "Service request not found")
+
+
+@read_route(r"/vehicles/", "vehicle_bp.get_all_vehicles", "vehicles")
+async def get_all_vehicles(session, args):
+    return await _page(session, Vehicle, vehicle_serializer, args, VEHICLE_FILTERS)
+
+
+@read_route(r"/vehicles/(?P<id>\d+)", "vehicle_bp.get_vehicle", "vehicles")
+async def get_vehicle(session, args, id):
+    return await _one(session, Vehicle, vehicle_serializer, id, "Vehicle not found")
+
+
+@read_route(r"/api/invoices/", "invoice.get_all_invoices", "invoices")
+async def get_all_invoices(session, args):
+    return await _page(session, Invoice, invoice_serializer, args, INVOICE_FILTERS)
+
+
+# ---------------------------
+# SQL FIGURES
+# ---------------------------
+def start_sql_stats():
+    stats = [0, 0.0]
+    _sql_stats.set(stats)
+    return stats
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("async_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("async_started")
+    stats = _sql_stats.get()
+    if started:
+        elapsed = time.perf_counter() - started.pop()
+        if stats is not None:
+            stats[0] += 1
+            stats[1] += elapsed
+
+
+def _on_error(exception_context):
+    # a failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("async_started"):
+        connection.info["async_started"].pop()
+
+
+def count_sql(engine):
+    """Count statements per request on the async engine's sync side."""
+    if not event.contains(engine.sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine.sync_engine, "handle_error", _on_error)
@@ -1,7 +1,52 @@
-from flask import session, jsonify
+from collections import namedtuple
+from flask import session, jsonify, g, current_app
 from functools import wraps
 from models.user import User
 
+# identity rebuilt from the signed session cookie (no database hit)
+SessionIdentity = namedtuple("SessionIdentity", ["id", "username", "role"])
+
+_UNSET = object()
+
+
+# ---------- IDENTITY ----------
+
+def login_user(user):
+    session["user_id"] = user.id
+    session["username"] = user.username
+    session["role"] = user.role
+
+
+def get_current_user():
+    """Resolve the logged-in user at most once per request.
+
+    With SESSION_ROLE_CLAIM enabled the identity comes straight from the
+    signed session; otherwise the User row is loaded and reused by every
+    decorator for the rest of the request.
+    """
+    user = g.get("_current_user", _UNSET)
+    if user is not _UNSET:
+        return user
+
+    user_id = session.get("user_id")
+    if not user_id:
+        user = None
+    elif current_app.config["SESSION_ROLE_CLAIM"] and "role" in session:
+        user = SessionIdentity(user_id, session.get("username"), session["role"])
+    else:
+        user = User.query.get(user_id)
+
+    g._current_user = user
+    return user
+
+
+def get_current_role():
+    user = get_current_user()
+    return user.role if user else None
+
+
+# ---------- API DECORATORS ----------
+
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -14,8 +59,7 @@ def login_required(f):
 def admin_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        user = User.query.get(session.get("user_id"))
-        if not user or user.role != "admin":
+        if get_current_role() != "admin":
             return jsonify({"error": "Admin access required"}), 403
         return f(*args, **kwargs)
     return decorated_function
@@ -0,0 +1,148 @@
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from extensions import db
+from utils.response import success_response
+
+MAX_BULK_ITEMS = 1000
+
+# JSON types a record field may hold; objects / arrays are rejected per row
+SCALAR_TYPES = (str, int, float)
+
+_UPSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+def get_bulk_items(data):
+    """Validate a bulk request body: a non-empty JSON array of objects.
+
+    Raises ValueError with a client-facing message on bad input.
+    """
+    if not isinstance(data, list) or not data:
+        raise ValueError("JSON array of records required")
+    if len(data) > MAX_BULK_ITEMS:
+        raise ValueError(f"At most {MAX_BULK_ITEMS} records per request")
+    if not all(isinstance(item, dict) for item in data):
+        raise ValueError("Every record must be a JSON object")
+    return data
+
+
+def get_bulk_ids(data, field, allowed):
+    """Validate a bulk status body: ``{"ids": [...], field: value}``.
+
+    Returns the ids (duplicates dropped, order kept) and the target
+    value. Raises ValueError with a client-facing message on bad input.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("JSON body required")
+
+    ids = data.get("ids")
+    if not isinstance(ids, list) or not ids:
+        raise ValueError("ids must be a non-empty list")
+    if len(ids) > MAX_BULK_ITEMS:
+        raise ValueError(f"At most {MAX_BULK_ITEMS} ids per request")
+    parsed = [to_int(i) for i in ids]
+    if None in parsed:
+        raise ValueError("ids must be integers")
+
+    value = data.get(field)
+    if value not in allowed:
+        raise ValueError(f"{field} must be one of " + ", ".join(allowed))
+    return list(dict.fromkeys(parsed)), value
+
+
+def invalid_field(item, fields):
+    """First of ``fields`` holding an object / array instead of a scalar."""
+    for field in fields:
+        value = item.get(field)
+        if value is not None and not isinstance(value, SCALAR_TYPES):
+            return field
+    return None
+
+
+def as_text(item, fields):
+    """``item`` with numbers in the string ``fields`` converted to ``str``.
+
+    The duplicate lookups compare against text columns, so ``555`` must
+    be checked (and stored) as ``"555"``.
+    """
+    return {
+        **item,
+        **{
+            field: str(item[field])
+            for field in fields
+            if isinstance(item.get(field), (int, float))
+        }
+    }
+
+
+def to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def existing_values(column, values):
+    # one IN (...) lookup for the whole batch instead of one query per row
+    values = {v for v in values if isinstance(v, SCALAR_TYPES) and v != ""}
+    if not values:
+        return set()
+    return set(db.session.scalars(select(column).where(column.in_(values))))
+
+
+def insert_rows(model, rows):
+    """executemany-style INSERT returning the new ids in row order."""
+    if not rows:
+        return []
+    stmt = insert(model).returning(model.id, sort_by_parameter_order=True)
+    return list(db.session.scalars(stmt, rows))
+
+
+def upsert_insert(dialect_name):
+    """Dialect ``insert()`` supporting ``on_conflict_do_update``, or None."""
+    return _UPSERTS.get(dialect_name)
+
+
+def row_error(index, message):
+    return {"index": index, "success": False, "message": message}
+
+
+def bulk_response(message, results, indexes, ids):
+    """Merge inserted ids back into the per-row results and respond."""
+    for index, new_id in zip(indexes, ids):
+        results[index] = {"index": index, "success": True, "id": new_id}
+
+    created = len(ids)
+    return success_response(
+        message=message,
+        data={
+            "created": created,
+            "failed": len(results) - created,
+            "results": results
+        },
+        status_code=201 if created else 200
+    )
+
+
+def id_result(id, updated):
+    return {"id": id, "success": True, "updated": updated}
+
+
+def id_error(id, message):
+    return {"id": id, "success": False, "message": message}
+
+
+def bulk_update_response(message, results):
+    """Respond with per-id results and updated / unchanged / failed counts."""
+    updated = sum(1 for r in results if r.get("updated"))
+    failed = sum(1 for r in results if not r["success"])
+    return success_response(
+        message=message,
+        data={
+            "updated": updated,
+            "unchanged": len(results) - updated - failed,
+            "failed": failed,
+            "results": results
+        }
+    )
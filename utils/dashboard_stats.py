@@ -0,0 +1,125 @@
+import threading
+import time
+
+from flask import current_app
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session, object_session
+
+from extensions import db
+from models.customer import Customer
+from models.vehicle import Vehicle
+from models.mechanic import Mechanic
+from models.service_request import ServiceRequest
+from models.invoice import Invoice
+
+TRACKED_MODELS = (Customer, Vehicle, Mechanic, ServiceRequest, Invoice)
+
+_lock = threading.Lock()
+_cache = {"stats": None, "expires": 0.0, "generation": 0}
+
+
+# ---------------------------
+# AGGREGATE QUERY
+# ---------------------------
+def _count(model, *criteria):
+    return (
+        select(func.count())
+        .select_from(model)
+        .where(*criteria)
+        .scalar_subquery()
+    )
+
+
+def stats_statement():
+    # one round-trip: every counter is a scalar subquery of a single SELECT
+    return select(
+        _count(Customer).label("total_customers"),
+        _count(Vehicle).label("total_vehicles"),
+        _count(Mechanic).label("total_mechanics"),
+        _count(Mechanic, Mechanic.is_available == True).label("available_mechanics"),  # noqa: E712
+        _count(ServiceRequest, ServiceRequest.status == "Pending").label("pending_services"),
+        _count(ServiceRequest, ServiceRequest.status == "Completed").label("completed_services"),
+        _count(Invoice).label("total_invoices"),
+        _count(Invoice, Invoice.payment_status == "Paid").label("paid_invoices"),
+        _count(Invoice, Invoice.payment_status == "Pending").label("pending_invoices"),
+    )
+
+
+def _query_stats():
+    return dict(db.session.execute(stats_statement()).one()._mapping)
+
+
+# ---------------------------
+# CACHE
+# ---------------------------
+def get_dashboard_stats():
+    now = time.monotonic()
+    with _lock:
+        if _cache["stats"] is not None and now < _cache["expires"]:
+            return dict(_cache["stats"])
+        generation = _cache["generation"]
+
+    stats = _query_stats()
+
+    with _lock:
+        # skip the store if a commit invalidated the counts mid-query
+        if generation == _cache["generation"]:
+            _cache["stats"] = stats
+            _cache["expires"] = now + current_app.config["DASHBOARD_CACHE_TTL"]
+    return dict(stats)
+
+
+def invalidate_dashboard_stats():
+    with _lock:
+        _cache["stats"] = None
+        _cache["generation"] += 1
+
+
+# ---------------------------
+# INVALIDATION EVENTS
+# ---------------------------
+def _mark_dirty(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info["dashboard_dirty"] = True
+
+
+def _mark_dirty_bulk(orm_execute_state):
+    # insert(Model) / update(Model) statements bypass the mapper events
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in TRACKED_MODELS:
+        orm_execute_state.session.info["dashboard_dirty"] = True
+
+
+def _after_commit(session):
+    if session.info.pop("dashboard_dirty", False):
+        invalidate_dashboard_stats()
+
+
+def _after_rollback(session):
+    session.info.pop("dashboard_dirty", None)
+
+
+def init_dashboard_stats(app):
+    """Drop cached dashboard counts whenever a tracked model is written.
+
+    Writes only mark the session at flush time; the cache is cleared once
+    the transaction commits so a concurrent reader cannot re-cache
+    uncommitted counts.
+    """
+    if event.contains(Session, "after_commit", _after_commit):
+        return
+
+    for model in TRACKED_MODELS:
+        for name in ("after_insert", "after_update", "after_delete"):
+            event.listen(model, name, _mark_dirty)
+
+    event.listen(Session, "do_orm_execute", _mark_dirty_bulk)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
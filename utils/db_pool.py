@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
+
+_settings = {"log_interval": 60.0, "slow_wait_ms": 100.0}
+
+
+class PoolStats:
+    """Checkout and wait counters shared by every instrumented pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_logged = time.monotonic()
+
+    def record_wait(self, seconds):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def incr(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self, reset=False):
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "avg_wait_ms": (
+                    self.total_wait / self.checkouts * 1000 if self.checkouts else 0.0
+                ),
+                "max_wait_ms": self.max_wait * 1000,
+            }
+            if reset:
+                self.reset()
+            return data
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that measures how long each checkout waits for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeout:
+            pool_stats.incr("timeouts")
+            logger.error(
+                "DB pool exhausted: %d connections checked out (size=%d, overflow=%d)",
+                self.checkedout(), self.size(), self.overflow()
+            )
+            raise
+
+        waited = time.perf_counter() - started
+        pool_stats.record_wait(waited)
+
+        if waited * 1000 >= _settings["slow_wait_ms"]:
+            logger.warning(
+                "DB pool checkout waited %.1f ms (checked_out=%d size=%d overflow=%d)",
+                waited * 1000, self.checkedout(), self.size(), self.overflow()
+            )
+        self._maybe_log_summary()
+        return connection
+
+    def _maybe_log_summary(self):
+        now = time.monotonic()
+        if now - pool_stats.last_logged < _settings["log_interval"]:
+            return
+        stats = pool_stats.snapshot(reset=True)
+        logger.info(
+            "DB pool: checked_out=%d size=%d overflow=%d | checkouts=%d "
+            "avg_wait=%.2fms max_wait=%.2fms timeouts=%d connects=%d invalidated=%d",
+            self.checkedout(), self.size(), self.overflow(),
+            stats["checkouts"], stats["avg_wait_ms"], stats["max_wait_ms"],
+            stats["timeouts"], stats["connects"], stats["invalidations"]
+        )
+
+
+@event.listens_for(InstrumentedQueuePool, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    pool_stats.incr("connects")
+
+
+@event.listens_for(InstrumentedQueuePool, "invalidate")
+def _on_invalidate(dbapi_connection, connection_record, exception):
+    pool_stats.incr("invalidations")
+    logger.warning("DB connection invalidated: %s", exception)
+
+
+def init_pool_metrics(app):
+    _settings["log_interval"] = app.config["DB_POOL_LOG_INTERVAL"]
+    _settings["slow_wait_ms"] = app.config["DB_POOL_SLOW_WAIT_MS"]
@@ -1,3 +1,4 @@
+import math
 from flask import jsonify
 
 def bad_request(message="Bad request"):
@@ -39,3 +40,25 @@ def server_error(message="Internal server error"):
         "data": None
     }), 500
 
+
+
+def _retry_after(response, seconds):
+    if seconds:
+        response.headers["Retry-After"] = str(max(1, math.ceil(seconds)))
+    return response
+
+
+def too_many_requests(message="Too many requests", retry_after=None):
+    return _retry_after(jsonify({
+        "success": False,
+        "message": message,
+        "data": None
+    }), retry_after), 429
+
+
+def service_unavailable(message="Service unavailable", retry_after=None):
+    return _retry_after(jsonify({
+        "success": False,
+        "message": message,
+        "data": None
+    }), retry_after), 503
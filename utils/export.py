@@ -0,0 +1,75 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+
+from flask import Response, stream_with_context
+
+from extensions import db
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# rows fetched per server-side cursor round-trip
+EXPORT_BATCH_SIZE = 1000
+
+
+def _plain(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _ndjson_lines(keys, rows):
+    for row in rows:
+        record = {k: _plain(v) for k, v in zip(keys, row)}
+        yield json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def _csv_chunks(keys, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(keys)
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow([_plain(v) for v in row])
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+def export_response(stmt, filename, fmt):
+    """Stream the rows of a column ``select()`` as NDJSON or CSV.
+
+    Rows are pulled with ``yield_per`` (a server-side cursor on Postgres)
+    and written out as they arrive, so memory use does not grow with the
+    size of the table.
+    """
+    keys = list(stmt.selected_columns.keys())
+    stmt = stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+    def generate():
+        result = db.session.execute(stmt)
+        try:
+            if fmt == "csv":
+                yield from _csv_chunks(keys, result)
+            else:
+                yield from _ndjson_lines(keys, result)
+        finally:
+            result.close()
+
+    response = Response(
+        stream_with_context(generate()),
+        mimetype=EXPORT_FORMATS[fmt]
+    )
+    response.headers["Content-Disposition"] = (
+        f"attachment; filename={filename}.{fmt}"
+    )
+    # let reverse proxies pass chunks straight through
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,185 @@
+from datetime import date, datetime
+
+from sqlalchemy.types import Boolean, Date, DateTime, Float, Integer, Numeric
+
+from models.service_request import ServiceRequest
+from models.vehicle import Vehicle
+from models.invoice import Invoice
+from models.mechanic import Mechanic
+
+# query-string names that are not filters
+RESERVED_ARGS = {"limit", "after", "sort"}
+
+RANGE_OPERATORS = {
+    "gte": lambda column, value: column >= value,
+    "lte": lambda column, value: column <= value,
+    "gt": lambda column, value: column > value,
+    "lt": lambda column, value: column < value,
+}
+MAX_IN_VALUES = 100
+
+_TRUE = {"true", "1", "yes"}
+_FALSE = {"false", "0", "no"}
+
+
+# ---------------------------
+# VALUES
+# ---------------------------
+def _parse_value(column, name, raw):
+    column_type = column.type
+    try:
+        if isinstance(column_type, Boolean):
+            if raw.lower() in _TRUE:
+                return True
+            if raw.lower() in _FALSE:
+                return False
+            raise ValueError
+        if isinstance(column_type, DateTime):
+            return datetime.fromisoformat(raw)
+        if isinstance(column_type, Date):
+            return date.fromisoformat(raw)
+        if isinstance(column_type, Integer):
+            return int(raw)
+        if isinstance(column_type, (Float, Numeric)):
+            return float(raw)
+    except ValueError:
+        raise ValueError(f"{name} {_expected(column_type)}")
+    return raw
+
+
+def _expected(column_type):
+    if isinstance(column_type, Boolean):
+        return "must be true or false"
+    if isinstance(column_type, DateTime):
+        return "must be an ISO date or datetime"
+    if isinstance(column_type, Date):
+        return "must be YYYY-MM-DD"
+    if isinstance(column_type, Integer):
+        return "must be an integer"
+    return "must be a number"
+
+
+def _is_orderable(column):
+    return isinstance(column.type, (Date, DateTime, Integer, Float, Numeric))
+
+
+# ---------------------------
+# LIST FILTERS
+# ---------------------------
+class ListFilter:
+    """Query-string filters and sort orders allowed on one list endpoint.
+
+        ?status=Pending&assigned_mechanic_id=3
+        ?status__in=Pending,In Progress
+        ?service_date__gte=2025-01-01&service_date__lt=2025-02-01
+        ?sort=-service_date
+
+    ``filters`` / ``sorts`` name the model columns clients may use; any
+    other argument is rejected. Range operators work on date, datetime
+    and numeric columns. Sorting is on one column, with the primary key as
+    tie-breaker, so results stay keyset-paginated.
+    """
+
+    def __init__(self, model, filters, sorts, default_sort="created_at"):
+        self.model = model
+        self.filters = {name: getattr(model, name) for name in filters}
+        self.sorts = {name: getattr(model, name) for name in sorts}
+        self.default_sort = default_sort
+
+    def clauses(self, args):
+        """WHERE clauses for ``args``.
+
+        Raises ValueError with a client-facing message on bad input.
+        """
+        clauses = []
+        for arg in args:
+            if arg in RESERVED_ARGS:
+                continue
+            name, _, operator = arg.partition("__")
+            column = self.filters.get(name)
+            if column is None:
+                raise ValueError(f"Unknown filter: {name}")
+
+            # repeated arguments (?status=A&status=B) must all hold
+            for raw in args.getlist(arg):
+                clauses.append(self._clause(column, arg, operator, raw))
+        return clauses
+
+    def _clause(self, column, arg, operator, raw):
+        if not operator:
+            return column == _parse_value(column, arg, raw)
+
+        if operator == "in":
+            values = [v.strip() for v in raw.split(",") if v.strip()]
+            if not values or len(values) > MAX_IN_VALUES:
+                raise ValueError(f"{arg} takes 1 to {MAX_IN_VALUES} comma-separated values")
+            return column.in_([_parse_value(column, arg, v) for v in values])
+
+        if operator in RANGE_OPERATORS:
+            if not _is_orderable(column):
+                raise ValueError(f"{arg}: {operator} needs a date or numeric field")
+            return RANGE_OPERATORS[operator](column, _parse_value(column, arg, raw))
+
+        raise ValueError(f"Unknown filter operator: {operator}")
+
+    def order(self, args):
+        """``(keys, descending)`` for ``?sort=field`` / ``?sort=-field``."""
+        sort = args.get("sort") or self.default_sort
+        descending = sort.startswith("-")
+        name = sort.lstrip("-")
+        if name not in self.sorts:
+            raise ValueError(
+                "sort must be one of " + ", ".join(sorted(self.sorts))
+                + " (prefix - for descending)"
+            )
+
+        primary_key = self.model.id
+        column = self.sorts[name]
+        keys = [primary_key] if column is primary_key else [column, primary_key]
+        return keys, descending
+
+    def apply(self, stmt, args):
+        """Filter ``stmt`` (a ``Model.query`` or ``select()``) by ``args``.
+
+        Returns ``(stmt, keys, descending)`` for ``paginate`` /
+        ``apply_keyset``.
+        """
+        keys, descending = self.order(args)
+        return stmt.filter(*self.clauses(args)), keys, descending
+
+
+# ---------------------------
+# RESOURCES
+# ---------------------------
+SERVICE_FILTERS = ListFilter(
+    ServiceRequest,
+    filters=(
+        "id", "vehicle_id", "assigned_mechanic_id", "service_type", "status",
+        "service_date", "created_at",
+    ),
+    sorts=("id", "service_date", "created_at"),
+)
+
+VEHICLE_FILTERS = ListFilter(
+    Vehicle,
+    filters=(
+        "id", "customer_id", "vehicle_number", "vehicle_type", "brand", "model",
+        "created_at",
+    ),
+    sorts=("id", "created_at"),
+)
+
+INVOICE_FILTERS = ListFilter(
+    Invoice,
+    filters=(
+        "id", "service_id", "customer_id", "vehicle_id", "payment_status",
+        "total_amount", "created_at",
+    ),
+    sorts=("id", "total_amount", "created_at"),
+)
+
+MECHANIC_FILTERS = ListFilter(
+    Mechanic,
+    filters=("id", "specialization", "is_available", "created_at"),
+    sorts=("id", "created_at"),
+)
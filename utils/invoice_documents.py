@@ -0,0 +1,202 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from flask import current_app, has_app_context, render_template
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+from extensions import db
+from models.invoice import Invoice
+from models.customer import Customer
+from models.vehicle import Vehicle
+from models.service_request import ServiceRequest
+from models.mechanic import Mechanic
+
+DOCUMENT_FORMATS = ("html", "print")
+DOCUMENT_TEMPLATE = "invoices/document.html"
+
+
+# ---------------------------
+# CACHE
+# ---------------------------
+class DocumentCache:
+    """LRU of rendered documents, bounded by the total size in bytes.
+
+    Keys are ``(invoice_id, format, content_hash)``; entries for one
+    invoice can be dropped together.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+            return body
+
+    def put(self, key, body):
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = body
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def evict(self, invoice_ids):
+        with self._lock:
+            for key in [k for k in self._entries if k[0] in invoice_ids]:
+                self.size -= len(self._entries.pop(key))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+def get_document_cache(app=None):
+    return (app or current_app).extensions["invoice_documents"]
+
+
+# ---------------------------
+# CONTENT
+# ---------------------------
+def load_invoice_content(invoice_id):
+    """Every value the document shows, read in one query, or None."""
+    row = db.session.execute(
+        select(
+            Invoice.id, Invoice.total_amount, Invoice.payment_status, Invoice.created_at,
+            Customer.name, Customer.phone, Customer.email, Customer.address,
+            Vehicle.vehicle_number, Vehicle.vehicle_type, Vehicle.brand, Vehicle.model,
+            ServiceRequest.id, ServiceRequest.service_type, ServiceRequest.service_date,
+            ServiceRequest.problem_description, Mechanic.name,
+        )
+        .join(Customer, Customer.id == Invoice.customer_id)
+        .join(Vehicle, Vehicle.id == Invoice.vehicle_id)
+        .join(ServiceRequest, ServiceRequest.id == Invoice.service_id)
+        .outerjoin(Mechanic, Mechanic.id == ServiceRequest.assigned_mechanic_id)
+        .where(Invoice.id == invoice_id)
+    ).first()
+    if row is None:
+        return None
+
+    (id_, amount, status, created_at,
+     name, phone, email, address,
+     number, vehicle_type, brand, model,
+     service_id, service_type, service_date, problem, mechanic) = row
+    return {
+        "invoice": {
+            "id": id_,
+            "total_amount": amount,
+            "payment_status": status,
+            "created_at": created_at.isoformat() if created_at else None,
+        },
+        "customer": {"name": name, "phone": phone, "email": email, "address": address},
+        "vehicle": {
+            "vehicle_number": number, "vehicle_type": vehicle_type,
+            "brand": brand, "model": model,
+        },
+        "service": {
+            "id": service_id,
+            "service_type": service_type,
+            "service_date": service_date.isoformat() if service_date else None,
+            "problem_description": problem,
+            "mechanic": mechanic,
+        },
+    }
+
+
+def content_hash(content):
+    raw = json.dumps(content, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+# ---------------------------
+# RENDER
+# ---------------------------
+def invoice_document(invoice_id, fmt="html"):
+    """Return ``(body, content_hash)`` for an invoice, or None if missing.
+
+    The hash covers the invoice and the customer / vehicle / service rows
+    it shows, so an edit to any of them yields a new cache key and a new
+    ETag; the cached copy is only reused while every shown value matches.
+    """
+    content = load_invoice_content(invoice_id)
+    if content is None:
+        return None
+
+    digest = content_hash(content)
+    key = (invoice_id, fmt, digest)
+    cache = get_document_cache()
+
+    body = cache.get(key)
+    if body is None:
+        body = render_template(
+            DOCUMENT_TEMPLATE, print_mode=(fmt == "print"), **content
+        ).encode()
+        cache.put(key, body)
+    return body, digest
+
+
+# ---------------------------
+# INVALIDATION EVENTS
+# ---------------------------
+def _mark_dirty(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("invoice_documents_dirty", set()).add(target.id)
+
+
+def _mark_dirty_bulk(orm_execute_state):
+    # update(Invoice) / delete(Invoice) statements bypass the mapper events
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is Invoice:
+        orm_execute_state.session.info["invoice_documents_clear"] = True
+
+
+def _after_commit(session):
+    dirty = session.info.pop("invoice_documents_dirty", None)
+    clear = session.info.pop("invoice_documents_clear", False)
+    if not (dirty or clear) or not has_app_context():
+        return
+    cache = current_app.extensions.get("invoice_documents")
+    if cache is None:
+        return
+    if clear:
+        cache.clear()
+    else:
+        cache.evict(dirty)
+
+
+def _after_rollback(session):
+    session.info.pop("invoice_documents_dirty", None)
+    session.info.pop("invoice_documents_clear", None)
+
+
+def init_invoice_documents(app):
+    """Attach the rendered-invoice cache and drop an invoice's entries
+    once a transaction that updates or deletes it commits.
+    """
+    app.extensions["invoice_documents"] = DocumentCache(
+        app.config["INVOICE_DOCUMENT_CACHE_BYTES"]
+    )
+
+    if event.contains(Session, "after_commit", _after_commit):
+        return
+    event.listen(Invoice, "after_update", _mark_dirty)
+    event.listen(Invoice, "after_delete", _mark_dirty)
+    event.listen(Session, "do_orm_execute", _mark_dirty_bulk)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
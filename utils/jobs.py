@@ -0,0 +1,430 @@
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
+
+import click
+from flask import current_app, has_app_context
+from flask.cli import AppGroup
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from extensions import db
+from models.job import Job
+
+logger = logging.getLogger("jobs")
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+EXECUTORS = ("thread", "process")
+
+MAX_ERROR_LENGTH = 4000
+STALE_SWEEP_INTERVAL = 60
+
+_handlers = {}
+
+# app built by each process-pool worker at startup
+_worker_app = None
+
+
+# ---------------------------
+# REGISTRY
+# ---------------------------
+def job(name, max_attempts=None):
+    """Register ``func`` as the handler for jobs called ``name``.
+
+    The handler is called with the job payload as keyword arguments,
+    inside an app context, and its return value (JSON-serialisable or
+    None) is stored as the job result. Handlers commit their own writes.
+    """
+    def register(func):
+        _handlers[name] = (func, max_attempts)
+        return func
+    return register
+
+
+def registered_jobs():
+    return sorted(_handlers)
+
+
+# ---------------------------
+# ENQUEUE
+# ---------------------------
+def enqueue(name, payload=None, max_attempts=None, delay=0):
+    """Add a job to the current session and return it.
+
+    Nothing runs until the caller commits: a job enqueued next to a
+    write is dropped if that write rolls back.
+
+    Raises ValueError for an unknown job name.
+    """
+    if name not in _handlers:
+        raise ValueError(f"Unknown job: {name}")
+
+    now = datetime.utcnow()
+    new_job = Job(
+        name=name,
+        payload=json.dumps(payload or {}),
+        status="queued",
+        attempts=0,
+        max_attempts=(
+            max_attempts
+            or _handlers[name][1]
+            or current_app.config["JOB_MAX_ATTEMPTS"]
+        ),
+        run_after=now + timedelta(seconds=delay),
+        created_at=now,
+    )
+    db.session.add(new_job)
+    db.session.info["jobs_enqueued"] = True
+    return new_job
+
+
+def retry_job(job_row):
+    """Queue a failed job again with a fresh set of attempts.
+
+    Raises ValueError if the job is not failed.
+    """
+    if job_row.status != "failed":
+        raise ValueError("Only failed jobs can be retried")
+    job_row.status = "queued"
+    job_row.attempts = 0
+    job_row.run_after = datetime.utcnow()
+    job_row.finished_at = None
+    db.session.info["jobs_enqueued"] = True
+
+
+# ---------------------------
+# CLAIM / COMPLETE
+# ---------------------------
+def claim_jobs(limit):
+    """Atomically move up to ``limit`` due jobs to running.
+
+    Safe with several runners on one database: Postgres skips rows
+    another runner has locked, and the status check in the UPDATE keeps
+    a job from being claimed twice on SQLite.
+    """
+    now = datetime.utcnow()
+    is_due = (Job.status == "queued", Job.run_after <= now)
+
+    # an idle poll is one indexed read: no UPDATE, no write lock, no commit
+    if not db.session.scalar(select(Job.id).where(*is_due).limit(1)):
+        db.session.rollback()
+        return []
+
+    due = (
+        select(Job.id)
+        .where(*is_due)
+        .order_by(Job.run_after, Job.id)
+        .limit(limit)
+    )
+    if db.session.get_bind().dialect.name == "postgresql":
+        due = due.with_for_update(skip_locked=True)
+
+    claimed = db.session.execute(
+        update(Job)
+        .where(Job.id.in_(due.scalar_subquery()), Job.status == "queued")
+        .values(
+            status="running",
+            attempts=Job.attempts + 1,
+            started_at=now,
+            finished_at=None,
+        )
+        .returning(Job.id, Job.name, Job.payload)
+        .execution_options(synchronize_session=False)
+    ).all()
+    if claimed:
+        db.session.commit()
+    else:
+        # another runner got there first
+        db.session.rollback()
+    return claimed
+
+
+def _finish(job_id, result=None, error=None):
+    job_row = db.session.get(Job, job_id)
+    if job_row is None:
+        return
+
+    now = datetime.utcnow()
+    job_row.finished_at = now
+    if error is None:
+        job_row.status = "succeeded"
+        job_row.result = result
+        job_row.last_error = None
+    else:
+        job_row.last_error = error[-MAX_ERROR_LENGTH:]
+        if job_row.attempts < job_row.max_attempts:
+            # exponential backoff: base, 2 x base, 4 x base, ...
+            backoff = current_app.config["JOB_RETRY_BACKOFF"] * 2 ** (job_row.attempts - 1)
+            job_row.status = "queued"
+            job_row.run_after = now + timedelta(seconds=backoff)
+        else:
+            job_row.status = "failed"
+        logger.warning(
+            "Job %s (%s) attempt %s/%s failed, now %s",
+            job_id, job_row.name, job_row.attempts, job_row.max_attempts, job_row.status
+        )
+    db.session.commit()
+
+
+def requeue_stale_jobs():
+    """Recover jobs left running by a worker that died mid-job."""
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=current_app.config["JOB_STALE_AFTER"])
+    stale = (Job.status == "running", Job.started_at < cutoff)
+    message = "Worker stopped before the job finished"
+
+    if not db.session.scalar(select(Job.id).where(*stale).limit(1)):
+        db.session.rollback()
+        return 0
+
+    requeued = db.session.execute(
+        update(Job)
+        .where(*stale, Job.attempts < Job.max_attempts)
+        .values(status="queued", run_after=now, last_error=message)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    failed = db.session.execute(
+        update(Job)
+        .where(*stale)
+        .values(status="failed", finished_at=now, last_error=message)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+
+    if requeued or failed:
+        logger.warning("Recovered stale jobs: %s requeued, %s failed", requeued, failed)
+    return requeued + failed
+
+
+# ---------------------------
+# EXECUTION
+# ---------------------------
+def execute_job(name, payload):
+    """Run a handler and return its result as JSON text (or None)."""
+    func, _ = _handlers[name]
+    result = func(**json.loads(payload))
+    return None if result is None else json.dumps(result)
+
+
+def _run_in_app(app, name, payload):
+    with app.app_context():
+        return execute_job(name, payload)
+
+
+def _init_worker_process():
+    global _worker_app
+    from app import create_app
+    _worker_app = create_app()
+
+
+def _run_in_worker_process(name, payload):
+    return _run_in_app(_worker_app, name, payload)
+
+
+def _format_error(error):
+    return "".join(traceback.format_exception(error)).strip()
+
+
+# ---------------------------
+# RUNNER
+# ---------------------------
+class JobRunner:
+    """Polls the jobs table and runs due jobs on a thread or process pool.
+
+    One runner per process. ``start()`` is idempotent and fork-aware: a
+    forked child gets its own poller and pool on first use.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.executor_kind = app.config["JOB_EXECUTOR"]
+        if self.executor_kind not in EXECUTORS:
+            raise ValueError("JOB_EXECUTOR must be thread or process")
+        self.workers = app.config["JOB_WORKERS"]
+        self.poll_interval = app.config["JOB_POLL_INTERVAL"]
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._in_flight = 0
+        self._pid = None
+        self._thread = None
+        self._executor = None
+
+    @property
+    def running(self):
+        return (
+            self._pid == os.getpid()
+            and self._thread is not None
+            and self._thread.is_alive()
+        )
+
+    def start(self):
+        # runs before every request when autostarted: skip the lock once up
+        if self.running:
+            return
+        with self._lock:
+            if self.running:
+                return
+            self._pid = os.getpid()
+            self._in_flight = 0
+            self._stop.clear()
+            self._executor = self._make_executor()
+            self._thread = threading.Thread(
+                target=self._loop, name="job-runner", daemon=True
+            )
+            self._thread.start()
+        logger.info(
+            "Job runner started: %s %s worker(s), pid %s",
+            self.workers, self.executor_kind, self._pid
+        )
+
+    def stop(self, wait=True):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None and self.running:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def wake(self):
+        self._wake.set()
+
+    @property
+    def idle(self):
+        return self._in_flight == 0
+
+    def _make_executor(self):
+        if self.executor_kind == "process":
+            # spawn, not fork: the parent has live threads and DB connections
+            return ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker_process,
+            )
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job")
+
+    def _loop(self):
+        next_sweep = 0.0
+        while not self._stop.is_set():
+            claimed = 0
+            try:
+                with self.app.app_context():
+                    if time.monotonic() >= next_sweep:
+                        requeue_stale_jobs()
+                        next_sweep = time.monotonic() + STALE_SWEEP_INTERVAL
+                    claimed = self.run_pending()
+            except Exception:
+                logger.exception("Job poll failed")
+
+            if not claimed:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+    def run_pending(self):
+        """Claim as many due jobs as there are free workers and submit them."""
+        free = self.workers - self._in_flight
+        if free <= 0:
+            return 0
+
+        claimed = claim_jobs(free)
+        for job_id, name, payload in claimed:
+            with self._lock:
+                self._in_flight += 1
+            if self.executor_kind == "process":
+                future = self._executor.submit(_run_in_worker_process, name, payload)
+            else:
+                future = self._executor.submit(_run_in_app, self.app, name, payload)
+            future.add_done_callback(partial(self._finished, job_id))
+        return len(claimed)
+
+    def _finished(self, job_id, future):
+        try:
+            error = future.exception()
+            with self.app.app_context():
+                if error is None:
+                    _finish(job_id, result=future.result())
+                else:
+                    _finish(job_id, error=_format_error(error))
+        except Exception:
+            logger.exception("Could not record the outcome of job %s", job_id)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._wake.set()
+
+
+def get_runner(app=None):
+    return (app or current_app).extensions["jobs"]
+
+
+# ---------------------------
+# WAKE-UP EVENTS
+# ---------------------------
+def _after_commit(session):
+    if session.info.pop("jobs_enqueued", False) and has_app_context():
+        runner = current_app.extensions.get("jobs")
+        if runner is not None:
+            runner.wake()
+
+
+def _after_rollback(session):
+    session.info.pop("jobs_enqueued", None)
+
+
+# ---------------------------
+# SETUP
+# ---------------------------
+jobs_cli = AppGroup("jobs", help="Background job runner.")
+
+
+@jobs_cli.command("work")
+@click.option("--burst", is_flag=True, help="Exit once the queue is empty.")
+def work_command(burst):
+    """Run queued jobs in the foreground."""
+    runner = get_runner()
+    runner.start()
+    try:
+        while True:
+            time.sleep(runner.poll_interval)
+            if burst and runner.idle and not _due_jobs():
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        runner.stop()
+
+
+def _due_jobs():
+    return db.session.scalar(
+        select(Job.id)
+        .where(Job.status == "queued", Job.run_after <= datetime.utcnow())
+        .limit(1)
+    )
+
+
+def init_jobs(app):
+    """Attach a JobRunner to the app.
+
+    With JOB_RUNNER_AUTOSTART the runner starts on the first request the
+    process serves, so CLI commands (migrations, seeding) never poll.
+    """
+    runner = JobRunner(app)
+    app.extensions["jobs"] = runner
+    app.cli.add_command(jobs_cli)
+
+    if app.config["JOB_RUNNER_AUTOSTART"]:
+        app.before_request(runner.start)
+
+    if event.contains(Session, "after_commit", _after_commit):
+        return
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
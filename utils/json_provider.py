@@ -0,0 +1,36 @@
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional C-accelerated encoder
+    orjson = None
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that uses orjson when it is installed.
+
+    Falls back to the stdlib encoder when orjson is missing, when extra
+    ``json.dumps`` options are passed, or for pretty-printed debug output.
+    Keys are not sorted on either path.
+    """
+
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        if orjson is None or pretty:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
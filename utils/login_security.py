@@ -0,0 +1,164 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from flask import current_app
+from werkzeug.security import check_password_hash, generate_password_hash
+
+# idle buckets are dropped once this many keys are tracked
+MAX_TRACKED_KEYS = 10000
+
+
+class HasherBusy(Exception):
+    """Every hashing slot is taken; the login should be retried later."""
+
+
+# ---------------------------
+# PASSWORD HASHING
+# ---------------------------
+class PasswordHasher:
+    """Runs password checks on a small dedicated thread pool.
+
+    hashlib releases the GIL while hashing, so the pool caps how many
+    cores logins can use at once; ``max_pending`` caps how many requests
+    may wait for it, and the rest fail fast with HasherBusy instead of
+    tying up request threads.
+    """
+
+    def __init__(self, workers, max_pending, timeout):
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pid = None
+        self._dummy_hash = None
+
+    def _get_executor(self):
+        # threads do not survive fork: each worker process builds its own
+        with self._lock:
+            if self._pid != os.getpid():
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="pwhash"
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def _get_dummy_hash(self):
+        # checked when the account does not exist, so a miss costs as much
+        # as a wrong password and does not reveal which accounts exist
+        if self._dummy_hash is None:
+            self._dummy_hash = generate_password_hash(os.urandom(16).hex())
+        return self._dummy_hash
+
+    def check(self, password_hash, password):
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy()
+        try:
+            future = self._get_executor().submit(
+                check_password_hash, password_hash or self._get_dummy_hash(), password
+            )
+        except Exception:
+            self._slots.release()
+            raise
+        # the slot stays taken until the hash really finishes
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            matched = future.result(timeout=self.timeout)
+        except FutureTimeout:
+            raise HasherBusy()
+        return matched and password_hash is not None
+
+
+# ---------------------------
+# TOKEN BUCKETS
+# ---------------------------
+class LoginThrottle:
+    """In-memory token buckets keyed by client IP and by account.
+
+    Every login attempt takes one token from the IP's bucket and one from
+    the account's; buckets refill continuously up to their burst size.
+    """
+
+    def __init__(self, ip_burst, ip_per_minute, account_burst, account_per_minute):
+        self.limits = {
+            "ip": (ip_burst, ip_per_minute / 60.0),
+            "account": (account_burst, account_per_minute / 60.0),
+        }
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def _level(self, key, now):
+        burst, rate = self.limits[key[0]]
+        tokens, updated = self._buckets.get(key, (burst, now))
+        return min(burst, tokens + (now - updated) * rate), rate
+
+    def hit(self, ip, account):
+        """Take a token for this attempt.
+
+        Returns 0 if allowed, else the seconds until a retry can succeed.
+        """
+        keys = [("ip", ip), ("account", (account or "").strip().lower())]
+        now = time.monotonic()
+        with self._lock:
+            levels = [self._level(key, now) for key in keys]
+            waits = [(1 - tokens) / rate for tokens, rate in levels if tokens < 1]
+            if waits:
+                return max(waits)
+
+            if len(self._buckets) >= MAX_TRACKED_KEYS:
+                self._prune(now)
+            for key, (tokens, _) in zip(keys, levels):
+                self._buckets[key] = (tokens - 1, now)
+            return 0
+
+    def record_success(self, ip, account):
+        """A successful login does not count against its IP or account:
+        the IP gets its token back and the account bucket is cleared.
+        """
+        now = time.monotonic()
+        with self._lock:
+            key = ("ip", ip)
+            if key in self._buckets:
+                tokens, _ = self._level(key, now)
+                self._buckets[key] = (min(self.limits["ip"][0], tokens + 1), now)
+            self._buckets.pop(("account", (account or "").strip().lower()), None)
+
+    def _prune(self, now):
+        for key in list(self._buckets):
+            level, _ = self._level(key, now)
+            if level >= self.limits[key[0]][0]:
+                del self._buckets[key]
+
+
+# ---------------------------
+# LOGIN
+# ---------------------------
+def check_login(user, password):
+    """Verify ``password`` for ``user`` (None when the lookup missed).
+
+    Raises HasherBusy when the hashing pool is saturated.
+    """
+    hasher = current_app.extensions["password_hasher"]
+    return hasher.check(user.password_hash if user else None, password)
+
+
+def login_throttle():
+    return current_app.extensions["login_throttle"]
+
+
+def init_login_security(app):
+    """Attach the password hashing pool and the login throttle."""
+    app.extensions["password_hasher"] = PasswordHasher(
+        app.config["PASSWORD_HASH_WORKERS"],
+        app.config["PASSWORD_HASH_MAX_PENDING"],
+        app.config["PASSWORD_HASH_TIMEOUT"],
+    )
+    app.extensions["login_throttle"] = LoginThrottle(
+        app.config["LOGIN_IP_BURST"],
+        app.config["LOGIN_IP_PER_MINUTE"],
+        app.config["LOGIN_ACCOUNT_BURST"],
+        app.config["LOGIN_ACCOUNT_PER_MINUTE"],
+    )
@@ -0,0 +1,190 @@
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from utils.sql_counter import get_query_count
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+# label for requests that matched no route, so 404 probes cannot
+# create one series per path
+UNMATCHED = "unmatched"
+
+
+# ---------------------------
+# REGISTRY
+# ---------------------------
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class RequestMetrics:
+    """Per-process request / SQL figures, keyed by endpoint.
+
+    Each worker process keeps its own numbers; Prometheus aggregates the
+    scrapes of every worker (or use a single-process deployment).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.requests = defaultdict(int)
+        self.latency = {}
+        self.sql_queries = defaultdict(int)
+        self.sql_seconds = defaultdict(float)
+        self.sql_per_request = {}
+
+    def record(self, endpoint, method, status, seconds, queries, sql_seconds):
+        with self._lock:
+            self.requests[(endpoint, method, status)] += 1
+
+            key = (endpoint, method)
+            if key not in self.latency:
+                self.latency[key] = Histogram(LATENCY_BUCKETS)
+                self.sql_per_request[key] = Histogram(QUERY_COUNT_BUCKETS)
+            self.latency[key].observe(seconds)
+            self.sql_per_request[key].observe(queries)
+
+            self.sql_queries[key] += queries
+            self.sql_seconds[key] += sql_seconds
+
+    # ---------------------------
+    # PROMETHEUS TEXT FORMAT
+    # ---------------------------
+    def render(self):
+        with self._lock:
+            lines = []
+            _counter(
+                lines, "http_requests_total",
+                "Requests by endpoint, method and status code.",
+                ("endpoint", "method", "status"), self.requests
+            )
+            _histogram(
+                lines, "http_request_duration_seconds",
+                "Request latency by endpoint.", self.latency
+            )
+            _histogram(
+                lines, "http_request_sql_queries",
+                "SQL statements executed per request.", self.sql_per_request
+            )
+            _counter(
+                lines, "sql_queries_total",
+                "SQL statements executed, by endpoint.",
+                ("endpoint", "method"), self.sql_queries
+            )
+            _counter(
+                lines, "sql_query_duration_seconds_total",
+                "Time spent in SQL statements, by endpoint.",
+                ("endpoint", "method"), self.sql_seconds
+            )
+            return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values):
+    return ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+
+
+def _number(value):
+    if isinstance(value, float):
+        return repr(round(value, 6))
+    return str(value)
+
+
+def _counter(lines, name, help_text, label_names, values):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} counter")
+    for key, value in sorted(values.items()):
+        lines.append(f"{name}{{{_labels(label_names, key)}}} {_number(value)}")
+
+
+def _histogram(lines, name, help_text, histograms):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for key, hist in sorted(histograms.items()):
+        labels = _labels(("endpoint", "method"), key)
+        cumulative = 0
+        for bound, count in zip(hist.buckets, hist.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        total = cumulative + hist.counts[-1]
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {total}')
+        lines.append(f"{name}_sum{{{labels}}} {_number(hist.sum)}")
+        lines.append(f"{name}_count{{{labels}}} {total}")
+
+
+request_metrics = RequestMetrics()
+
+
+# ---------------------------
+# SQL TIMING EVENTS
+# ---------------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("metrics_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    if has_request_context():
+        g.sql_seconds = g.get("sql_seconds", 0.0) + elapsed
+
+
+def _on_error(exception_context):
+    # a failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("metrics_started"):
+        connection.info["metrics_started"].pop()
+
+
+# ---------------------------
+# SETUP
+# ---------------------------
+def init_metrics(app):
+    """Time every request and record it under its endpoint name.
+
+    SQL statement counts come from utils/sql_counter.py; SQL time is
+    measured here with engine cursor events. Exposed at /metrics.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _on_error)
+
+    @app.before_request
+    def start_request_timer():
+        g.metrics_started = time.perf_counter()
+
+    @app.after_request
+    def record_request_metrics(response):
+        started = g.get("metrics_started")
+        if started is not None:
+            request_metrics.record(
+                request.endpoint or UNMATCHED,
+                request.method,
+                response.status_code,
+                time.perf_counter() - started,
+                get_query_count(),
+                g.get("sql_seconds", 0.0),
+            )
+        return response
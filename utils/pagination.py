@@ -0,0 +1,114 @@
+import base64
+import json
+from datetime import date, datetime
+
+from sqlalchemy import and_, or_
+from sqlalchemy.types import Date, DateTime
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+# ---------------------------
+# CURSOR ENCODING
+# ---------------------------
+def encode_cursor(values):
+    payload = [
+        v.isoformat() if isinstance(v, (date, datetime)) else v
+        for v in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor, keys):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise ValueError("Invalid cursor")
+
+    decoded = []
+    for column, value in zip(keys, values):
+        try:
+            if isinstance(column.type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column.type, Date):
+                value = date.fromisoformat(value)
+        except (ValueError, TypeError):
+            raise ValueError("Invalid cursor")
+        decoded.append(value)
+    return decoded
+
+
+# ---------------------------
+# REQUEST ARGS
+# ---------------------------
+def get_page_args(args):
+    """Read ``limit`` / ``after`` from the query string.
+
+    Raises ValueError with a client-facing message on bad input.
+    """
+    limit = args.get("limit", DEFAULT_LIMIT)
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError("limit must be an integer")
+
+    if limit < 1 or limit > MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_LIMIT}")
+
+    return limit, args.get("after") or None
+
+
+# ---------------------------
+# KEYSET PAGINATION
+# ---------------------------
+def apply_keyset(stmt, keys, limit, after=None, descending=False):
+    """Order ``stmt`` by ``keys`` and seek past the ``after`` cursor.
+
+    Works on both ``Model.query`` objects and ``select()`` statements.
+    One extra row is requested so the caller can tell whether another
+    page exists without a COUNT query.
+    """
+    if after:
+        values = decode_cursor(after, keys)
+        stmt = stmt.filter(_seek_clause(keys, values, descending))
+
+    order = [k.desc() if descending else k.asc() for k in keys]
+    return stmt.order_by(*order).limit(limit + 1)
+
+
+def finish_page(rows, keys, limit):
+    """Trim the look-ahead row and build the ``next_cursor``."""
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    next_cursor = encode_cursor([getattr(last, k.key) for k in keys])
+    return rows, next_cursor
+
+
+def paginate(query, keys, args, descending=False):
+    """Fetch one keyset page of ``query``.
+
+    Returns ``(rows, next_cursor)``; ``next_cursor`` is None on the last page.
+    """
+    limit, after = get_page_args(args)
+    rows = apply_keyset(query, keys, limit, after, descending).all()
+    return finish_page(rows, keys, limit)
+
+
+def _seek_clause(keys, values, descending):
+    # (a, b) > (x, y)  ==  a > x OR (a = x AND b > y)
+    clauses = []
+    for i, column in enumerate(keys):
+        equal = [keys[j] == values[j] for j in range(i)]
+        step = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*equal, step))
+    return or_(*clauses)
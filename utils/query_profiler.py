@@ -0,0 +1,279 @@
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+from flask import has_request_context, request
+from sqlalchemy import event
+
+from extensions import db
+
+logger = logging.getLogger("slow_queries")
+
+MAX_FINGERPRINTS = 500
+MAX_STATEMENT_LENGTH = 2000
+MAX_SHAPE_KEYS = 20
+MAX_ENDPOINTS = 10
+
+EXPLAIN_PREFIXES = {"sqlite": "EXPLAIN QUERY PLAN ", "postgresql": "EXPLAIN "}
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE = re.compile(r"\s+")
+
+
+# ---------------------------
+# FINGERPRINT / SHAPE
+# ---------------------------
+def normalize_statement(statement):
+    """Statement text with literals and bind markers replaced by ``?``.
+
+    Statements that differ only in values (or in the length of an IN
+    list) normalize to the same text.
+    """
+    text = _STRING.sub("?", statement)
+    text = _NUMBER.sub("?", text)
+    text = _PLACEHOLDER.sub("?", text)
+    text = _IN_LIST.sub("(?+)", text)
+    return _SPACE.sub(" ", text).strip()
+
+
+def fingerprint(normalized):
+    return hashlib.sha1(normalized.encode()).hexdigest()[:16]
+
+
+def parameter_shape(parameters, executemany=False):
+    """Type names of the bound parameters, never their values."""
+    rows = list(parameters or ()) if executemany else None
+    # batched "insertmanyvalues" INSERTs arrive flagged executemany with
+    # one flat parameter row
+    if rows and isinstance(rows[0], (dict, list, tuple)):
+        return {"executemany": len(rows), "row": parameter_shape(rows[0])}
+    if isinstance(parameters, dict):
+        shape = {
+            key: type(value).__name__
+            for key, value in list(parameters.items())[:MAX_SHAPE_KEYS]
+        }
+        if len(parameters) > MAX_SHAPE_KEYS:
+            shape["..."] = f"{len(parameters) - MAX_SHAPE_KEYS} more"
+        return shape
+    if isinstance(parameters, (list, tuple)):
+        # run-length: ["int*500", "str"] rather than 501 entries
+        shape = []
+        for value in parameters:
+            name = type(value).__name__
+            if shape and shape[-1][0] == name:
+                shape[-1][1] += 1
+            else:
+                shape.append([name, 1])
+        return [name if n == 1 else f"{name}*{n}" for name, n in shape]
+    return None
+
+
+# ---------------------------
+# EXPLAIN
+# ---------------------------
+def _explain(cursor, dialect_name, statement, parameters):
+    """Plan of a SELECT, run on a raw cursor of the same connection.
+
+    Raw DBAPI calls bypass the engine events, so this is not profiled
+    itself. On Postgres a failed EXPLAIN would abort the surrounding
+    transaction, so it runs inside a savepoint.
+    """
+    prefix = EXPLAIN_PREFIXES.get(dialect_name)
+    if prefix is None:
+        return None
+
+    dbapi_cursor = cursor.connection.cursor()
+    savepoint = dialect_name == "postgresql"
+    try:
+        if savepoint:
+            dbapi_cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            dbapi_cursor.execute(prefix + statement, parameters)
+            rows = dbapi_cursor.fetchall()
+        except Exception as e:
+            if savepoint:
+                dbapi_cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            return [f"EXPLAIN failed: {e}"]
+        if savepoint:
+            dbapi_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+    finally:
+        dbapi_cursor.close()
+
+    if dialect_name == "sqlite":
+        # (id, parent, notused, detail)
+        return [row[-1] for row in rows]
+    return [row[0] for row in rows]
+
+
+# ---------------------------
+# FINDINGS
+# ---------------------------
+class SlowQueryLog:
+    """Slow statements aggregated by fingerprint (per process)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def record(self, key, normalized, seconds, endpoint, shape):
+        """Add one occurrence; True if the fingerprint is new."""
+        now = datetime.utcnow().isoformat()
+        ms = seconds * 1000
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if len(self._entries) >= MAX_FINGERPRINTS:
+                    # make room by dropping the cheapest fingerprint
+                    cheapest = min(self._entries, key=lambda k: self._entries[k]["total_ms"])
+                    del self._entries[cheapest]
+                self._entries[key] = {
+                    "fingerprint": key,
+                    "statement": normalized[:MAX_STATEMENT_LENGTH],
+                    "count": 1,
+                    "total_ms": ms,
+                    "max_ms": ms,
+                    "endpoints": [endpoint],
+                    "parameter_shape": shape,
+                    "plan": None,
+                    "first_seen": now,
+                    "last_seen": now,
+                }
+                return True
+
+            entry["count"] += 1
+            entry["total_ms"] += ms
+            entry["max_ms"] = max(entry["max_ms"], ms)
+            entry["last_seen"] = now
+            if endpoint not in entry["endpoints"] and len(entry["endpoints"]) < MAX_ENDPOINTS:
+                entry["endpoints"].append(endpoint)
+            return False
+
+    def set_plan(self, key, plan):
+        with self._lock:
+            if key in self._entries:
+                self._entries[key]["plan"] = plan
+
+    def summary(self, limit=50):
+        """Fingerprints by total time spent, slowest first."""
+        with self._lock:
+            entries = sorted(
+                self._entries.values(), key=lambda e: e["total_ms"], reverse=True
+            )[:limit]
+            return [
+                dict(
+                    e,
+                    endpoints=list(e["endpoints"]),
+                    total_ms=round(e["total_ms"], 2),
+                    max_ms=round(e["max_ms"], 2),
+                    avg_ms=round(e["total_ms"] / e["count"], 2),
+                )
+                for e in entries
+            ]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog()
+
+
+# ---------------------------
+# ENGINE EVENTS
+# ---------------------------
+_settings = {"threshold_ms": 0.0, "explain": True}
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("profiler_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("profiler_started")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    if elapsed * 1000 < _settings["threshold_ms"]:
+        return
+
+    endpoint = (request.endpoint or "unmatched") if has_request_context() else "-"
+    normalized = normalize_statement(statement)
+    key = fingerprint(normalized)
+    shape = parameter_shape(parameters, executemany)
+    is_new = slow_query_log.record(key, normalized, elapsed, endpoint, shape)
+
+    logger.warning(
+        "slow query %.1f ms [%s] endpoint=%s params=%s | %s",
+        elapsed * 1000, key, endpoint, shape, normalized[:MAX_STATEMENT_LENGTH]
+    )
+
+    if (
+        is_new
+        and _settings["explain"]
+        and not executemany
+        and normalized.upper().startswith("SELECT")
+    ):
+        plan = _explain(cursor, conn.dialect.name, statement, parameters)
+        slow_query_log.set_plan(key, plan)
+        logger.warning("plan [%s]:\n  %s", key, "\n  ".join(plan or []))
+
+
+def _on_error(exception_context):
+    # a failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("profiler_started"):
+        connection.info["profiler_started"].pop()
+
+
+def _add_file_handler(path, max_bytes, backups):
+    path = os.path.abspath(path)
+    for handler in logger.handlers:
+        if getattr(handler, "baseFilename", None) == path:
+            return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backups)
+    handler.setFormatter(logging.Formatter("%(asctime)s | %(message)s"))
+    logger.addHandler(handler)
+
+
+def init_query_profiler(app):
+    """Opt-in: log statements slower than SLOW_QUERY_MS on this app's engine.
+
+    Each distinct statement fingerprint gets its plan captured once.
+    Findings go to SLOW_QUERY_LOG (rotating) when set, and are summarised
+    at /api/reports/slow-queries.
+    """
+    threshold_ms = app.config["SLOW_QUERY_MS"]
+    if not threshold_ms:
+        return
+
+    if app.config["SLOW_QUERY_LOG"]:
+        _add_file_handler(
+            app.config["SLOW_QUERY_LOG"],
+            app.config["SLOW_QUERY_LOG_BYTES"],
+            app.config["SLOW_QUERY_LOG_BACKUPS"],
+        )
+
+    _settings["threshold_ms"] = threshold_ms
+    _settings["explain"] = app.config["SLOW_QUERY_EXPLAIN"]
+
+    with app.app_context():
+        profile_engine(db.engine)
+
+
+def profile_engine(engine):
+    """Attach the profiler to one more (sync) engine, e.g. the sync side
+    of the async engine used by asgi.py."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _on_error)
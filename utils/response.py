@@ -1,16 +1,26 @@
 from flask import jsonify
 
-def success_response(message="", data=None, status_code=200):
-    return jsonify({
+def success_body(message="", data=None, **extra):
+    # extra envelope keys, e.g. next_cursor for paginated lists
+    return {
         "success": True,
         "message": message,
-        "data": data
-    }), status_code
+        "data": data,
+        **extra
+    }
 
 
-def error_response(message="", status_code=400):
-    return jsonify({
+def success_response(message="", data=None, status_code=200, **extra):
+    return jsonify(success_body(message, data, **extra)), status_code
+
+
+def error_body(message=""):
+    return {
         "success": False,
         "message": message,
         "data": None
-    }), status_code
+    }
+
+
+def error_response(message="", status_code=400):
+    return jsonify(error_body(message)), status_code
@@ -0,0 +1,316 @@
+from collections import defaultdict
+from datetime import date, datetime
+
+import click
+from flask.cli import AppGroup
+from sqlalchemy import delete, event, func, insert, inspect, select, update
+
+from extensions import db
+from models.invoice import Invoice
+from models.service_request import ServiceRequest
+from models.revenue import RevenueDaily, RevenueMonthly, UNASSIGNED_MECHANIC
+from utils.bulk import upsert_insert
+from utils.jobs import job
+
+GRANULARITIES = {"daily": RevenueDaily, "monthly": RevenueMonthly}
+GROUP_BY_FIELDS = ("payment_status", "service_type", "mechanic_id")
+
+DEFAULT_PAYMENT_STATUS = "Pending"
+
+
+def _month(day):
+    return day.replace(day=1)
+
+
+# ---------------------------
+# DELTAS
+# ---------------------------
+def apply_revenue_deltas(connection, deltas):
+    """Add ``{(day, status, service_type, mechanic_id): (count, amount)}``
+    to the daily and monthly rollups on ``connection``.
+    """
+    daily = defaultdict(lambda: [0, 0.0])
+    monthly = defaultdict(lambda: [0, 0.0])
+    for (day, *dims), (count, amount) in deltas.items():
+        for rollup, period in ((daily, day), (monthly, _month(day))):
+            rollup[(period, *dims)][0] += count
+            rollup[(period, *dims)][1] += amount
+
+    for model, rollup in ((RevenueDaily, daily), (RevenueMonthly, monthly)):
+        rows = [
+            {
+                "period": period,
+                "payment_status": status,
+                "service_type": service_type,
+                "mechanic_id": mechanic_id,
+                "invoice_count": count,
+                "total_amount": amount,
+            }
+            # sorted so concurrent writers lock rollup rows in the same order
+            for (period, status, service_type, mechanic_id), (count, amount)
+            in sorted(rollup.items())
+            if count or amount
+        ]
+        if rows:
+            _upsert(connection, model, rows)
+        if any(row["invoice_count"] < 0 for row in rows):
+            # drop groups whose last invoice moved away
+            connection.execute(
+                delete(model).where(
+                    model.invoice_count == 0,
+                    model.period.in_({row["period"] for row in rows})
+                )
+            )
+
+
+def _upsert(connection, model, rows):
+    insert_ = upsert_insert(connection.dialect.name)
+    if insert_ is not None:
+        stmt = insert_(model)
+        connection.execute(stmt.on_conflict_do_update(
+            index_elements=[c.name for c in model.__table__.primary_key],
+            set_={
+                "invoice_count": model.invoice_count + stmt.excluded.invoice_count,
+                "total_amount": model.total_amount + stmt.excluded.total_amount,
+            }
+        ), rows)
+        return
+
+    for row in rows:
+        result = connection.execute(
+            update(model)
+            .where(
+                model.period == row["period"],
+                model.payment_status == row["payment_status"],
+                model.service_type == row["service_type"],
+                model.mechanic_id == row["mechanic_id"],
+            )
+            .values(
+                invoice_count=model.invoice_count + row["invoice_count"],
+                total_amount=model.total_amount + row["total_amount"],
+            )
+        )
+        if not result.rowcount:
+            connection.execute(insert(model).values(**row))
+
+
+# ---------------------------
+# INVOICE EVENTS
+# ---------------------------
+def _service_dimensions(connection, service_id):
+    row = connection.execute(
+        select(ServiceRequest.service_type, ServiceRequest.assigned_mechanic_id)
+        .where(ServiceRequest.id == service_id)
+    ).first()
+    if row is None:
+        return None
+    return row.service_type, row.assigned_mechanic_id or UNASSIGNED_MECHANIC
+
+
+def _invoice_key(payment_status, created_at, service_type, mechanic_id):
+    day = (created_at or datetime.utcnow()).date()
+    return (day, payment_status or DEFAULT_PAYMENT_STATUS, service_type, mechanic_id)
+
+
+def payment_status_deltas(rows, new_status):
+    """Rollup deltas for invoices moved to ``new_status`` by one bulk
+    UPDATE, which the mapper events below never see.
+
+    ``rows`` carry the invoice's payment_status, created_at, total_amount,
+    service_type and mechanic_id.
+    """
+    deltas = defaultdict(lambda: [0, 0.0])
+    for row in rows:
+        amount = float(row.total_amount or 0)
+        for status, sign in ((row.payment_status, -1), (new_status, 1)):
+            key = _invoice_key(status, row.created_at, row.service_type, row.mechanic_id)
+            deltas[key][0] += sign
+            deltas[key][1] += sign * amount
+    return deltas
+
+
+def _old_value(target, name):
+    history = inspect(target).attrs[name].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, name)
+
+
+def _state(target, old=False):
+    value = _old_value if old else getattr
+    return (
+        value(target, "payment_status"),
+        value(target, "created_at"),
+        value(target, "service_type"),
+        value(target, "mechanic_id"),
+        float(value(target, "total_amount") or 0),
+    )
+
+
+def _record(connection, changes):
+    deltas = defaultdict(lambda: [0, 0.0])
+    for (*fields, amount), sign in changes:
+        key = _invoice_key(*fields)
+        deltas[key][0] += sign
+        deltas[key][1] += sign * amount
+    apply_revenue_deltas(connection, deltas)
+
+
+def _before_insert(mapper, connection, target):
+    # the invoice keeps the service's type / mechanic as of invoicing
+    if target.service_type is None or target.mechanic_id is None:
+        dimensions = _service_dimensions(connection, target.service_id)
+        if dimensions is not None:
+            target.service_type, target.mechanic_id = dimensions
+
+
+def _after_insert(mapper, connection, target):
+    _record(connection, [(_state(target), 1)])
+
+
+def _after_update(mapper, connection, target):
+    old, new = _state(target, old=True), _state(target)
+    if old != new:
+        _record(connection, [(old, -1), (new, 1)])
+
+
+def _before_delete(mapper, connection, target):
+    # before the DELETE, while the row's attributes can still be loaded
+    _record(connection, [(_state(target, old=True), -1)])
+
+
+# ---------------------------
+# REBUILD
+# ---------------------------
+def rebuild_revenue_rollups():
+    """Recompute both rollups from the invoices table.
+
+    Needed after loading invoices outside the ORM. Invoices loaded
+    without a service_type / mechanic_id first get them from their
+    service; the rollups then group by the values stored on each invoice.
+    """
+    service = ServiceRequest.id == Invoice.service_id
+    db.session.execute(
+        update(Invoice)
+        .where(Invoice.service_type.is_(None) | Invoice.mechanic_id.is_(None))
+        .values(
+            service_type=select(ServiceRequest.service_type)
+            .where(service).scalar_subquery(),
+            mechanic_id=select(
+                func.coalesce(ServiceRequest.assigned_mechanic_id, UNASSIGNED_MECHANIC)
+            ).where(service).scalar_subquery(),
+        )
+    )
+
+    day = func.date(Invoice.created_at)
+    status = func.coalesce(Invoice.payment_status, DEFAULT_PAYMENT_STATUS)
+
+    rows = db.session.execute(
+        select(
+            day, status, Invoice.service_type, Invoice.mechanic_id,
+            func.count(), func.sum(Invoice.total_amount)
+        )
+        .group_by(day, status, Invoice.service_type, Invoice.mechanic_id)
+    )
+    deltas = {
+        # SQLite returns date() as text
+        (date.fromisoformat(str(d)), s, t, m): (count, amount)
+        for d, s, t, m, count, amount in rows
+    }
+
+    db.session.execute(delete(RevenueDaily))
+    db.session.execute(delete(RevenueMonthly))
+    apply_revenue_deltas(db.session.connection(), deltas)
+    db.session.commit()
+    return len(deltas)
+
+
+@job("revenue.rebuild_rollups", max_attempts=1)
+def rebuild_rollups_job():
+    return {"groups": rebuild_revenue_rollups()}
+
+
+# ---------------------------
+# REPORT
+# ---------------------------
+def get_report_args(args):
+    """Parse ``granularity`` / ``from`` / ``to`` / ``group_by``.
+
+    Raises ValueError with a client-facing message on bad input.
+    """
+    granularity = args.get("granularity", "monthly")
+    if granularity not in GRANULARITIES:
+        raise ValueError("granularity must be daily or monthly")
+
+    bounds = []
+    for name in ("from", "to"):
+        value = args.get(name)
+        try:
+            bounds.append(date.fromisoformat(value) if value else None)
+        except ValueError:
+            raise ValueError(f"{name} must be YYYY-MM-DD")
+
+    group_by = [g for g in args.get("group_by", "").split(",") if g]
+    if any(g not in GROUP_BY_FIELDS for g in group_by):
+        raise ValueError("group_by must be a list of " + ", ".join(GROUP_BY_FIELDS))
+
+    return granularity, bounds[0], bounds[1], group_by
+
+
+def revenue_report(granularity, start=None, end=None, group_by=()):
+    model = GRANULARITIES[granularity]
+    dimensions = [getattr(model, name) for name in group_by]
+
+    stmt = select(
+        model.period,
+        *dimensions,
+        func.sum(model.invoice_count).label("invoice_count"),
+        func.sum(model.total_amount).label("total_amount"),
+    )
+    if start is not None:
+        stmt = stmt.where(model.period >= (_month(start) if model is RevenueMonthly else start))
+    if end is not None:
+        stmt = stmt.where(model.period <= end)
+
+    stmt = (
+        stmt.group_by(model.period, *dimensions)
+        .having(func.sum(model.invoice_count) != 0)
+        .order_by(model.period, *dimensions)
+    )
+
+    report = []
+    for row in db.session.execute(stmt):
+        item = dict(row._mapping)
+        item["period"] = item["period"].isoformat()
+        item["total_amount"] = round(item["total_amount"], 2)
+        report.append(item)
+    return report
+
+
+# ---------------------------
+# SETUP
+# ---------------------------
+rollups_cli = AppGroup("rollups", help="Revenue rollup maintenance.")
+
+
+@rollups_cli.command("rebuild")
+def rebuild_command():
+    """Recompute revenue_daily / revenue_monthly from invoices."""
+    groups = rebuild_revenue_rollups()
+    click.echo(f"Rebuilt revenue rollups from {groups} daily groups.")
+
+
+def init_revenue_rollups(app):
+    """Keep the revenue rollups in step with ORM invoice writes.
+
+    Deltas are written on the flush connection, inside the same
+    transaction as the invoice change.
+    """
+    app.cli.add_command(rollups_cli)
+
+    if event.contains(Invoice, "after_insert", _after_insert):
+        return
+    event.listen(Invoice, "before_insert", _before_insert)
+    event.listen(Invoice, "after_insert", _after_insert)
+    event.listen(Invoice, "after_update", _after_update)
+    event.listen(Invoice, "before_delete", _before_delete)
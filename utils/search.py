@@ -0,0 +1,185 @@
+import re
+
+from sqlalchemy import (
+    case, column, false, func, inspect, literal_column, or_, select, table, text
+)
+
+from extensions import db
+from models.customer import Customer
+from models.vehicle import Vehicle
+
+MIN_QUERY_LENGTH = 3
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+
+# model -> (searched columns, SQLite FTS5 table kept in sync by triggers)
+SEARCHABLE = {
+    Customer: ((Customer.name, Customer.phone, Customer.email), "customers_fts"),
+    Vehicle: ((Vehicle.vehicle_number, Vehicle.brand, Vehicle.model), "vehicles_fts"),
+}
+
+# per engine: which search backend the schema supports
+_backends = {}
+
+
+# ---------------------------
+# ARGUMENTS
+# ---------------------------
+def get_search_args(args):
+    term = (args.get("q") or "").strip()
+    if len(term) < MIN_QUERY_LENGTH:
+        raise ValueError(f"q must be at least {MIN_QUERY_LENGTH} characters")
+
+    try:
+        limit = int(args.get("limit", DEFAULT_SEARCH_LIMIT))
+    except ValueError:
+        raise ValueError("Invalid limit")
+    if limit < 1:
+        raise ValueError("Invalid limit")
+    return term, min(limit, MAX_SEARCH_LIMIT)
+
+
+def like_pattern(term):
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+# ---------------------------
+# BACKENDS
+# ---------------------------
+def _trigram_search(model, columns, term, limit):
+    # ILIKE and % (similarity) are both served by the gin_trgm_ops indexes
+    pattern = like_pattern(term)
+    score = func.greatest(*(func.similarity(col, term) for col in columns))
+    return (
+        select(model, score.label("score"))
+        .where(or_(
+            *(col.ilike(pattern, escape="\\") for col in columns),
+            *(col.op("%")(term) for col in columns)
+        ))
+        .order_by(score.desc(), model.id)
+        .limit(limit)
+    )
+
+
+def _fts_query(term, columns=()):
+    # every word must match as a prefix: "gj 01" -> "gj"* "01"*
+    words = re.findall(r"\w+", term)
+    query = " ".join(f'"{word}"*' for word in words)
+    if query and columns:
+        # only in these FTS columns: {name phone} : ("gj"* "01"*)
+        query = "{%s} : (%s)" % (" ".join(c.key for c in columns), query)
+    return query
+
+
+def _fts_search(model, fts_table, term, limit):
+    fts = table(fts_table, column("rowid"))
+    rank = func.bm25(literal_column(fts_table))
+    return (
+        select(model, (-rank).label("score"))
+        .join(fts, fts.c.rowid == model.id)
+        .where(literal_column(fts_table).op("MATCH")(_fts_query(term)))
+        .order_by(rank, model.id)
+        .limit(limit)
+    )
+
+
+def _like_search(model, columns, term, limit):
+    # no search index: rank exact > prefix > substring matches
+    pattern = like_pattern(term)
+    prefix = pattern[1:]
+    score = sum(
+        case(
+            (func.lower(col) == term.lower(), 3),
+            (col.ilike(prefix, escape="\\"), 2),
+            (col.ilike(pattern, escape="\\"), 1),
+            else_=0
+        )
+        for col in columns
+    )
+    return (
+        select(model, score.label("score"))
+        .where(or_(*(col.ilike(pattern, escape="\\") for col in columns)))
+        .order_by(score.desc(), model.id)
+        .limit(limit)
+    )
+
+
+def _backend(bind):
+    if bind not in _backends:
+        dialect = bind.dialect.name
+        backend = "like"
+        with bind.connect() as conn:
+            if dialect == "postgresql":
+                has_trgm = conn.scalar(
+                    text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                )
+                backend = "trigram" if has_trgm else "like"
+            elif dialect == "sqlite":
+                has_fts = all(
+                    inspect(conn).has_table(fts_table)
+                    for _, fts_table in SEARCHABLE.values()
+                )
+                backend = "fts" if has_fts else "like"
+        _backends[bind] = backend
+    return _backends[bind]
+
+
+# ---------------------------
+# SEARCH
+# ---------------------------
+def search(model, term, limit=DEFAULT_SEARCH_LIMIT, options=()):
+    """Return ``[(row, score), ...]`` best match first.
+
+    Postgres uses pg_trgm, SQLite the FTS5 tables; databases created
+    without the search migration fall back to ranked LIKE scans.
+    """
+    columns, fts_table = SEARCHABLE[model]
+    backend = _backend(db.session.get_bind())
+
+    if backend == "trigram":
+        stmt = _trigram_search(model, columns, term, limit)
+    elif backend == "fts":
+        if not _fts_query(term):
+            return []
+        stmt = _fts_search(model, fts_table, term, limit)
+    else:
+        stmt = _like_search(model, columns, term, limit)
+
+    if options:
+        stmt = stmt.options(*options)
+    return [(row, float(score)) for row, score in db.session.execute(stmt)]
+
+
+def match_criterion(model, term, columns=None):
+    """WHERE clause for the rows of ``model`` matching ``term`` in
+    ``columns`` (default: every searched column), served by the same
+    index as ``search``.
+
+    For callers that order and page the matches themselves, such as the
+    lookup pickers. With FTS5 words match as prefixes, elsewhere as
+    substrings.
+    """
+    searched, fts_table = SEARCHABLE[model]
+    columns = columns or searched
+
+    if _backend(db.session.get_bind()) == "fts":
+        query = _fts_query(term, columns)
+        if not query:
+            return false()
+        fts = table(fts_table, column("rowid"))
+        return model.id.in_(
+            select(fts.c.rowid).where(literal_column(fts_table).op("MATCH")(query))
+        )
+
+    # pg_trgm serves ILIKE from its GIN indexes; otherwise a plain scan
+    pattern = like_pattern(term)
+    return or_(*(col.ilike(pattern, escape="\\") for col in columns))
+
+
+def search_customers(term, limit=DEFAULT_SEARCH_LIMIT, options=()):
+    return search(Customer, term, limit, options)
+
+
+def search_vehicles(term, limit=DEFAULT_SEARCH_LIMIT, options=()):
+    return search(Vehicle, term, limit, options)
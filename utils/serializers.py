@@ -0,0 +1,94 @@
+from operator import attrgetter
+
+from sqlalchemy import inspect
+from sqlalchemy.types import Date, DateTime
+
+from models.customer import Customer
+from models.vehicle import Vehicle
+from models.mechanic import Mechanic
+from models.service_request import ServiceRequest
+from models.invoice import Invoice
+from models.job import Job
+
+
+class ModelSerializer:
+    """Turns model rows into plain dicts.
+
+    The field list is compiled once: a single ``attrgetter`` fetches every
+    value, and only the Date/DateTime columns (found from the mapper) get
+    converted to ISO 8601 strings.
+    """
+
+    def __init__(self, model, *fields):
+        self.fields = fields
+        self._get = attrgetter(*fields)
+
+        columns = inspect(model).columns
+        self._iso = [
+            index for index, name in enumerate(fields)
+            if isinstance(columns[name].type, (Date, DateTime))
+        ]
+
+    def dump(self, obj):
+        values = self._get(obj)
+        if len(self.fields) == 1:
+            values = (values,)
+        if self._iso:
+            values = list(values)
+            for index in self._iso:
+                if values[index] is not None:
+                    values[index] = values[index].isoformat()
+        return dict(zip(self.fields, values))
+
+    def dump_many(self, objs):
+        dump = self.dump
+        return [dump(obj) for obj in objs]
+
+
+customer_serializer = ModelSerializer(Customer, "id", "name", "phone")
+
+vehicle_serializer = ModelSerializer(
+    Vehicle,
+    "id", "customer_id", "vehicle_number", "vehicle_type", "brand", "model",
+    "created_at"
+)
+vehicle_created_serializer = ModelSerializer(
+    Vehicle, "id", "vehicle_number", "customer_id"
+)
+
+mechanic_serializer = ModelSerializer(
+    Mechanic,
+    "id", "name", "phone", "specialization", "is_available", "created_at"
+)
+mechanic_created_serializer = ModelSerializer(
+    Mechanic, "id", "name", "specialization"
+)
+
+service_serializer = ModelSerializer(
+    ServiceRequest,
+    "id", "vehicle_id", "service_type", "service_date", "problem_description",
+    "status", "assigned_mechanic_id", "created_at"
+)
+service_created_serializer = ModelSerializer(
+    ServiceRequest, "id", "status", "assigned_mechanic_id"
+)
+
+invoice_serializer = ModelSerializer(
+    Invoice,
+    "id", "service_id", "customer_id", "vehicle_id", "total_amount",
+    "payment_status", "created_at"
+)
+
+# compact rows for the form pickers (/api/lookup)
+vehicle_lookup_serializer = ModelSerializer(
+    Vehicle, "id", "vehicle_number", "brand", "model"
+)
+mechanic_lookup_serializer = ModelSerializer(
+    Mechanic, "id", "name", "specialization", "is_available"
+)
+
+job_serializer = ModelSerializer(
+    Job,
+    "id", "name", "status", "attempts", "max_attempts", "last_error",
+    "run_after", "created_at", "started_at", "finished_at"
+)
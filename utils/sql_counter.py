@@ -0,0 +1,36 @@
+import logging
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        g.sql_query_count = g.get("sql_query_count", 0) + 1
+
+
+def get_query_count():
+    return g.get("sql_query_count", 0)
+
+
+def init_sql_counter(app):
+    """Count SQL statements per request.
+
+    In debug mode the total is logged and returned in the
+    ``X-SQL-Query-Count`` header, which makes N+1 regressions obvious.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _count_query):
+        event.listen(Engine, "before_cursor_execute", _count_query)
+
+    @app.after_request
+    def report_query_count(response):
+        if app.debug:
+            count = get_query_count()
+            response.headers["X-SQL-Query-Count"] = str(count)
+            logger.info(
+                "%s %s -> %d SQL queries", request.method, request.path, count
+            )
+        return response
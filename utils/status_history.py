@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from sqlalchemy import event, insert, inspect
+
+from models.service_request import ServiceRequest
+from models.service_status_history import ServiceStatusHistory
+
+
+def record_status_changes(connection, changes):
+    """Append ``(service_id, from_status, to_status)`` rows to the log.
+
+    Used directly by writes that bypass the ORM events, e.g. bulk INSERTs.
+    """
+    now = datetime.utcnow()
+    rows = [
+        {
+            "service_id": service_id,
+            "from_status": from_status,
+            "to_status": to_status,
+            "changed_at": now,
+        }
+        for service_id, from_status, to_status in changes
+    ]
+    if rows:
+        connection.execute(insert(ServiceStatusHistory), rows)
+
+
+# ---------------------------
+# SERVICE EVENTS
+# ---------------------------
+def _after_insert(mapper, connection, target):
+    record_status_changes(connection, [(target.id, None, target.status)])
+
+
+def _after_update(mapper, connection, target):
+    history = inspect(target).attrs.status.history
+    if not history.has_changes():
+        return
+    old = history.deleted[0] if history.deleted else None
+    if old != target.status:
+        record_status_changes(connection, [(target.id, old, target.status)])
+
+
+def init_status_history(app):
+    """Log every ServiceRequest status change in the flushing transaction."""
+    if event.contains(ServiceRequest, "after_insert", _after_insert):
+        return
+    event.listen(ServiceRequest, "after_insert", _after_insert)
+    event.listen(ServiceRequest, "after_update", _after_update)
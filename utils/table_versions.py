@@ -0,0 +1,195 @@
+import threading
+from collections import Counter
+
+from sqlalchemy import delete, event, func, insert, inspect, select
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.orm import Mapper, Session, object_session
+
+from extensions import db
+from models.table_change import TableChange
+
+# rows removed by ON DELETE CASCADE never reach the ORM events
+DELETE_CASCADES = {
+    "customers": ("vehicles",),
+    "vehicles": ("service_requests",),
+}
+
+# fold a table's change rows into one after this many commits (per process)
+COMPACT_EVERY = 500
+
+_pending_compaction = Counter()
+_compaction_lock = threading.Lock()
+
+
+# ---------------------------
+# READ
+# ---------------------------
+def versions_statement(tables):
+    return (
+        select(TableChange.table_name, func.sum(TableChange.weight))
+        .where(TableChange.table_name.in_(tables))
+        .group_by(TableChange.table_name)
+    )
+
+
+def collect_versions(tables, rows):
+    # tables that were never written are reported as version 0
+    versions = dict.fromkeys(tables, 0)
+    versions.update((name, int(version)) for name, version in rows)
+    return versions
+
+
+def get_versions(*tables):
+    """Return ``{table: version}`` for the given tables."""
+    return collect_versions(tables, db.session.execute(versions_statement(tables)))
+
+
+# ---------------------------
+# RECORD / COMPACT
+# ---------------------------
+def record_changes(session, tables):
+    # a plain INSERT: concurrent writers of the same table never conflict
+    session.execute(
+        insert(TableChange), [{"table_name": t, "weight": 1} for t in sorted(tables)]
+    )
+
+
+def compact_table_changes(connection, table):
+    """Fold ``table``'s change rows into one row with the same total.
+
+    The sum is taken from the rows this statement actually deleted, so
+    two compactions racing over the same rows cannot count them twice.
+    """
+    rows = delete(TableChange).where(TableChange.table_name == table)
+    if connection.dialect.delete_returning:
+        weights = connection.scalars(rows.returning(TableChange.weight)).all()
+    else:
+        # no DELETE ... RETURNING: read then delete exactly those rows
+        found = connection.execute(
+            select(TableChange.id, TableChange.weight).where(TableChange.table_name == table)
+        ).all()
+        connection.execute(delete(TableChange).where(TableChange.id.in_([r.id for r in found])))
+        weights = [r.weight for r in found]
+
+    if weights:
+        connection.execute(insert(TableChange).values(table_name=table, weight=sum(weights)))
+
+
+def _due_for_compaction(tables):
+    with _compaction_lock:
+        _pending_compaction.update(tables)
+        due = [t for t in tables if _pending_compaction[t] >= COMPACT_EVERY]
+        for table in due:
+            del _pending_compaction[table]
+        return due
+
+
+# ---------------------------
+# WRITE TRACKING EVENTS
+# ---------------------------
+def _touch(session, *tables):
+    session.info.setdefault("touched_tables", set()).update(tables)
+
+
+def _has_column_changes(mapper, target):
+    # after_update also fires for objects that were dirty without a net change
+    state = inspect(target)
+    return any(state.attrs[attr.key].history.has_changes() for attr in mapper.column_attrs)
+
+
+def _on_insert(mapper, connection, target):
+    session = object_session(target)
+    if session is not None and mapper.class_ is not TableChange:
+        _touch(session, mapper.local_table.name)
+
+
+def _on_update(mapper, connection, target):
+    session = object_session(target)
+    if (
+        session is not None
+        and mapper.class_ is not TableChange
+        and _has_column_changes(mapper, target)
+    ):
+        _touch(session, mapper.local_table.name)
+
+
+def _on_delete(mapper, connection, target):
+    session = object_session(target)
+    if session is not None and mapper.class_ is not TableChange:
+        table = mapper.local_table.name
+        _touch(session, table, *DELETE_CASCADES.get(table, ()))
+
+
+def _on_bulk_write(orm_execute_state):
+    # insert(Model) / update(Model) statements bypass the mapper events
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ is TableChange:
+        return
+    table = mapper.local_table.name
+    tables = (table, *DELETE_CASCADES.get(table, ())) if orm_execute_state.is_delete else (table,)
+
+    if orm_execute_state.is_insert:
+        _touch(orm_execute_state.session, *tables)
+        return
+
+    # UPDATE / DELETE matching no rows changed nothing
+    result = orm_execute_state.invoke_statement()
+    if isinstance(result, CursorResult) and not result.returns_rows:
+        if result.rowcount != 0:
+            _touch(orm_execute_state.session, *tables)
+        return result
+    # RETURNING: buffer the rows to see whether any matched
+    frozen = result.freeze()
+    if frozen.data:
+        _touch(orm_execute_state.session, *tables)
+    return frozen()
+
+
+def _before_commit(session):
+    # pending objects are flushed after before_commit runs, so flush here
+    # to collect every table the transaction wrote
+    session.flush()
+    tables = session.info.pop("touched_tables", None)
+    if tables:
+        record_changes(session, tables)
+        session.info["compact_tables"] = _due_for_compaction(tables)
+
+
+def _after_commit(session):
+    tables = session.info.pop("compact_tables", None)
+    if not tables:
+        return
+    # its own short transaction, outside the request's
+    with session.get_bind().begin() as connection:
+        for table in tables:
+            compact_table_changes(connection, table)
+
+
+def _after_rollback(session):
+    session.info.pop("touched_tables", None)
+    session.info.pop("compact_tables", None)
+
+
+def init_table_versions(app):
+    """Record a ``table_changes`` row for every table a transaction writes.
+
+    The row is inserted inside the committing transaction, so a version
+    only becomes visible together with the data it describes.
+    """
+    if event.contains(Session, "before_commit", _before_commit):
+        return
+
+    event.listen(Mapper, "after_insert", _on_insert)
+    event.listen(Mapper, "after_update", _on_update)
+    event.listen(Mapper, "after_delete", _on_delete)
+
+    event.listen(Session, "do_orm_execute", _on_bulk_write)
+    event.listen(Session, "before_commit", _before_commit)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
@@ -0,0 +1,191 @@
+from datetime import date, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import select
+
+from extensions import db
+from models.service_request import ServiceRequest
+from models.service_status_history import ServiceStatusHistory
+from models.revenue import UNASSIGNED_MECHANIC
+
+STATUS_CODES = {"Pending": 0, "In Progress": 1, "Completed": 2}
+GROUP_BY_FIELDS = ("service_type", "mechanic_id")
+PERCENTILES = (50, 90, 95)
+
+DEFAULT_WINDOW_DAYS = 90
+FETCH_BATCH_SIZE = 10000
+
+
+# ---------------------------
+# ARGUMENTS
+# ---------------------------
+def get_turnaround_args(args):
+    """Parse ``from`` / ``to`` / ``group_by``.
+
+    Raises ValueError with a client-facing message on bad input.
+    """
+    bounds = []
+    for name in ("from", "to"):
+        value = args.get(name)
+        try:
+            bounds.append(date.fromisoformat(value) if value else None)
+        except ValueError:
+            raise ValueError(f"{name} must be YYYY-MM-DD")
+
+    end = bounds[1] or datetime.utcnow().date()
+    start = bounds[0] or end - timedelta(days=DEFAULT_WINDOW_DAYS)
+
+    group_by = [g for g in args.get("group_by", ",".join(GROUP_BY_FIELDS)).split(",") if g]
+    if not group_by or any(g not in GROUP_BY_FIELDS for g in group_by):
+        raise ValueError("group_by must be a list of " + ", ".join(GROUP_BY_FIELDS))
+
+    return start, end, group_by
+
+
+# ---------------------------
+# LOAD
+# ---------------------------
+def _load_transitions(start, end):
+    """Status timeline of services created in [start, end] as column arrays.
+
+    Rows are streamed in batches and converted per batch, sorted by
+    service and time.
+    """
+    stmt = (
+        select(
+            ServiceStatusHistory.service_id,
+            ServiceStatusHistory.to_status,
+            ServiceStatusHistory.changed_at,
+            ServiceRequest.service_type,
+            ServiceRequest.assigned_mechanic_id,
+        )
+        .join(ServiceRequest, ServiceRequest.id == ServiceStatusHistory.service_id)
+        .where(
+            ServiceRequest.created_at >= datetime.combine(start, datetime.min.time()),
+            ServiceRequest.created_at < datetime.combine(end + timedelta(days=1), datetime.min.time()),
+        )
+        .order_by(ServiceStatusHistory.service_id, ServiceStatusHistory.changed_at)
+    )
+
+    # Core execution: plain tuples, no ORM row processing
+    result = db.session.connection().execute(
+        stmt.execution_options(stream_results=True)
+    )
+    chunks = {"ids": [], "status": [], "ts": [], "type": [], "mechanic": []}
+    for batch in result.partitions(FETCH_BATCH_SIZE):
+        ids, status, changed, types, mechanics = zip(*batch)
+        chunks["ids"].append(np.array(ids, dtype=np.int64))
+        chunks["status"].append(np.array([STATUS_CODES[s] for s in status], dtype=np.int8))
+        chunks["ts"].append(
+            np.array(changed, dtype="datetime64[us]").astype(np.int64) / 3.6e9
+        )
+        chunks["type"].append(np.array(types, dtype=object))
+        chunks["mechanic"].append(
+            np.array([m or UNASSIGNED_MECHANIC for m in mechanics], dtype=np.int64)
+        )
+
+    if not chunks["ids"]:
+        return None
+    return {name: np.concatenate(parts) for name, parts in chunks.items()}
+
+
+# ---------------------------
+# ANALYTICS
+# ---------------------------
+def _per_service(cols):
+    """Hours per service: total turnaround and time spent in each status."""
+    ids, status, ts = cols["ids"], cols["status"], cols["ts"]
+
+    first = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    service = np.cumsum(np.r_[False, ids[1:] != ids[:-1]])
+    n = len(first)
+
+    # a row's status lasts until the next row of the same service
+    closed = service[1:] == service[:-1]
+    spans = np.diff(ts)[closed]
+    span_service = service[:-1][closed]
+    span_status = status[:-1][closed]
+
+    pending = np.bincount(
+        span_service[span_status == 0], spans[span_status == 0], minlength=n
+    )
+    in_progress = np.bincount(
+        span_service[span_status == 1], spans[span_status == 1], minlength=n
+    )
+
+    done_at = np.full(n, np.inf)
+    done = status == STATUS_CODES["Completed"]
+    np.minimum.at(done_at, service[done], ts[done])
+    turnaround = done_at - ts[first]
+
+    return {
+        "first": first,
+        "completed": np.isfinite(turnaround),
+        "turnaround": turnaround,
+        "pending": pending,
+        "in_progress": in_progress,
+    }
+
+
+def _percentiles(columns):
+    """Percentiles of each column of a (services x metrics) array."""
+    if not len(columns):
+        return [None] * columns.shape[1]
+    cuts = np.percentile(columns, PERCENTILES, axis=0)
+    return [
+        {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, metric)}
+        for metric in cuts.T
+    ]
+
+
+def turnaround_report(start, end, group_by=GROUP_BY_FIELDS):
+    """Turnaround percentiles (hours) per service_type and/or mechanic.
+
+    Only services created in the window count; times in Pending and In
+    Progress are reported for completed services.
+    """
+    cols = _load_transitions(start, end)
+    if cols is None:
+        return []
+
+    per_service = _per_service(cols)
+    first = per_service["first"]
+    keys = {
+        "service_type": cols["type"][first],
+        "mechanic_id": cols["mechanic"][first],
+    }
+
+    # integer code per group, one column per grouping field
+    codes = []
+    labels = {}
+    for name in group_by:
+        labels[name], code = np.unique(keys[name].astype(str), return_inverse=True)
+        codes.append(code)
+    groups, group_of = np.unique(np.column_stack(codes), axis=0, return_inverse=True)
+    group_of = group_of.ravel()
+
+    metrics = np.column_stack([
+        per_service["turnaround"], per_service["pending"], per_service["in_progress"]
+    ])
+    order = np.argsort(group_of, kind="stable")
+    bounds = np.searchsorted(group_of[order], np.arange(len(groups) + 1))
+
+    report = []
+    for g, group in enumerate(groups):
+        members = order[bounds[g]:bounds[g + 1]]
+        done = members[per_service["completed"][members]]
+
+        item = {}
+        for name, code in zip(group_by, group):
+            label = labels[name][code]
+            item[name] = int(label) if name == "mechanic_id" else label
+        turnaround, pending, in_progress = _percentiles(metrics[done])
+        item.update(
+            services=int(len(members)),
+            completed=int(len(done)),
+            turnaround_hours=turnaround,
+            pending_hours=pending,
+            in_progress_hours=in_progress,
+        )
+        report.append(item)
+    return report